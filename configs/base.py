@@ -5,8 +5,9 @@ web_fetcher_tool_config = dict(
 web_searcher_tool_config = dict(
     type="web_searcher_tool",
     engine="Firecrawl",
-    retry_delay = 10,
+    retry_delay = 10, # cap (seconds) on the jittered exponential backoff
     max_retries = 3,
+    retry_on_status = [429, 500, 502, 503, 504],
     lang = "en",
     country = "us",
     num_results = 5,
@@ -65,6 +66,9 @@ vector_db_config = dict(
     # Embedding model
     embeddings_model="text-embedding-3-small",
     
+    # Stored vector precision: "fp32", "fp16" or "int8"
+    storage_dtype="fp16",
+    
     # Search settings
     default_search_results=5,
     max_search_results=20,
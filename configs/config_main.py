@@ -2,82 +2,75 @@ _base_ = './base.py'
 
 # General Config
 tag = "main"
-concurrency = 1
+concurrency = 8  # max in-flight LLM requests across all agents
 workdir = "workdir"
 log_path = "log.txt"
 save_path = "dra.jsonl"
 use_local_proxy = False
+llm_cache_enabled = False  # replay identical LLM requests from <exp_path>/llm-cache.sqlite (useful while developing)
 
 use_hierarchical_agent = True
 
 
-vector_agent_config = dict(
-    type="vector_agent",
-    name="vector_agent",
-    model_id="gpt-4.1-mini",
-    description="Intelligent vector search agent for document retrieval and analysis.",
-    max_steps=10,
-    template_path="src/agent/vector_agent/prompts/vector_agent.yaml",
-    provide_run_summary=True,
+def _agent(name, description, tools, max_steps=3, model_id="gpt-4.1-mini", **overrides):
+    # Agent configs share type == name, the prompt layout and most defaults.
+    # Functions are dropped by mmengine when the file is parsed, so only the dicts remain.
+    return dict(
+        type=name,
+        name=name,
+        model_id=model_id,
+        description=description,
+        max_steps=max_steps,
+        template_path=f"src/agent/{name}/prompts/{name}.yaml",
+        provide_run_summary=True,
+        tools=list(tools),
+        **overrides,
+    )
+
+
+vector_agent_config = _agent(
+    "vector_agent",
+    "Intelligent vector search agent for document retrieval and analysis.",
     tools=["vector_search_tool"],
+    max_steps=10,
 )
 
-deep_researcher_agent_config = dict(
-    type="deep_researcher_agent",
-    name="deep_researcher_agent",
-    model_id="gpt-4.1-mini",
-    description="An advanced research agent that conducts comprehensive web searches and information gathering.",
-    max_steps=3,
-    template_path="src/agent/deep_researcher_agent/prompts/deep_researcher_agent.yaml",
-    provide_run_summary=True,
+deep_researcher_agent_config = _agent(
+    "deep_researcher_agent",
+    "An advanced research agent that conducts comprehensive web searches and information gathering.",
     tools=["deep_researcher_tool"],
 )
 
-deep_analyzer_agent_config = dict(
-    type="deep_analyzer_agent",
-    name="deep_analyzer_agent",
-    model_id="gpt-4.1-mini",
-    description="A specialized analysis agent that performs methodical, step-by-step problem analysis.",
-    max_steps=3,
-    template_path="src/agent/deep_analyzer_agent/prompts/deep_analyzer_agent.yaml",
-    provide_run_summary=True,
+deep_analyzer_agent_config = _agent(
+    "deep_analyzer_agent",
+    "A specialized analysis agent that performs methodical, step-by-step problem analysis.",
     tools=["deep_analyzer_tool"],
 )
 
-browser_use_agent_config = dict(
-    type="browser_use_agent",
-    name="browser_use_agent",
-    model_id="gpt-4.1-mini",
-    description="An intelligent browser agent that navigates web pages and performs interactive web tasks.",
-    max_steps=5,
-    template_path="src/agent/browser_use_agent/prompts/browser_use_agent.yaml",
-    provide_run_summary=True,
+browser_use_agent_config = _agent(
+    "browser_use_agent",
+    "An intelligent browser agent that navigates web pages and performs interactive web tasks.",
     tools=["auto_browser_use_tool"],
+    max_steps=5,
 )
 
-planning_agent_config = dict(
-    type="planning_agent",
-    name="planning_agent",
-    model_id="gpt-4.1-mini",
-    description = "A planning agent that can plan the steps to complete the task.",
-    max_steps = 20,
-    template_path = "src/agent/planning_agent/prompts/planning_agent.yaml",
-    provide_run_summary = True,
-    tools = ["planning_tool"],
-    managed_agents = ["deep_analyzer_agent", "browser_use_agent", "deep_researcher_agent", "vector_agent"]
+planning_agent_config = _agent(
+    "planning_agent",
+    "A planning agent that can plan the steps to complete the task.",
+    tools=["planning_tool"],
+    max_steps=20,
+    max_tool_threads=4,  # independent team member calls in one step run concurrently
+    managed_agents=["deep_analyzer_agent", "browser_use_agent", "deep_researcher_agent", "vector_agent"],
 )
 
 # Scoping Agent Config (first-step agent for clarification and planning)
-scoping_agent_config = dict(
-    type="scoping_agent",
-    name="scoping_agent",
-    model_id="gpt-4.1-mini",
-    description="An interactive scoping agent that clarifies research requests and produces a research plan for confirmation.",
-    max_steps=10,
-    template_path="src/agent/scoping_agent/prompts/scoping_agent.yaml",
-    provide_run_summary=True,
+scoping_agent_config = _agent(
+    "scoping_agent",
+    "An interactive scoping agent that clarifies research requests and produces a research plan for confirmation.",
     tools=["interactive_planning_tool", "user_clarification_tool"],
-    managed_agents=["planning_agent", "deep_analyzer_agent", "browser_use_agent", "deep_researcher_agent", "vector_agent"] 
+    max_steps=10,
+    max_tool_threads=4,
+    managed_agents=["planning_agent", "deep_analyzer_agent", "browser_use_agent", "deep_researcher_agent", "vector_agent"],
 )
 
 # The primary agent to run in this configuration.
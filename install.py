@@ -12,43 +12,137 @@ Usage:
     python install.py
 """
 
-import subprocess
 import sys
 import os
-import shutil
+import hashlib
+import platform
+import importlib.metadata
+import importlib.util
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
-def run_command(command: List[str]) -> Tuple[bool, str]:
-    """Run a command and return success status and output"""
+INSTALL_SNAPSHOT_PATH = Path("workdir/.install-snapshot.sha256")
+PIP_CACHE_DIR = Path(".pip-cache")
+
+RUN_COMMAND_TAIL_LINES = 200
+
+def run_command(command: List[str], env: Optional[Dict[str, str]] = None) -> Tuple[bool, str]:
+    """Run a command, streaming its output, and return success status and the output tail"""
+    import subprocess
+    from collections import deque
+
+    tail = deque(maxlen=RUN_COMMAND_TAIL_LINES)
     try:
-        result = subprocess.run(
+        with subprocess.Popen(
             command,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
             text=True,
-            check=True
-        )
-        return True, result.stdout
-    except subprocess.CalledProcessError as e:
-        return False, f"Error: {e.stderr}"
+            env=env
+        ) as process:
+            for line in process.stdout:
+                print(f"      {line}", end="")
+                tail.append(line)
+            return_code = process.wait()
+        
+        output = "".join(tail)
+        if return_code != 0:
+            return False, f"Error: {output}"
+        return True, output
     except Exception as e:
         return False, f"Unexpected error: {str(e)}"
 
-def check_dependency(module_name: str) -> bool:
-    """Check if a module is importable"""
+class _TailWriter:
+    """File-like sink that echoes lines indented and keeps the last RUN_COMMAND_TAIL_LINES"""
+
+    def __init__(self, tail):
+        self.tail = tail
+        self.pending = ""
+
+    def write(self, text: str) -> int:
+        lines = (self.pending + text).split("\n")
+        self.pending = lines.pop()
+        for line in lines:
+            print(f"      {line}", file=sys.__stdout__)
+            self.tail.append(line + "\n")
+        return len(text)
+
+    def flush(self) -> None:
+        if self.pending:
+            self.write("\n")
+
+def run_pip(args: List[str]) -> Tuple[bool, str]:
+    """Run pip in this interpreter when possible, falling back to a `python -m pip` subprocess"""
     try:
-        __import__(module_name)
-        return True
+        from pip._internal.cli.main import main as pip_main
     except ImportError:
+        return run_command([sys.executable, "-m", "pip", *args])
+
+    import contextlib
+    from collections import deque
+
+    tail = deque(maxlen=RUN_COMMAND_TAIL_LINES)
+    writer = _TailWriter(tail)
+    try:
+        with contextlib.redirect_stdout(writer), contextlib.redirect_stderr(writer):
+            try:
+                return_code = pip_main(list(args))
+            except SystemExit as e:
+                # Some pip code paths (e.g. option errors) exit instead of returning
+                return_code = e.code if isinstance(e.code, int) else int(e.code is not None)
+        writer.flush()
+    except Exception as e:
+        return False, f"Unexpected error: {str(e)}"
+
+    output = "".join(tail)
+    if return_code != 0:
+        return False, f"Error: {output}"
+    return True, output
+
+@lru_cache(maxsize=None)
+def check_dependency(module_name: str) -> bool:
+    """Check if a module is importable (resolves the spec without executing the module)"""
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
         return False
 
+def get_installed_distributions() -> Set[str]:
+    """Get the lower-cased names of all installed distributions in one metadata pass"""
+    return {
+        dist.metadata["Name"].lower()
+        for dist in importlib.metadata.distributions()
+        if dist.metadata["Name"]
+    }
+
+def compute_install_snapshot(requirements_file: str = "requirements.txt") -> str:
+    """Hash the requirements file together with the interpreter and platform"""
+    digest = hashlib.sha256()
+    digest.update(Path(requirements_file).read_bytes())
+    digest.update(sys.version.encode())
+    digest.update(platform.platform().encode())
+    return digest.hexdigest()
+
 def install_core_dependencies():
     """Install core dependencies from requirements.txt"""
     print("📦 Installing core dependencies...")
     
-    success, output = run_command([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
+    snapshot = compute_install_snapshot()
+    if INSTALL_SNAPSHOT_PATH.exists() and INSTALL_SNAPSHOT_PATH.read_text().strip() == snapshot:
+        print("   ✅ Core dependencies are up-to-date")
+        return True
+    
+    success, output = run_pip(
+        ["install", "--prefer-binary", "--cache-dir", str(PIP_CACHE_DIR), "-r", "requirements.txt"]
+    )
     
     if success:
+        # Packages installed in-process are invisible to find_spec until the finders refresh
+        importlib.invalidate_caches()
+        INSTALL_SNAPSHOT_PATH.parent.mkdir(parents=True, exist_ok=True)
+        INSTALL_SNAPSHOT_PATH.write_text(snapshot)
         print("   ✅ Core dependencies installed successfully")
         return True
     else:
@@ -68,16 +162,18 @@ def install_vector_dependencies():
 
 def setup_environment():
     """Set up the environment file"""
+    import shutil
+
     print("⚙️ Setting up environment configuration...")
     
-    env_template = Path(".env.template")
-    env_file = Path(".env")
+    env_template = ".env.template"
+    env_file = ".env"
     
-    if not env_template.exists():
+    if not os.path.exists(env_template):
         print("   ❌ .env.template file not found")
         return False
     
-    if env_file.exists():
+    if os.path.exists(env_file):
         print("   ℹ️ .env file already exists, skipping creation")
     else:
         shutil.copy(env_template, env_file)
@@ -93,14 +189,16 @@ def validate_installation():
     critical_modules = [
         "openai",
         "langchain",
-        "chromadb",
+        "faiss",
         "rich",
         "numpy"
     ]
     
+    installed = get_installed_distributions()
+
     all_good = True
     for module in critical_modules:
-        if check_dependency(module):
+        if module in installed or check_dependency(module):
             print(f"   ✅ {module} is available")
         else:
             print(f"   ❌ {module} is missing")
@@ -112,15 +210,11 @@ def create_directories():
     """Create necessary directories"""
     print("📁 Creating necessary directories...")
     
-    directories = [
-        "vector_db",
-        "workdir",
-        "logs"
-    ]
+    directories = ("vector_db", "workdir", "logs")
     
     for directory in directories:
-        Path(directory).mkdir(exist_ok=True)
-        print(f"   ✅ Created {directory}/ directory")
+        os.makedirs(directory, exist_ok=True)
+    print(f"   ✅ Created {', '.join(d + '/' for d in directories)} directories")
 
 def main():
     """Main installation process"""
@@ -1,37 +1,119 @@
 import argparse
 import os
+import stat
 import sys
 import asyncio
 import logging
 import warnings
+import importlib.util
+from functools import lru_cache, partial
 from pathlib import Path
 
-from mmengine import DictAction
-from rich.panel import Panel
+# The agent/model stack (mmengine, rich, src.*) is imported inside the functions that use it,
+# so `--help` and argument errors return without loading it
 
-# Import for GUI directory picker
-try:
-    import tkinter as tk
-    from tkinter import filedialog
-    GUI_AVAILABLE = True
-except ImportError:
-    GUI_AVAILABLE = False
+# GUI directory picker is available when tkinter and its C extension are installed
+GUI_AVAILABLE = importlib.util.find_spec("tkinter") is not None and importlib.util.find_spec("_tkinter") is not None
 
 root = str(Path(__file__).resolve().parents[0])
 sys.path.append(root)
 
 
-from src.logger import logger
-from src.config import config
-from src.models import model_manager
-from src.agent import create_agent
+from src.ui._ansi import Colors
 
-# Import for source selection
-from src.ui.source_selector import get_user_research_sources, show_current_configuration
-from src.research_source_manager import get_research_source_manager
-from src.utils.debug_config import set_debug_mode, is_debug_mode
+# Static menu text is rendered once at import instead of on every menu redraw
+TITLE_ART = f"""
+{Colors.CYAN}{Colors.BOLD}
+██████╗ ███████╗███████╗██████╗     ██████╗ ███████╗███████╗███████╗ █████╗ ██████╗  ██████╗██╗  ██╗███████╗██████╗ 
+██╔══██╗██╔════╝██╔════╝██╔══██╗    ██╔══██╗██╔════╝██╔════╝██╔════╝██╔══██╗██╔══██╗██╔════╝██║  ██║██╔════╝██╔══██╗
+██║  ██║█████╗  █████╗  ██████╔╝    ██████╔╝█████╗  ███████╗█████╗  ███████║██████╔╝██║     ███████║█████╗  ██████╔╝
+██║  ██║██╔══╝  ██╔══╝  ██╔═══╝     ██╔══██╗██╔══╝  ╚════██║██╔══╝  ██╔══██║██╔══██╗██║     ██╔══██║██╔══╝  ██╔══██╗
+██████╔╝███████╗███████╗██║         ██║  ██║███████╗███████║███████╗██║  ██║██║  ██║╚██████╗██║  ██║███████╗██║  ██║
+╚═════╝ ╚══════╝╚══════╝╚═╝         ╚═╝  ╚═╝╚══════╝╚══════╝╚══════╝╚═╝  ╚═╝╚═╝  ╚═╝ ╚═════╝╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝
 
-def parse_args():
+    ═══════════════════════════════════════════════════════════════════════════════════════════════════════════
+                             A D V A N C E D   M U L T I   A G E N T   R E S E A R C H   S Y S T E M
+    ═══════════════════════════════════════════════════════════════════════════════════════════════════════════
+{Colors.ENDC}"""
+
+WELCOME_MSG = f"""
+{Colors.CYAN}{Colors.BOLD}
+╔══════════════════════════════════════════════════════════════════════════════╗
+║  Welcome! I'm a sophisticated multi-agent AI research system that performs  ║
+║  comprehensive deep research across multiple data sources. I can help you   ║
+║  with:                                                                       ║
+║  • Searching and analyzing research papers                                   ║
+║  • Deep web research and analysis                                           ║
+║  • Summarizing complex topics                                               ║
+║  • Planning and executing research tasks                                    ║
+║  • Connecting to MCP servers for enhanced capabilities                      ║
+║  • Integrating with vector databases for semantic search                    ║
+║                                                                              ║
+║  ⏱️  Research Time: Each search request typically takes 10-30 minutes       ║
+║     as I perform thorough analysis across multiple sources and agents.      ║
+╚══════════════════════════════════════════════════════════════════════════════╝
+{Colors.ENDC}"""
+
+STARTUP_OPTIONS = f"""
+{Colors.YELLOW}{Colors.BOLD}🚀 STARTUP OPTIONS:{Colors.ENDC}
+
+{Colors.GREEN}{Colors.BOLD}1. 📊 Start Research{Colors.ENDC}
+   Begin research immediately with available tools and knowledge base
+
+{Colors.BLUE}{Colors.BOLD}2. 📁 Index Documents{Colors.ENDC}
+   Index documents from a directory into vector database for enhanced research
+
+{Colors.RED}{Colors.BOLD}3. 🚪 Exit{Colors.ENDC}
+   Exit the application
+"""
+
+RESEARCH_EXAMPLES = f"""
+{Colors.YELLOW}{Colors.BOLD}💡 EXAMPLE RESEARCH TASKS:{Colors.ENDC}
+
+{Colors.CYAN}• "Research the latest developments in quantum computing and summarize key findings"
+• "Analyze the impact of AI on healthcare industry in 2024"
+• "Investigate recent breakthroughs in renewable energy technology"
+• "Research the current state of electric vehicle market and future trends"
+• "Analyze the relationship between climate change and economic policy"
+• "Research emerging trends in cybersecurity and digital threats"{Colors.ENDC}
+"""
+
+STARTUP_AGENTS = (
+    ("🎯 Planning Agent", "Main", "gpt-4.1-mini", "Orchestrates research workflow"),
+    ("🔍 Deep Researcher", "Specialized", "gpt-4.1-mini", "Comprehensive web research"),
+    ("🧠 Deep Analyzer", "Specialized", "gpt-4.1-mini", "Methodical topic analysis"),
+    ("🌐 Browser Agent", "Specialized", "gpt-4.1-mini", "Real-time web interaction"),
+    ("📊 Vector Agent", "Specialized", "gpt-4.1-mini", "Vector database queries"),
+    ("🎯 Scoping Agent", "Specialized", "gpt-4.1-mini", "Interactive task scoping"),
+    ("🛠️  General Agent", "Utility", "gpt-4.1-mini", "Multi-purpose execution"),
+)
+
+
+def render_input_box(width: int, header_text: str, prompt_text: str) -> str:
+    """Render the boxed prompt shown above the interactive inputs"""
+    # Pad to the inner width; the header's reset code is excluded from the visible width so the
+    # underline stops at the text
+    inner_width = width - 1
+    header = (header_text + Colors.ENDC).ljust(inner_width + len(Colors.ENDC))
+    prompt = prompt_text.ljust(inner_width)
+    return "\n".join([
+        f"{Colors.MAGENTA}{Colors.BOLD}╔{'═' * width}╗{Colors.ENDC}",
+        f"{Colors.MAGENTA}{Colors.BOLD}║ {Colors.YELLOW}{Colors.BOLD}{Colors.UNDERLINE}{header}║{Colors.ENDC}",
+        f"{Colors.MAGENTA}{Colors.BOLD}║ {Colors.CYAN}{prompt}║{Colors.ENDC}",
+        f"{Colors.MAGENTA}{Colors.BOLD}╚{'═' * width}╝{Colors.ENDC}",
+    ])
+
+CHOICE_INPUT_BOX = render_input_box(80, "🎯 CHOOSE YOUR STARTUP OPTION", "Enter your choice (1-3):")
+TASK_INPUT_BOX = render_input_box(100, "🎯 WHAT WOULD YOU LIKE ME TO RESEARCH TODAY?", "Enter your research task (or 'quit' to exit):")
+INPUT_CURSOR = f" {Colors.GREEN}{Colors.BOLD}└──> {Colors.ENDC}"
+
+
+def write_lines(*lines: str) -> None:
+    """Write several lines to the terminal with one write and one flush"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+def build_parser(dict_action=None):
     parser = argparse.ArgumentParser(description='main')
     parser.add_argument("--config", default=os.path.join(root, "configs", "config_main.py"), help="config file path")
     parser.add_argument("--debug", action="store_true", help="Enable debug mode for verbose logging")
@@ -39,22 +121,69 @@ def parse_args():
     parser.add_argument(
         '--cfg-options',
         nargs='+',
-        action=DictAction,
+        action=dict_action or 'store',
         help='override some settings in the used config, the key-value pair '
         'in xxx=yyy format will be merged into config file. If the value to '
         'be overwritten is a list, it should be like key="[a,b]" or key=a,b '
         'It also allows nested list/tuple values, e.g. key="[(a,b),(c,d)]" '
         'Note that the quotation marks are necessary and that no white space '
         'is allowed.')
-    args = parser.parse_args()
+    return parser
+
+
+def fast_help():
+    """Answer -h/--help from a stdlib-only parser, before mmengine is imported"""
+    if any(arg in ("-h", "--help") for arg in sys.argv[1:]):
+        build_parser().print_help()
+        sys.exit(0)
+
+
+@lru_cache(maxsize=1)
+def parse_args():
+    from mmengine import DictAction
+
+    args = build_parser(DictAction).parse_args()
     return args
 
 
+async def run_with_ticker(coro, label: str, interval: float = 1.0):
+    """Await a coroutine while rewriting a single elapsed-time status line"""
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(interval)
+            ticks += 1
+            sys.stdout.write(f"\r{Colors.CYAN}🔄 {label}... {ticks * interval:.0f}s{Colors.ENDC}")
+            sys.stdout.flush()
+
+    task = asyncio.create_task(coro)
+    ticker = asyncio.create_task(tick())
+    try:
+        return await task
+    finally:
+        ticker.cancel()
+        # Cancelling the wait (e.g. Ctrl-C) must not leave the work running in the background
+        task.cancel()
+        if ticks:
+            sys.stdout.write("\n")
+            sys.stdout.flush()
+
+
+async def ainput(prompt: str = "") -> str:
+    """Read a line from stdin on a worker thread so the event loop keeps running"""
+    return await asyncio.to_thread(input, prompt)
+
+
 def select_directory_gui():
     """Open a GUI directory picker dialog"""
     if not GUI_AVAILABLE:
         return None
     
+    import tkinter as tk
+    from tkinter import filedialog
+    
     # Create a hidden root window
     root = tk.Tk()
     root.withdraw()  # Hide the main window
@@ -73,162 +202,76 @@ def select_directory_gui():
     return directory if directory else None
 
 
-def get_startup_choice():
-    """Get user choice for startup option with a beautiful terminal UI"""
+@lru_cache(maxsize=1)
+def build_startup_agents_table():
+    """Create the table of available agents shown at startup (built once, the rows are static)"""
+    from rich.table import Table
+
+    table = Table(
+        title="🤖 [bold cyan]Available Agents & Capabilities[/bold cyan]",
+        title_style="bold cyan",
+        border_style="cyan",
+        show_header=True,
+        header_style="bold white",
+        show_lines=True
+    )
     
-    # ANSI color codes for beautiful UI
-    class Colors:
-        HEADER = '\033[95m'
-        BLUE = '\033[94m'
-        CYAN = '\033[96m'
-        GREEN = '\033[92m'
-        YELLOW = '\033[93m'
-        RED = '\033[91m'
-        MAGENTA = '\033[95m'
-        ENDC = '\033[0m'
-        BOLD = '\033[1m'
-        UNDERLINE = '\033[4m'
+    table.add_column("Agent", style="bold yellow")
+    table.add_column("Type", style="bold blue")
+    table.add_column("Model", style="bold magenta")
+    table.add_column("Description", style="white")
     
-    def print_banner():
-        # Big ASCII art title
-        title_art = f"""
-{Colors.CYAN}{Colors.BOLD}
-██████╗ ███████╗███████╗██████╗     ██████╗ ███████╗███████╗███████╗ █████╗ ██████╗  ██████╗██╗  ██╗███████╗██████╗ 
-██╔══██╗██╔════╝██╔════╝██╔══██╗    ██╔══██╗██╔════╝██╔════╝██╔════╝██╔══██╗██╔══██╗██╔════╝██║  ██║██╔════╝██╔══██╗
-██║  ██║█████╗  █████╗  ██████╔╝    ██████╔╝█████╗  ███████╗█████╗  ███████║██████╔╝██║     ███████║█████╗  ██████╔╝
-██║  ██║██╔══╝  ██╔══╝  ██╔═══╝     ██╔══██╗██╔══╝  ╚════██║██╔══╝  ██╔══██║██╔══██╗██║     ██╔══██║██╔══╝  ██╔══██╗
-██████╔╝███████╗███████╗██║         ██║  ██║███████╗███████║███████╗██║  ██║██║  ██║╚██████╗██║  ██║███████╗██║  ██║
-╚═════╝ ╚══════╝╚══════╝╚═╝         ╚═╝  ╚═╝╚══════╝╚══════╝╚══════╝╚═╝  ╚═╝╚═╝  ╚═╝ ╚═════╝╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝
-
-    ═══════════════════════════════════════════════════════════════════════════════════════════════════════════
-                             A D V A N C E D   M U L T I   A G E N T   R E S E A R C H   S Y S T E M
-    ═══════════════════════════════════════════════════════════════════════════════════════════════════════════
-{Colors.ENDC}"""
-        
-        # Welcome message
-        welcome_msg = f"""
-{Colors.CYAN}{Colors.BOLD}
-╔══════════════════════════════════════════════════════════════════════════════╗
-║  Welcome! I'm a sophisticated multi-agent AI research system that performs  ║
-║  comprehensive deep research across multiple data sources. I can help you   ║
-║  with:                                                                       ║
-║  • Searching and analyzing research papers                                   ║
-║  • Deep web research and analysis                                           ║
-║  • Summarizing complex topics                                               ║
-║  • Planning and executing research tasks                                    ║
-║  • Connecting to MCP servers for enhanced capabilities                      ║
-║  • Integrating with vector databases for semantic search                    ║
-║                                                                              ║
-║  ⏱️  Research Time: Each search request typically takes 10-30 minutes       ║
-║     as I perform thorough analysis across multiple sources and agents.      ║
-╚══════════════════════════════════════════════════════════════════════════════╝
-{Colors.ENDC}"""
-        
-        print(title_art)
-        print(welcome_msg)
+    for row in STARTUP_AGENTS:
+        table.add_row(*row)
     
-    def print_startup_options():
-        options = f"""
-{Colors.YELLOW}{Colors.BOLD}🚀 STARTUP OPTIONS:{Colors.ENDC}
-
-{Colors.GREEN}{Colors.BOLD}1. 📊 Start Research{Colors.ENDC}
-   Begin research immediately with available tools and knowledge base
+    return table
 
-{Colors.BLUE}{Colors.BOLD}2. 📁 Index Documents{Colors.ENDC}
-   Index documents from a directory into vector database for enhanced research
 
-{Colors.RED}{Colors.BOLD}3. 🚪 Exit{Colors.ENDC}
-   Exit the application
-"""
-        print(options)
+async def get_startup_choice():
+    """Get user choice for startup option with a beautiful terminal UI"""
+    
+    def print_banner():
+        write_lines(TITLE_ART, WELCOME_MSG)
+    
+    def print_startup_options():
+        write_lines(STARTUP_OPTIONS)
     
-    def get_choice():
+    async def get_choice():
         # A prominent input section for choice selection
-        width = 80
-        header_text = "🎯 CHOOSE YOUR STARTUP OPTION"
-        prompt_text = "Enter your choice (1-3):"
-    
-        # Calculate padding for center alignment inside the box
-        header_padding = ' ' * (width - len(header_text) - 1)
-        prompt_padding = ' ' * (width - len(prompt_text) - 1)
-    
-        # Build and print the styled input box
-        print("\n")
-        print(f"{Colors.MAGENTA}{Colors.BOLD}╔{'═' * width}╗{Colors.ENDC}")
-        print(f"{Colors.MAGENTA}{Colors.BOLD}║ {Colors.YELLOW}{Colors.BOLD}{Colors.UNDERLINE}{header_text}{Colors.ENDC}{header_padding}║{Colors.ENDC}")
-        print(f"{Colors.MAGENTA}{Colors.BOLD}║ {Colors.CYAN}{prompt_text}{prompt_padding}║{Colors.ENDC}")
-        print(f"{Colors.MAGENTA}{Colors.BOLD}╚{'═' * width}╝{Colors.ENDC}")
-        
-        # Position the input cursor
-        print(f" {Colors.GREEN}{Colors.BOLD}└──> {Colors.ENDC}", end="")
+        write_lines("\n", CHOICE_INPUT_BOX)
     
-        choice = input().strip()
+        # Re-prompt on invalid input without redrawing the box
+        while True:
+            # Position the input cursor and read off the event loop
+            choice = (await ainput(INPUT_CURSOR)).strip()
     
-        if choice in ['3', 'exit', 'quit']:
-            return '3'  # Return choice instead of exiting directly
+            if choice in ('3', 'exit', 'quit'):
+                return '3'  # Return choice instead of exiting directly
     
-        if choice not in ['1', '2']:
-            print(f"\n{Colors.RED}❌ Please enter a valid choice (1-3).{Colors.ENDC}")
-            return get_choice()
+            if choice in ('1', '2'):
+                return choice
     
-        return choice
+            print(f"\n{Colors.RED}❌ Please enter a valid choice (1-3).{Colors.ENDC}")
     
     print_banner()
     
     
-    # Import and create the agents table for startup display
-    from src.agent.agent import create_comprehensive_system_overview
-    from rich.console import Console
-    from rich.table import Table
-    console = Console()
-    
-    # Create a startup agents table (without requiring full agent creation)
-    def create_startup_agents_table():
-        """Create a table showing all available agents at startup."""
-        table = Table(
-            title="🤖 [bold cyan]Available Agents & Capabilities[/bold cyan]",
-            title_style="bold cyan",
-            border_style="cyan",
-            show_header=True,
-            header_style="bold white",
-            show_lines=True
-        )
-        
-        table.add_column("Agent", style="bold yellow")
-        table.add_column("Type", style="bold blue")
-        table.add_column("Model", style="bold magenta")
-        table.add_column("Description", style="white")
-        
-        # Define all available agents
-        agents = [
-            ("🎯 Planning Agent", "Main", "gpt-4.1-mini", "Orchestrates research workflow"),
-            ("🔍 Deep Researcher", "Specialized", "gpt-4.1-mini", "Comprehensive web research"),
-            ("🧠 Deep Analyzer", "Specialized", "gpt-4.1-mini", "Methodical topic analysis"),
-            ("🌐 Browser Agent", "Specialized", "gpt-4.1-mini", "Real-time web interaction"),
-            ("📊 Vector Agent", "Specialized", "gpt-4.1-mini", "Vector database queries"),
-            ("🎯 Scoping Agent", "Specialized", "gpt-4.1-mini", "Interactive task scoping"),
-            ("🛠️  General Agent", "Utility", "gpt-4.1-mini", "Multi-purpose execution")
-        ]
-        
-        for agent_name, agent_type, model, description in agents:
-            table.add_row(agent_name, agent_type, model, description)
-        
-        return table
-    
     try:
-        startup_table = create_startup_agents_table()
-        console.print(startup_table)
+        from rich.console import Console
+        Console().print(build_startup_agents_table())
     except Exception as e:
         print(f"❌ Error displaying agents table: {e}")
     
     print_startup_options()
     
-    choice = get_choice()
+    choice = await get_choice()
     
     # Confirm choice
     choice_names = {'1': 'Start Research', '2': 'Index Documents', '3': 'Exit'}
-    print(f"\n{Colors.GREEN}{Colors.BOLD}✅ Selected:{Colors.ENDC}")
-    print(f"{Colors.CYAN}└─ {choice_names[choice]}{Colors.ENDC}")
+    write_lines(
+        f"\n{Colors.GREEN}{Colors.BOLD}✅ Selected:{Colors.ENDC}",
+        f"{Colors.CYAN}└─ {choice_names[choice]}{Colors.ENDC}",
+    )
     
     if choice != '3':
         print(f"\n{Colors.YELLOW}🚀 Initializing...{Colors.ENDC}\n")
@@ -236,30 +279,36 @@ def get_startup_choice():
     return choice
 
 
+@lru_cache(maxsize=1)
+def get_indexer_tool_class():
+    """Import the vector indexer tool on first use (pulls in langchain and faiss)"""
+    from src.tools.vector_database import VectorIndexerTool
+    return VectorIndexerTool
+
+
 async def handle_document_indexing():
     """Handle the document indexing process"""
     
-    # ANSI color codes
-    class Colors:
-        CYAN = '\033[96m'
-        GREEN = '\033[92m'
-        YELLOW = '\033[93m'
-        RED = '\033[91m'
-        BOLD = '\033[1m'
-        ENDC = '\033[0m'
-    
-    print(f"{Colors.CYAN}{Colors.BOLD}📁 Document Indexing Setup{Colors.ENDC}")
-    print(f"{Colors.CYAN}{'─' * 50}{Colors.ENDC}")
+    write_lines(
+        f"{Colors.CYAN}{Colors.BOLD}📁 Document Indexing Setup{Colors.ENDC}",
+        f"{Colors.CYAN}{'─' * 50}{Colors.ENDC}",
+    )
     
     # Get directory path using GUI or fallback to CLI
     directory_path = None
     
     if GUI_AVAILABLE:
-        print(f"\n{Colors.YELLOW}🗂️  Opening directory selection dialog...{Colors.ENDC}")
-        print(f"{Colors.CYAN}Please select the directory containing documents to index.{Colors.ENDC}")
-        print(f"{Colors.CYAN}Supported file types: PDF, TXT, MD, CSV, XLSX, PPTX, DOCX, PY, JS, TS, HTML, CSS, JSON, XML, YAML{Colors.ENDC}")
+        write_lines(
+            f"\n{Colors.YELLOW}🗂️  Opening directory selection dialog...{Colors.ENDC}",
+            f"{Colors.CYAN}Please select the directory containing documents to index.{Colors.ENDC}",
+            f"{Colors.CYAN}Supported file types: PDF, TXT, MD, CSV, XLSX, PPTX, DOCX, PY, JS, TS, HTML, CSS, JSON, XML, YAML{Colors.ENDC}",
+        )
         
-        directory_path = select_directory_gui()
+        if sys.platform == "darwin":
+            # Tk on macOS must run on the main thread
+            directory_path = select_directory_gui()
+        else:
+            directory_path = await asyncio.to_thread(select_directory_gui)
         
         if not directory_path:
             print(f"{Colors.RED}❌ No directory selected. Returning to main menu.{Colors.ENDC}")
@@ -267,25 +316,29 @@ async def handle_document_indexing():
             
     else:
         # Fallback to CLI input if GUI not available
-        print(f"\n{Colors.YELLOW}⚠️  GUI not available, using command line input.{Colors.ENDC}")
-        print(f"{Colors.YELLOW}Please enter the path to the directory you want to index:{Colors.ENDC}")
-        print(f"{Colors.CYAN}Supported file types: PDF, TXT, MD, CSV, XLSX, PPTX, DOCX, PY, JS, TS, HTML, CSS, JSON, XML, YAML{Colors.ENDC}")
+        write_lines(
+            f"\n{Colors.YELLOW}⚠️  GUI not available, using command line input.{Colors.ENDC}",
+            f"{Colors.YELLOW}Please enter the path to the directory you want to index:{Colors.ENDC}",
+            f"{Colors.CYAN}Supported file types: PDF, TXT, MD, CSV, XLSX, PPTX, DOCX, PY, JS, TS, HTML, CSS, JSON, XML, YAML{Colors.ENDC}",
+        )
         
-        directory_path = input(f"{Colors.GREEN}Directory path: {Colors.ENDC}").strip()
+        directory_path = (await ainput(f"{Colors.GREEN}Directory path: {Colors.ENDC}")).strip()
         
         if not directory_path:
             print(f"{Colors.RED}❌ No directory path provided. Returning to main menu.{Colors.ENDC}")
             return False
         
         # Expand user path for CLI input
-        directory_path = os.path.expanduser(directory_path)
+        directory_path = str(Path(directory_path).expanduser())
     
-    # Validate directory
-    if not os.path.exists(directory_path):
+    # Validate directory with a single stat() instead of exists() + isdir()
+    try:
+        path_stat = Path(directory_path).stat()
+    except OSError:
         print(f"{Colors.RED}❌ Directory does not exist: {directory_path}{Colors.ENDC}")
         return False
     
-    if not os.path.isdir(directory_path):
+    if not stat.S_ISDIR(path_stat.st_mode):
         print(f"{Colors.RED}❌ Path is not a directory: {directory_path}{Colors.ENDC}")
         return False
     
@@ -293,19 +346,20 @@ async def handle_document_indexing():
     
     # Ask about force reindexing
     print(f"\n{Colors.YELLOW}Force re-indexing of all documents? (y/N):{Colors.ENDC}")
-    force_reindex = input().strip().lower() in ['y', 'yes']
+    force_reindex = (await ainput()).strip().lower() in ['y', 'yes']
     
     try:
         # Import and use the vector indexer tool
-        from src.tools.vector_database import VectorIndexerTool
+        from src.config import config
+        VectorIndexerTool = get_indexer_tool_class()
         
         print(f"\n{Colors.CYAN}🔄 Starting document indexing...{Colors.ENDC}")
         
         # Initialize the indexer tool
-        indexer = VectorIndexerTool()
+        indexer = VectorIndexerTool(**config.get("vector_db_config", {}))
         
         # Perform the indexing
-        result = await indexer.forward(directory_path, force_reindex)
+        result = await run_with_ticker(indexer.forward(directory_path, force_reindex), "Indexing")
         
         if result.error:
             print(f"\n{Colors.RED}❌ Indexing failed: {result.error}{Colors.ENDC}")
@@ -314,13 +368,16 @@ async def handle_document_indexing():
         # Display results
         output = result.output
         if output['status'] == 'completed':
-            print(f"\n{Colors.GREEN}{Colors.BOLD}🎉 Indexing Completed Successfully!{Colors.ENDC}")
-            print(f"{Colors.GREEN}├─ Files processed: {output['files_processed']}{Colors.ENDC}")
-            print(f"{Colors.GREEN}├─ Documents indexed: {output['documents_indexed']}{Colors.ENDC}")
-            print(f"{Colors.GREEN}└─ Message: {output['message']}{Colors.ENDC}")
+            lines = [
+                f"\n{Colors.GREEN}{Colors.BOLD}🎉 Indexing Completed Successfully!{Colors.ENDC}",
+                f"{Colors.GREEN}├─ Files processed: {output['files_processed']}{Colors.ENDC}",
+                f"{Colors.GREEN}├─ Documents indexed: {output['documents_indexed']}{Colors.ENDC}",
+                f"{Colors.GREEN}└─ Message: {output['message']}{Colors.ENDC}",
+            ]
             
             if 'db_path' in output:
-                print(f"{Colors.CYAN}📍 Vector database location: {output['db_path']}{Colors.ENDC}")
+                lines.append(f"{Colors.CYAN}📍 Vector database location: {output['db_path']}{Colors.ENDC}")
+            write_lines(*lines)
         else:
             print(f"\n{Colors.RED}❌ Indexing failed: {output.get('message', 'Unknown error')}{Colors.ENDC}")
             return False
@@ -328,89 +385,72 @@ async def handle_document_indexing():
         return True
         
     except ImportError as e:
-        print(f"\n{Colors.RED}❌ Required dependencies not installed:{Colors.ENDC}")
-        print(f"{Colors.RED}   Please install: pip install langchain langchain-community langchain-openai langchain-chroma{Colors.ENDC}")
-        print(f"{Colors.RED}   Error: {e}{Colors.ENDC}")
+        write_lines(
+            f"\n{Colors.RED}❌ Required dependencies not installed:{Colors.ENDC}",
+            f"{Colors.RED}   Please install: pip install langchain langchain-community langchain-openai faiss-cpu{Colors.ENDC}",
+            f"{Colors.RED}   Error: {e}{Colors.ENDC}",
+        )
         return False
     except Exception as e:
         print(f"\n{Colors.RED}❌ Error during indexing: {e}{Colors.ENDC}")
         return False
 
 
-def get_user_task():
+async def get_user_task():
     """Get task from user with a beautiful terminal UI"""
     
-    # ANSI color codes for beautiful UI
-    class Colors:
-        HEADER = '\033[95m'
-        BLUE = '\033[94m'
-        CYAN = '\033[96m'
-        GREEN = '\033[92m'
-        YELLOW = '\033[93m'
-        RED = '\033[91m'
-        MAGENTA = '\033[95m'
-        ENDC = '\033[0m'
-        BOLD = '\033[1m'
-        UNDERLINE = '\033[4m'
-    
     def print_examples():
-        examples = f"""
-{Colors.YELLOW}{Colors.BOLD}💡 EXAMPLE RESEARCH TASKS:{Colors.ENDC}
-
-{Colors.CYAN}• "Research the latest developments in quantum computing and summarize key findings"
-• "Analyze the impact of AI on healthcare industry in 2024"
-• "Investigate recent breakthroughs in renewable energy technology"
-• "Research the current state of electric vehicle market and future trends"
-• "Analyze the relationship between climate change and economic policy"
-• "Research emerging trends in cybersecurity and digital threats"{Colors.ENDC}
-"""
-        print(examples)
+        write_lines(RESEARCH_EXAMPLES)
     
-    def get_input():
+    async def get_input():
         # A more prominent and visually appealing input section
-        width = 100  # Much larger width for bigger text
-        header_text = "🎯 WHAT WOULD YOU LIKE ME TO RESEARCH TODAY?"
-        prompt_text = "Enter your research task (or 'quit' to exit):"
-    
-        # Calculate padding for center alignment inside the box
-        header_padding = ' ' * (width - len(header_text) - 1)
-        prompt_padding = ' ' * (width - len(prompt_text) - 1)
-    
-        # Build and print the styled input box with much bigger, more prominent text
-        print("\n")
-        print(f"{Colors.MAGENTA}{Colors.BOLD}╔{'═' * width}╗{Colors.ENDC}")
-        print(f"{Colors.MAGENTA}{Colors.BOLD}║ {Colors.YELLOW}{Colors.BOLD}{Colors.UNDERLINE}{header_text}{Colors.ENDC}{header_padding}║{Colors.ENDC}")
-        print(f"{Colors.MAGENTA}{Colors.BOLD}║ {Colors.CYAN}{prompt_text}{prompt_padding}║{Colors.ENDC}")
-        print(f"{Colors.MAGENTA}{Colors.BOLD}╚{'═' * width}╝{Colors.ENDC}")
-        
-        # Position the input cursor
-        print(f" {Colors.GREEN}{Colors.BOLD}└──> {Colors.ENDC}", end="")
+        write_lines("\n", TASK_INPUT_BOX)
     
-        task = input().strip()
+        # Re-prompt on empty input without redrawing the box
+        while True:
+            # Position the input cursor and read off the event loop
+            task = (await ainput(INPUT_CURSOR)).strip()
     
-        if task.lower() in ['quit', 'exit', 'q']:
-            print(f"\n{Colors.YELLOW}👋 Goodbye! Thanks for using Deep Research Agent.{Colors.ENDC}")
-            sys.exit(0)
+            if task.lower() in ('quit', 'exit', 'q'):
+                print(f"\n{Colors.YELLOW}👋 Goodbye! Thanks for using Deep Research Agent.{Colors.ENDC}")
+                sys.exit(0)
     
-        if not task:
-            print(f"\n{Colors.RED}❌ Please enter a valid task.{Colors.ENDC}")
-            return get_input()
+            if task:
+                return task
     
-        return task
+            print(f"\n{Colors.RED}❌ Please enter a valid task.{Colors.ENDC}")
     
     print_examples()
     
-    task = get_input()
+    task = await get_input()
     
     return task
 
 
+def log_debug_panel(body: str, title: str, border_style: str) -> None:
+    """Log a bordered status panel; only called in debug mode, so rich's Panel is imported here"""
+    from rich.panel import Panel
+    from src.logger import logger
+
+    logger.log(Panel(body, title=title, border_style=border_style, padding=(0, 1)), level=1)
+
+
 async def main():
     # Parse command line arguments
+    fast_help()
     args = parse_args()
     
-    # Set global debug flag
+    from src.logger import logger
+    from src.config import config
+    from src.models import model_manager
+    from src.agent import create_agent
+    from src.ui.source_selector import get_user_research_sources
+    from src.research_source_manager import get_research_source_manager
+    from src.utils.debug_config import set_debug_mode, is_debug_mode
+    
+    # Set global debug flag; it does not change after startup, so read it once
     set_debug_mode(args.debug)
+    debug = is_debug_mode()
 
     # Initialize the configuration
     config.init_config(args.config, args)
@@ -420,7 +460,7 @@ async def main():
     # logger.init_logger(log_path=config.log_path, level=log_level)
 
     # Decide logging level based on debug mode
-    if is_debug_mode():
+    if debug:
         log_level = logging.DEBUG
         warning_filter = "default"  # show warnings in debug mode
     else:
@@ -434,67 +474,56 @@ async def main():
     warnings.simplefilter(warning_filter)
     
     # Show logger initialization message (only in debug mode)
-    if is_debug_mode():
-        logger.log(
-            Panel(
-                f"[bold green]✅ Logger initialized successfully[/bold green]\n"
-                f"[dim]Log file: {config.log_path}[/dim]\n"
-                f"[bold yellow]🔧 Debug mode enabled - verbose logging active[/bold yellow]",
-                title="📝 [bold green]System Logger[/bold green]",
-                border_style="green",
-                padding=(0, 1)
-            ),
-            level=1
+    if debug:
+        log_debug_panel(
+            f"[bold green]✅ Logger initialized successfully[/bold green]\n"
+            f"[dim]Log file: {config.log_path}[/dim]\n"
+            f"[bold yellow]🔧 Debug mode enabled - verbose logging active[/bold yellow]",
+            title="📝 [bold green]System Logger[/bold green]",
+            border_style="green"
         )
 
     # Show configuration summary (only in debug mode)
-    if is_debug_mode():
-        logger.log(
-            Panel(
-                f"[bold cyan]📋 Configuration Loaded[/bold cyan]\n"
-                f"[dim]Configuration details available in logs[/dim]",
-                title="⚙️ [bold cyan]Configuration[/bold cyan]",
-                border_style="cyan",
-                padding=(0, 1)
-            ),
-            level=1
+    if debug:
+        log_debug_panel(
+            f"[bold cyan]📋 Configuration Loaded[/bold cyan]\n"
+            f"[dim]Configuration details available in logs[/dim]",
+            title="⚙️ [bold cyan]Configuration[/bold cyan]",
+            border_style="cyan"
         )
 
     # Main application loop
     while True:
         # Get startup choice
-        startup_choice = get_startup_choice()
+        startup_choice = await get_startup_choice()
         
         if startup_choice == '2':
             # Handle document indexing
             indexing_success = await handle_document_indexing()
             
-            # Color codes for consistent UI
-            class Colors:
-                YELLOW = '\033[93m'
-                GREEN = '\033[92m'
-                RED = '\033[91m'
-                CYAN = '\033[96m'
-                BOLD = '\033[1m'
-                ENDC = '\033[0m'
-            
             # Show indexing summary and return to menu
-            print(f"\n{Colors.CYAN}{'=' * 60}{Colors.ENDC}")
-            print(f"{Colors.BOLD}{Colors.CYAN}📊 INDEXING PROCESS SUMMARY{Colors.ENDC}")
-            print(f"{Colors.CYAN}{'=' * 60}{Colors.ENDC}")
-            
             if indexing_success:
-                print(f"{Colors.GREEN}✅ Status: Indexing completed successfully{Colors.ENDC}")
-                print(f"{Colors.GREEN}🎉 Your documents have been indexed and are ready for research!{Colors.ENDC}")
+                status_lines = (
+                    f"{Colors.GREEN}✅ Status: Indexing completed successfully{Colors.ENDC}",
+                    f"{Colors.GREEN}🎉 Your documents have been indexed and are ready for research!{Colors.ENDC}",
+                )
             else:
-                print(f"{Colors.RED}❌ Status: Indexing failed{Colors.ENDC}")
-                print(f"{Colors.YELLOW}💡 You can try again or proceed with research using existing data{Colors.ENDC}")
+                status_lines = (
+                    f"{Colors.RED}❌ Status: Indexing failed{Colors.ENDC}",
+                    f"{Colors.YELLOW}💡 You can try again or proceed with research using existing data{Colors.ENDC}",
+                )
             
-            print(f"{Colors.CYAN}{'=' * 60}{Colors.ENDC}")
-            print(f"{Colors.YELLOW}🔄 Returning to main menu...{Colors.ENDC}")
+            write_lines(
+                f"\n{Colors.CYAN}{'=' * 60}{Colors.ENDC}",
+                f"{Colors.BOLD}{Colors.CYAN}📊 INDEXING PROCESS SUMMARY{Colors.ENDC}",
+                f"{Colors.CYAN}{'=' * 60}{Colors.ENDC}",
+                *status_lines,
+                f"{Colors.CYAN}{'=' * 60}{Colors.ENDC}",
+                f"{Colors.YELLOW}🔄 Returning to main menu...{Colors.ENDC}",
+            )
             
             # Pause to let user see the summary
-            input(f"\n{Colors.CYAN}Press Enter to continue...{Colors.ENDC}")
+            await ainput(f"\n{Colors.CYAN}Press Enter to continue...{Colors.ENDC}")
             continue  # Return to main menu
             
         elif startup_choice == '3':
@@ -505,10 +534,28 @@ async def main():
         # If startup_choice == '1' (Start Research), continue with research flow
         break
     
+    # Initialize models (only reached when starting research). This runs on a worker thread so
+    # it overlaps with the interactive source selection below, which blocks on input().
+    if debug:
+        log_debug_panel(
+            "[bold yellow]🤖 Initializing AI Models[/bold yellow]\n"
+            "[dim]Loading and configuring language models...[/dim]",
+            title="🤖 [bold yellow]Model Initialization[/bold yellow]",
+            border_style="yellow"
+        )
+    response_cache_path = (
+        os.path.join(config.exp_path, "llm-cache.sqlite") if config.get("llm_cache_enabled", False) else None
+    )
+    model_init = asyncio.get_running_loop().run_in_executor(
+        None,
+        partial(model_manager.init_models,
+                use_local_proxy=False,
+                concurrency=config.concurrency,
+                response_cache_path=response_cache_path)
+    )
+    
     # === NEW: RESEARCH SOURCE SELECTION ===
-    print("\n" + "="*80)
-    print("🎯 RESEARCH SOURCE CONFIGURATION")
-    print("="*80)
+    write_lines("\n" + "="*80, "🎯 RESEARCH SOURCE CONFIGURATION", "="*80)
     
     # Get research source selection from user
     source_selection_success = get_user_research_sources()
@@ -522,113 +569,89 @@ async def main():
     
     # === DYNAMIC AGENT CONFIGURATION ===
     # Update the configuration based on selected sources
-    original_planning_config = config.planning_agent_config.copy()
-    config.planning_agent_config = source_manager.create_dynamic_agent_config(config.planning_agent_config)
-    
-    # Update other agent configs if they exist
-    if hasattr(config, 'deep_researcher_agent_config'):
-        config.deep_researcher_agent_config = source_manager.create_dynamic_agent_config(config.deep_researcher_agent_config)
-    
-    if hasattr(config, 'deep_analyzer_agent_config'):
-        config.deep_analyzer_agent_config = source_manager.create_dynamic_agent_config(config.deep_analyzer_agent_config)
+    # The source-derived fields are shared, so compute them once and overlay them on each agent
+    overlay = source_manager.build_shared_overlay()
+    for agent_config_name in ('planning_agent_config', 'deep_researcher_agent_config', 'deep_analyzer_agent_config'):
+        if hasattr(config, agent_config_name):
+            setattr(config, agent_config_name,
+                    source_manager.create_dynamic_agent_config(getattr(config, agent_config_name), overlay))
     
     # Show final research configuration (only in debug mode)
-    capabilities = source_manager.get_research_capabilities()
-    if is_debug_mode():
-        logger.log(
-            Panel(
-                f"[bold green]🎯 Research Sources Configured[/bold green]\n"
-                f"[dim]Active sources: {capabilities['sources_count']} | "
-                f"Tools: {capabilities['total_tools']} | "
-                f"Agents: {capabilities['total_agents']}[/dim]\n\n"
-                f"[yellow]📊 Capabilities:[/yellow]\n"
-                f"• Web Research: {'✅' if capabilities['can_search_web'] else '❌'}\n"
-                f"• Local Documents: {'✅' if capabilities['can_search_local'] else '❌'}\n"
-                f"• MCP Tools: {'✅' if capabilities['can_use_mcp'] else '❌'}",
-                title="🎯 [bold green]Research Configuration[/bold green]",
-                border_style="green",
-                padding=(0, 1)
-            ),
-            level=1
+    capabilities = overlay['research_sources']['capabilities']
+    selected_sources = source_manager.get_selected_sources()
+    if debug:
+        log_debug_panel(
+            f"[bold green]🎯 Research Sources Configured[/bold green]\n"
+            f"[dim]Active sources: {capabilities['sources_count']} | "
+            f"Tools: {capabilities['total_tools']} | "
+            f"Agents: {capabilities['total_agents']}[/dim]\n\n"
+            f"[yellow]📊 Capabilities:[/yellow]\n"
+            f"• Web Research: {'✅' if capabilities['can_search_web'] else '❌'}\n"
+            f"• Local Documents: {'✅' if capabilities['can_search_local'] else '❌'}\n"
+            f"• MCP Tools: {'✅' if capabilities['can_use_mcp'] else '❌'}",
+            title="🎯 [bold green]Research Configuration[/bold green]",
+            border_style="green"
         )
     
-    # Initialize models (only reached when starting research)
-    if is_debug_mode():
-        logger.log(
-            Panel(
-                "[bold yellow]🤖 Initializing AI Models[/bold yellow]\n"
-                "[dim]Loading and configuring language models...[/dim]",
-                title="🤖 [bold yellow]Model Initialization[/bold yellow]",
-                border_style="yellow",
-                padding=(0, 1)
-            ),
-            level=1
-        )
-    model_manager.init_models(use_local_proxy=False)
+    # Wait for the models, which initialized in the background during source selection
+    await model_init
     
     # Show models summary (only in debug mode)
-    if is_debug_mode():
+    if debug:
         registered_models = list(model_manager.registed_models.keys())
-        logger.log(
-            Panel(
-                f"[bold green]✅ Models initialized successfully[/bold green]\n"
-                f"[dim]Available models: {', '.join(registered_models)}[/dim]",
-                title="🤖 [bold green]Model Status[/bold green]",
-                border_style="green",
-                padding=(0, 1)
-            ),
-            level=1
+        log_debug_panel(
+            f"[bold green]✅ Models initialized successfully[/bold green]\n"
+            f"[dim]Available models: {', '.join(registered_models)}[/dim]",
+            title="🤖 [bold green]Model Status[/bold green]",
+            border_style="green"
         )
 
     # Create agent with dynamic configuration
-    if is_debug_mode():
-        logger.log(
-            Panel(
-                f"[bold magenta]🏗️  Building Agent System[/bold magenta]\n"
-                f"[dim]Creating research agent network with {capabilities['sources_count']} data sources...[/dim]\n\n"
-                f"[yellow]🔧 Agent Configuration:[/yellow]\n"
-                f"• Planning Agent: {config.planning_agent_config.get('name', 'Planning Agent')}\n"
-                f"• Enabled Tools: {len(source_manager.get_enabled_tools())}\n"
-                f"• Managed Agents: {len(source_manager.get_enabled_agents())}\n"
-                f"• Research Sources: {', '.join([s.name.split(' ')[0] for s in source_manager.get_selected_sources().values()])}",
-                title="🏗️ [bold magenta]Agent Construction[/bold magenta]",
-                border_style="magenta",
-                padding=(0, 1)
-            ),
-            level=1
+    if debug:
+        log_debug_panel(
+            f"[bold magenta]🏗️  Building Agent System[/bold magenta]\n"
+            f"[dim]Creating research agent network with {capabilities['sources_count']} data sources...[/dim]\n\n"
+            f"[yellow]🔧 Agent Configuration:[/yellow]\n"
+            f"• Planning Agent: {config.planning_agent_config.get('name', 'Planning Agent')}\n"
+            f"• Enabled Tools: {capabilities['total_tools']}\n"
+            f"• Managed Agents: {capabilities['total_agents']}\n"
+            f"• Research Sources: {', '.join([s.name.split(' ')[0] for s in selected_sources.values()])}",
+            title="🏗️ [bold magenta]Agent Construction[/bold magenta]",
+            border_style="magenta"
         )
     agent = await create_agent(config)
     
     # Show agent tree visualization (tools only)
     # logger.visualize_agent_tree(agent)
 
-    task = get_user_task()
-    
-    # This is a placeholder for the color class since it's defined inside get_user_task
-    class Colors:
-        YELLOW = '\033[93m'
-        ENDC = '\033[0m'
-        GREEN = '\033[92m'
-        BOLD = '\033[1m'
-        CYAN = '\033[96m'
-
-    print(f"\n{Colors.YELLOW}🚀 Starting research task...{Colors.ENDC}")
+    task = await get_user_task()
     
     # Show research summary before starting
-    selected_sources = source_manager.get_selected_sources()
-    print(f"{Colors.CYAN}📊 Research will use:{Colors.ENDC}")
-    for source in selected_sources.values():
-        print(f"  • {source.icon} {source.name}")
-    print()
+    write_lines(
+        f"\n{Colors.YELLOW}🚀 Starting research task...{Colors.ENDC}",
+        f"{Colors.CYAN}📊 Research will use:{Colors.ENDC}",
+        *(f"  • {source.icon} {source.name}" for source in selected_sources.values()),
+        "",
+    )
     
     res = await agent.run(task)
     
     # Show completion with beautiful UI
-    print(f"\n{Colors.GREEN}{Colors.BOLD}🎉 Research Complete!{Colors.ENDC}")
-    print(f"{Colors.CYAN}┌─ Final Result:{Colors.ENDC}")
-    print(f"{Colors.CYAN}└─ {Colors.ENDC}{str(res)}")
-    print(f"\n{Colors.YELLOW}✨ Thank you for using Deep Research Agent! 👋 Goodbye!{Colors.ENDC}")
-    print()
+    write_lines(
+        f"\n{Colors.GREEN}{Colors.BOLD}🎉 Research Complete!{Colors.ENDC}",
+        f"{Colors.CYAN}┌─ Final Result:{Colors.ENDC}",
+        f"{Colors.CYAN}└─ {Colors.ENDC}{str(res)}",
+        f"\n{Colors.YELLOW}✨ Thank you for using Deep Research Agent! 👋 Goodbye!{Colors.ENDC}",
+        "",
+    )
+
+async def run():
+    """Run main() and release shared resources on every exit path"""
+    try:
+        await main()
+    finally:
+        from src.utils.http_client import close_http_client
+        await close_http_client()
 
 if __name__ == '__main__':
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(run())
\ No newline at end of file
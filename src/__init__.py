@@ -1,54 +1,44 @@
-from .tools import (
-    Tool,
-    ToolResult,
-    AsyncTool,
-    DeepAnalyzerTool,
-    DeepResearcherTool,
-    AutoBrowserUseTool,
-    PlanningTool,
-    make_tool_instance,
-    VectorIndexerTool,
-    VectorSearchTool,
-    VectorFunctionCallsTool,
-)
-
-from .research_source_manager import (
-    ResearchSourceManager,
-    SourceConfig,
-    SourceType,
-    get_research_source_manager,
-)
-
-from .ui import (
-    get_user_research_sources,
-    select_research_sources,
-    show_current_configuration,
-    show_detailed_help,
-)
-
-__all__ = [
+import importlib
+
+# Public names are imported on first access (PEP 562), so `import src` or `from src.x import y`
+# does not drag in every tool, the vector database stack and the UI.
+_LAZY_IMPORTS = {
     # Tools
-    "Tool",
-    "ToolResult", 
-    "AsyncTool",
-    "DeepAnalyzerTool",
-    "DeepResearcherTool",
-    "AutoBrowserUseTool",
-    "PlanningTool",
-    "make_tool_instance",
-    "VectorIndexerTool",
-    "VectorSearchTool", 
-    "VectorFunctionCallsTool",
-    
+    "Tool": ".tools",
+    "ToolResult": ".tools",
+    "AsyncTool": ".tools",
+    "DeepAnalyzerTool": ".tools",
+    "DeepResearcherTool": ".tools",
+    "AutoBrowserUseTool": ".tools",
+    "PlanningTool": ".tools",
+    "make_tool_instance": ".tools",
+    "VectorIndexerTool": ".tools",
+    "VectorSearchTool": ".tools",
+    "VectorFunctionCallsTool": ".tools",
+
     # Source Management
-    "ResearchSourceManager",
-    "SourceConfig",
-    "SourceType", 
-    "get_research_source_manager",
-    
+    "ResearchSourceManager": ".research_source_manager",
+    "SourceConfig": ".research_source_manager",
+    "SourceType": ".research_source_manager",
+    "get_research_source_manager": ".research_source_manager",
+
     # UI Components
-    "get_user_research_sources",
-    "select_research_sources",
-    "show_current_configuration",
-    "show_detailed_help",
-]
\ No newline at end of file
+    "get_user_research_sources": ".ui",
+    "select_research_sources": ".ui",
+    "show_current_configuration": ".ui",
+    "show_detailed_help": ".ui",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
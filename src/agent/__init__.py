@@ -1,22 +1,31 @@
-from .agent import create_agent, create_system_status_table, create_agent_detail_table, build_agent
-from .browser_use_agent import BrowserUseAgent
-from .deep_analyzer_agent import DeepAnalyzerAgent
-from .deep_researcher_agent import DeepResearcherAgent
-from .general_agent import GeneralAgent
-from .planning_agent import PlanningAgent
-from .scoping_agent import ScopingAgent
-from .vector_agent import VectorAgent
+import importlib
 
-__all__ = [
-    "create_agent", 
-    "create_system_status_table", 
-    "create_agent_detail_table", 
-    "build_agent",
-    "BrowserUseAgent",
-    "DeepAnalyzerAgent", 
-    "DeepResearcherAgent",
-    "GeneralAgent",
-    "PlanningAgent",
-    "ScopingAgent",
-    "VectorAgent"
-]
\ No newline at end of file
+# Agent classes are imported on first access (PEP 562). AGENT.build() does not depend on this
+# package having been imported: the registry imports the agent modules itself (see src/registry.py).
+_LAZY_IMPORTS = {
+    "create_agent": ".agent",
+    "create_system_status_table": ".agent",
+    "create_agent_detail_table": ".agent",
+    "build_agent": ".agent",
+    "BrowserUseAgent": ".browser_use_agent",
+    "DeepAnalyzerAgent": ".deep_analyzer_agent",
+    "DeepResearcherAgent": ".deep_researcher_agent",
+    "GeneralAgent": ".general_agent",
+    "PlanningAgent": ".planning_agent",
+    "ScopingAgent": ".scoping_agent",
+    "VectorAgent": ".vector_agent",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
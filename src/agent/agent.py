@@ -1,17 +1,203 @@
-from typing import List, Dict, Any
+import asyncio
+import logging
+import weakref
+from collections import OrderedDict, namedtuple
+from functools import wraps
+from itertools import chain
+from typing import List, Dict, Any, Optional
 
 from src.registry import AGENT, TOOL
+from src.config.types import AgentConfig
 from src.models import model_manager
 from src.tools import make_tool_instance
 from src.mcp.mcpadapt import MCPAdapt, AsyncToolAdapter
 from src.logger import logger
+from src.research_source_manager import get_research_source_manager
+from src.utils.debug_config import is_debug_mode
 from rich.panel import Panel
 from rich.table import Table
 from rich.console import Console
 
 
-def create_system_status_table(main_agent, managed_agents: List = None, mcp_tools_count: int = 0) -> Table:
-    """Create a comprehensive system status table showing all agents with details."""
+# Agents and tools listed in the comprehensive system overview, active or not
+_AVAILABLE_AGENT_CONFIGS = (
+    ("scoping_agent", "Interactive scoping with clarification"),
+    ("planning_agent", "Strategic task coordination"),
+    ("vector_agent", "Vector database semantic search"),
+    ("deep_researcher_agent", "Comprehensive web research"),
+    ("deep_analyzer_agent", "Methodical problem analysis"),
+    ("browser_use_agent", "Interactive web browsing"),
+    ("general_agent", "General purpose task execution"),
+)
+
+_REGISTERED_TOOLS = (
+    ("interactive_planning_tool", "Research plan presentation & confirmation"),
+    ("user_clarification_tool", "Interactive user clarification"),
+    ("planning_tool", "Task planning & management"),
+    ("vector_search_tool", "Semantic document search"),
+    ("vector_function_calls_tool", "Advanced vector operations"),
+    ("deep_researcher_tool", "Web research & analysis"),
+    ("deep_analyzer_tool", "Systematic problem analysis"),
+    ("auto_browser_use_tool", "Automated web browsing"),
+    ("web_searcher_tool", "General web search"),
+    ("archive_searcher_tool", "Archive & historical search"),
+    ("final_answer_tool", "Result finalization"),
+)
+_REGISTERED_TOOL_NAMES = frozenset(tool_name for tool_name, _ in _REGISTERED_TOOLS)
+
+_STATUS_ACTIVE = "[green]✅ ACTIVE[/green]"
+_STATUS_AVAILABLE = "[yellow]⚠️ AVAILABLE[/yellow]"
+_STATUS_UNAVAILABLE = "[red]❌ UNAVAILABLE[/red]"
+_STATUS_CONNECTED = "[green]✅ CONNECTED[/green]"
+
+# Overview rows: parameterized cells are filled with str.format_map, constant labels and
+# (status, details) pairs are formatted once here
+_ACTIVE_AGENT_ROW = ("{icon} {name}", "{kind}", _STATUS_ACTIVE, "{model}", "{tool_count} tools", "{description}")
+_AVAILABLE_AGENT_LABELS = {agent_type: f"🔧 {agent_type}" for agent_type, _ in _AVAILABLE_AGENT_CONFIGS}
+_TOOL_LABELS = {tool_name: f"🛠️ {tool_name}" for tool_name, _ in _REGISTERED_TOOLS}
+_AGENT_CONFIG_STATUS = {
+    True: (_STATUS_AVAILABLE, "Configured but not active"),
+    False: (_STATUS_UNAVAILABLE, "Missing dependencies"),
+}
+_TOOL_STATUS = {
+    "active": (_STATUS_ACTIVE, "Fully operational"),
+    "registered": (_STATUS_AVAILABLE, "Ready but not loaded"),
+    "missing": (_STATUS_UNAVAILABLE, "Missing dependencies"),
+}
+
+
+def _fill_row(template: tuple, **fields) -> tuple:
+    return tuple(cell.format_map(fields) for cell in template)
+
+
+# Built tool instances keyed by (tool name, frozen tool config); see _cached_tool_build
+_TOOL_CACHE: Dict[tuple, Any] = {}
+
+
+def _freeze(value):
+    """Recursively convert a config value into a hashable equivalent"""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(_freeze(item) for item in value)
+    return value
+
+
+def _cached_tool_build(tool_name: str, tool_config):
+    """Build a tool, reusing an earlier instance built from the same config.
+
+    Tools that keep per-agent state set `_shareable = False` and are always built fresh.
+    """
+    try:
+        key = (tool_name, _freeze(tool_config))
+        hash(key)
+    except TypeError:
+        return TOOL.build(tool_config)
+
+    tool = _TOOL_CACHE.get(key)
+    if tool is None:
+        tool = TOOL.build(tool_config)
+        if getattr(tool, "_shareable", True):
+            _TOOL_CACHE[key] = tool
+    return tool
+
+
+def clear_tool_cache() -> None:
+    """Drop all cached tool instances"""
+    _TOOL_CACHE.clear()
+
+
+class _AgentView(namedtuple("_AgentView", "name description model tools")):
+    """Display attributes of an agent, read once; `description` is None when the agent has none"""
+    __slots__ = ()
+
+    def describe(self, default: str) -> str:
+        return default if self.description is None else self.description
+
+
+# Agents are fully built before they are displayed, so their view never changes
+_AGENT_VIEWS: "weakref.WeakKeyDictionary[Any, _AgentView]" = weakref.WeakKeyDictionary()
+
+
+def _agent_view(agent) -> _AgentView:
+    """Extract the attributes the status tables show for an agent, memoized per agent"""
+    try:
+        return _AGENT_VIEWS[agent]
+    except (KeyError, TypeError):
+        pass
+
+    view = _AgentView(
+        name=getattr(agent, 'name', agent.__class__.__name__),
+        description=getattr(agent, 'description', None),
+        model=getattr(agent.model, 'model_id', 'Unknown'),
+        tools=tuple(agent.tools.keys()) if hasattr(agent, 'tools') else (),
+    )
+    try:
+        _AGENT_VIEWS[agent] = view
+    except TypeError:
+        pass  # Unhashable or not weak-referenceable; extract again next time
+    return view
+
+
+def _agent_fingerprint(agent) -> tuple:
+    view = _agent_view(agent)
+    return (id(agent), view.name, view.model, view.tools)
+
+
+def _agents_fingerprint(agents) -> tuple:
+    return tuple(_agent_fingerprint(agent) for agent in (agents or ()))
+
+
+# Recently built tables keyed by (builder name, fingerprint of everything the table shows)
+_TABLE_CACHE_SIZE = 8
+_TABLE_CACHE: "OrderedDict[tuple, Table]" = OrderedDict()
+
+
+def _should_render_dashboard() -> bool:
+    """Status tables are printed at INFO; below that level nothing would show them"""
+    return logger.isEnabledFor(logging.INFO)
+
+
+def _memoized_table(fingerprint):
+    """Return the previously built table while `fingerprint(*args)` is unchanged.
+
+    Tables are never mutated after they are built, so one instance can back many renders.
+    Returns None without building anything when INFO output is disabled, so callers print the
+    table only if one is returned.
+    """
+    def decorator(build):
+        @wraps(build)
+        def wrapper(*args, **kwargs):
+            if not _should_render_dashboard():
+                return None
+            key = (build.__name__, fingerprint(*args, **kwargs))
+            table = _TABLE_CACHE.get(key)
+            if table is not None:
+                _TABLE_CACHE.move_to_end(key)
+                return table
+            table = build(*args, **kwargs)
+            _TABLE_CACHE[key] = table
+            if len(_TABLE_CACHE) > _TABLE_CACHE_SIZE:
+                _TABLE_CACHE.popitem(last=False)
+            return table
+        return wrapper
+    return decorator
+
+
+def invalidate_dashboard_cache() -> None:
+    """Drop all cached status tables"""
+    _TABLE_CACHE.clear()
+
+
+@_memoized_table(lambda main_agent, managed_agents=None, mcp_tools_count=0: (
+    _agent_fingerprint(main_agent), _agents_fingerprint(managed_agents), mcp_tools_count))
+def create_system_status_table(main_agent, managed_agents: List = None, mcp_tools_count: int = 0) -> Optional[Table]:
+    """Create a comprehensive system status table showing all agents with details.
+
+    Returns None when INFO output is disabled; only print the table if one is returned.
+    """
     table = Table(
         title="🤖 [bold cyan]Agent System Status Dashboard[/bold cyan]",
         title_style="bold cyan",
@@ -30,41 +216,29 @@ def create_system_status_table(main_agent, managed_agents: List = None, mcp_tool
     table.add_column("Description", style="white")
     
     # Main Agent info
-    main_agent_name = getattr(main_agent, 'name', main_agent.__class__.__name__)
-    main_agent_description = getattr(main_agent, 'description', 'Main orchestrator agent')
-    main_agent_model = getattr(main_agent.model, 'model_id', 'Unknown')
-    main_agent_tools = list(main_agent.tools.keys()) if hasattr(main_agent, 'tools') else []
+    main_view = _agent_view(main_agent)
     
     # Show all tools
-    main_agent_tools_str = ", ".join(main_agent_tools) if main_agent_tools else "None"
-    
     table.add_row(
-        f"🎯 {main_agent_name}",
+        f"🎯 {main_view.name}",
         "Main",
         "✅ Ready",
-        main_agent_model,
-        main_agent_tools_str,
-        main_agent_description
+        main_view.model,
+        ", ".join(main_view.tools) if main_view.tools else "None",
+        main_view.describe('Main orchestrator agent')
     )
     
     # Managed Agents info
     if managed_agents and len(managed_agents) > 0:
-        for agent in managed_agents:
-            agent_name = getattr(agent, 'name', agent.__class__.__name__)
-            agent_description = getattr(agent, 'description', 'Specialized agent')
-            agent_model = getattr(agent.model, 'model_id', 'Unknown')
-            agent_tools = list(agent.tools.keys()) if hasattr(agent, 'tools') else []
-            
+        for view in map(_agent_view, managed_agents):
             # Show all tools
-            agent_tools_str = ", ".join(agent_tools) if agent_tools else "None"
-            
             table.add_row(
-                f"🤖 {agent_name}",
+                f"🤖 {view.name}",
                 "Worker",
                 "✅ Active",
-                agent_model,
-                agent_tools_str,
-                agent_description
+                view.model,
+                ", ".join(view.tools) if view.tools else "None",
+                view.describe('Specialized agent')
             )
     
     # MCP Connection info (as a summary row)
@@ -81,8 +255,13 @@ def create_system_status_table(main_agent, managed_agents: List = None, mcp_tool
     return table
 
 
-def create_system_init_table(mcp_tools_count: int, system_type: str, managed_agents_list: List[str] = None) -> Table:
-    """Create a system initialization status table."""
+@_memoized_table(lambda mcp_tools_count, system_type, managed_agents_list=None: (
+    mcp_tools_count, system_type, tuple(managed_agents_list or ())))
+def create_system_init_table(mcp_tools_count: int, system_type: str, managed_agents_list: List[str] = None) -> Optional[Table]:
+    """Create a system initialization status table.
+
+    Returns None when INFO output is disabled; only print the table if one is returned.
+    """
     table = Table(
         title="🚀 [bold white]System Initialization Status[/bold white]",
         title_style="bold white",
@@ -129,10 +308,15 @@ def create_system_init_table(mcp_tools_count: int, system_type: str, managed_age
     return table
 
 
-def create_agent_detail_table(agent) -> Table:
-    """Create a detailed table for individual agent information."""
+@_memoized_table(_agent_fingerprint)
+def create_agent_detail_table(agent) -> Optional[Table]:
+    """Create a detailed table for individual agent information.
+
+    Returns None when INFO output is disabled; only print the table if one is returned.
+    """
+    view = _agent_view(agent)
     table = Table(
-        title=f"🤖 [bold cyan]{getattr(agent, 'name', agent.__class__.__name__)}[/bold cyan]",
+        title=f"🤖 [bold cyan]{view.name}[/bold cyan]",
         title_style="bold cyan",
         border_style="cyan",
         show_header=True,
@@ -143,24 +327,26 @@ def create_agent_detail_table(agent) -> Table:
     table.add_column("Property", style="bold yellow")
     table.add_column("Value", style="white")
     
-    # Agent basic info
-    agent_name = getattr(agent, 'name', agent.__class__.__name__)
-    agent_type = getattr(agent, 'type', agent.__class__.__name__)
-    agent_description = getattr(agent, 'description', 'No description available')
-    agent_model = getattr(agent.model, 'model_id', 'Unknown')
-    agent_max_steps = getattr(agent, 'max_steps', 'Not set')
-    
     table.add_row("Agent Type", "BLAHH")
-    table.add_row("Model", agent_model)
-    table.add_row("Description", agent_description)
-    table.add_row("Tools Count", str(len(agent.tools)) if hasattr(agent, 'tools') else "0")
+    table.add_row("Model", view.model)
+    table.add_row("Description", view.describe('No description available'))
+    table.add_row("Tools Count", str(len(view.tools)))
     table.add_row("Managed Agents", "0")  # This would need to be calculated based on your structure
     
     return table
 
 
-def create_tools_table(agent) -> Table:
-    """Create a table showing available tools for an agent."""
+def _truncate(text: str, width: int = 100) -> str:
+    """Cut text longer than `width` to `width` characters ending in an ellipsis"""
+    return text if len(text) <= width else text[:width - 3] + "..."
+
+
+@_memoized_table(_agent_fingerprint)
+def create_tools_table(agent) -> Optional[Table]:
+    """Create a table showing available tools for an agent.
+
+    Returns None when INFO output is disabled; only print the table if one is returned.
+    """
     table = Table(
         title="🛠️ [bold white]Available Tools[/bold white]",
         title_style="bold white",
@@ -175,10 +361,8 @@ def create_tools_table(agent) -> Table:
     
     if hasattr(agent, 'tools') and agent.tools:
         for tool_name, tool in agent.tools.items():
-            tool_description = getattr(tool, 'description', 'No description available')
-            # Handle long descriptions by wrapping them appropriately
-            if len(tool_description) > 100:
-                tool_description = tool_description[:97] + "..."
+            # Handle long descriptions by truncating them to the column budget
+            tool_description = _truncate(getattr(tool, 'description', 'No description available'))
             
             table.add_row(tool_name, tool_description)
     else:
@@ -187,6 +371,20 @@ def create_tools_table(agent) -> Table:
     return table
 
 
+def _registered_names(registry) -> set:
+    """Snapshot the names a registry (or a plain mapping such as the MCP tools) can provide"""
+    if hasattr(registry, "import_from_location"):
+        # mmengine registries import their `locations` lazily on first lookup
+        registry.import_from_location()
+    return set(getattr(registry, "module_dict", registry))
+
+
+def _split_registered(requested, registered: set) -> tuple:
+    """Split requested names into (registered, unregistered), keeping request order without duplicates"""
+    requested = list(dict.fromkeys(requested))
+    return [name for name in requested if name in registered], [name for name in requested if name not in registered]
+
+
 async def build_agent(config,
                       agent_config,
                       default_tools = None,
@@ -203,6 +401,8 @@ async def build_agent(config,
     Returns:
         Agent instance.
     """
+    agent_spec = AgentConfig.from_dict(agent_config)
+
     tools = []
     mcp_tools = []
     managed_agent_tools = []
@@ -214,10 +414,10 @@ async def build_agent(config,
     if default_tools is None:
         pass  # No tools to initialize
     else:
-        used_tools = agent_config.get("tools", [])
+        used_tools, unregistered_tools = _split_registered(agent_spec.tools, _registered_names(default_tools))
+        if unregistered_tools:
+            logger.warning(f"Tools {', '.join(map(repr, unregistered_tools))} are not registered. Skipping.")
         for tool_name in used_tools:
-            if tool_name not in default_tools:
-                logger.warning(f"Tool '{tool_name}' is not registered. Skipping.")
             config_name = f"{tool_name}_config"  # e.g., "python_interpreter_tool" -> "python_interpreter_tool_config"
             if config_name in config:
                 # If the tool has a specific config, use it
@@ -225,7 +425,7 @@ async def build_agent(config,
             else:
                 # Otherwise, use the default tool instance
                 tool_config = dict(type=tool_name)
-            tool = TOOL.build(tool_config)
+            tool = _cached_tool_build(tool_name, tool_config)
             tools.append(tool)
         
         tools_list = [tool.name for tool in tools]
@@ -234,13 +434,10 @@ async def build_agent(config,
     if default_mcp_tools is None:
         pass  # No MCP tools to initialize
     else:
-        used_mcp_tools = agent_config.get("mcp_tools", [])
-        for tools_name in used_mcp_tools:
-            if tools_name not in default_mcp_tools:
-                logger.warning(f"MCP tool '{tools_name}' is not available. Skipping.")
-            else:
-                mcp_tool = default_mcp_tools[tools_name]
-                mcp_tools.append(mcp_tool)
+        used_mcp_tools, unavailable_mcp_tools = _split_registered(agent_spec.mcp_tools, _registered_names(default_mcp_tools))
+        if unavailable_mcp_tools:
+            logger.warning(f"MCP tools {', '.join(map(repr, unavailable_mcp_tools))} are not available. Skipping.")
+        mcp_tools = [default_mcp_tools[tools_name] for tools_name in used_mcp_tools]
         
         mcp_tools_list = [tool.name for tool in mcp_tools]
 
@@ -248,13 +445,12 @@ async def build_agent(config,
     if default_managed_agents is None:
         pass  # No managed agents to initialize
     else:
-        used_managed_agents = agent_config.get("managed_agents", [])
-        for managed_agent in default_managed_agents:
-            if managed_agent.name not in used_managed_agents:
-                logger.warning(f"Managed agent '{managed_agent.name}' is not registered. Skipping.")
-            else:
-                managed_agent_tool = make_tool_instance(managed_agent)
-                managed_agent_tools.append(managed_agent_tool)
+        used_managed_agents = frozenset(agent_spec.managed_agents)
+        selected_agents = [agent for agent in default_managed_agents if agent.name in used_managed_agents]
+        missing_agents = used_managed_agents.difference(agent.name for agent in selected_agents)
+        if missing_agents:
+            logger.warning(f"Managed agents {', '.join(map(repr, sorted(missing_agents)))} are not registered. Skipping.")
+        managed_agent_tools = list(map(make_tool_instance, selected_agents))
         
         managed_agents_list = [agent.name for agent in managed_agent_tools]
 
@@ -263,102 +459,114 @@ async def build_agent(config,
     pass
 
     # Load Model
-    model = model_manager.registed_models[agent_config["model_id"]]
+    model = model_manager.registed_models[agent_spec.model_id]
 
     # Build Agent
     combined_tools = tools + mcp_tools + managed_agent_tools
-    agent_config = dict(
-        type=agent_config.type,
-        config=agent_config,
-        model=model,
-        tools=combined_tools,
-        max_steps=agent_config.max_steps,
-        name=agent_config.name,
-        description=agent_config.description,
-        provide_run_summary=agent_config.provide_run_summary
-    )
-    agent = AGENT.build(agent_config)
+    build_spec = {
+        "type": agent_spec.type,
+        "config": agent_config,
+        "model": model,
+        "tools": combined_tools,
+        "max_steps": agent_spec.max_steps,
+        "max_tool_threads": agent_spec.max_tool_threads,
+        "name": agent_spec.name,
+        "description": agent_spec.description,
+        "provide_run_summary": agent_spec.provide_run_summary,
+    }
+    agent = AGENT.build(build_spec)
 
     return agent
 
 
+async def _load_mcp_tools(config) -> dict:
+    """Connect to the configured MCP servers and return their tools (empty on failure)"""
+    try:
+        mcpadapt = MCPAdapt(config.mcp_tools_config, AsyncToolAdapter())
+        return await mcpadapt.tools() or {}
+    except Exception as e:
+        if is_debug_mode():
+            logger.warning(f"Failed to load MCP tools: {e}")
+        return {}
+
+
 async def create_agent(config):
 
-    # Load MCP tools only if MCP is enabled
-    mcpadapt_tools = {}
-    mcp_tools_count = 0
-    
     # Check if MCP is enabled in research sources
-    from src.research_source_manager import get_research_source_manager
     source_manager = get_research_source_manager()
     mcp_enabled = 'mcp' in source_manager.selected_sources
     
-    if mcp_enabled:
-        try:
-            mcpadapt = MCPAdapt(config.mcp_tools_config, AsyncToolAdapter())
-            mcpadapt_tools = await mcpadapt.tools()
-            mcp_tools_count = len(mcpadapt_tools) if mcpadapt_tools else 0
-        except Exception as e:
-            from src.utils.debug_config import is_debug_mode
-            if is_debug_mode():
-                logger.warning(f"Failed to load MCP tools: {e}")
-            mcpadapt_tools = {}
-            mcp_tools_count = 0
+    # Load MCP tools only if MCP is enabled. The handshake runs in the background so agents that
+    # do not use MCP tools are built while it is in flight.
+    mcp_task = asyncio.create_task(_load_mcp_tools(config)) if mcp_enabled else None
     
-    if config.use_hierarchical_agent:
-        agent_config = config.agent_config
-        managed_agents = []
-        used_managed_agents = agent_config.get("managed_agents", [])
-        
-        for agent_name in used_managed_agents:
-            if agent_name not in AGENT:
-                logger.warning(f"Managed agent '{agent_name}' is not registered. Skipping.")
-            else:
-                managed_agent_config_name = f"{agent_name}_config"
-                managed_agent_config = config.get(managed_agent_config_name, None)
-                managed_agent = await build_agent(
-                    config,
-                    managed_agent_config,
-                    default_tools=TOOL,
-                    default_mcp_tools=mcpadapt_tools,
-                    mcp_tools_count=mcp_tools_count
-                )
-                managed_agents.append(managed_agent)
-        
-        managed_agents_list = [agent.name for agent in managed_agents]
-        
-        # Build the main agent
-        agent = await build_agent(
+    async def mcp_tools_for(agent_config) -> dict:
+        if mcp_task is None or not agent_config.get("mcp_tools"):
+            return {}
+        return await mcp_task
+    
+    async def build_with_mcp(agent_config, **kwargs):
+        mcpadapt_tools = await mcp_tools_for(agent_config)
+        return await build_agent(
             config,
             agent_config,
             default_tools=TOOL,
             default_mcp_tools=mcpadapt_tools,
-            default_managed_agents=managed_agents,
-            mcp_tools_count=mcp_tools_count
+            mcp_tools_count=len(mcpadapt_tools),
+            **kwargs
         )
-
-
-
-        return agent
     
-    else:
-        agent_config = config.agent_config
-
-        # Build agent
-        agent = await build_agent(config,
-            agent_config,
-            default_tools=TOOL,
-            default_mcp_tools=mcpadapt_tools,
-            mcp_tools_count=mcp_tools_count
-        )
+    try:
+        if config.use_hierarchical_agent:
+            agent_config = config.agent_config
+            used_managed_agents = agent_config.get("managed_agents", [])
+            
+            # Filter out unregistered agents before dispatching, then build the rest concurrently
+            managed_agent_configs = {}
+            unregistered_agents = []
+            for agent_name in used_managed_agents:
+                if agent_name not in AGENT:
+                    unregistered_agents.append(agent_name)
+                else:
+                    managed_agent_configs[agent_name] = config.get(f"{agent_name}_config", None)
+            if unregistered_agents:
+                logger.warning(f"Managed agents {', '.join(map(repr, unregistered_agents))} are not registered. Skipping.")
+            
+            results = await asyncio.gather(
+                *(build_with_mcp(managed_agent_config) for managed_agent_config in managed_agent_configs.values()),
+                return_exceptions=True
+            )
+            
+            managed_agents = []
+            for agent_name, result in zip(managed_agent_configs, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"Failed to build managed agent '{agent_name}': {result}. Skipping.")
+                else:
+                    managed_agents.append(result)
+            
+            # Build the main agent
+            agent = await build_with_mcp(agent_config, default_managed_agents=managed_agents)
+        
+        else:
+            agent_config = config.agent_config
 
+            # Build agent
+            agent = await build_with_mcp(agent_config)
+    finally:
+        if mcp_task is not None and not mcp_task.done():
+            # Nothing needed the MCP tools (or building failed); don't leave the handshake running
+            mcp_task.cancel()
 
+    return agent
 
-        return agent
 
+@_memoized_table(lambda config, main_agent, managed_agents=None, mcp_tools_count=0: (
+    id(config), _agent_fingerprint(main_agent), _agents_fingerprint(managed_agents), mcp_tools_count))
+def create_comprehensive_system_overview(config, main_agent, managed_agents: List = None, mcp_tools_count: int = 0) -> Optional[Table]:
+    """Create a comprehensive overview showing ALL available agents and tools in the system.
 
-def create_comprehensive_system_overview(config, main_agent, managed_agents: List = None, mcp_tools_count: int = 0) -> Table:
-    """Create a comprehensive overview showing ALL available agents and tools in the system."""
+    Returns None when INFO output is disabled; only print the table if one is returned.
+    """
     from src.registry import AGENT, TOOL
     
     table = Table(
@@ -377,66 +585,43 @@ def create_comprehensive_system_overview(config, main_agent, managed_agents: Lis
     table.add_column("Capabilities", style="white")
     table.add_column("Description", style="white")
     
-    # Currently Active Main Agent
-    main_agent_name = getattr(main_agent, 'name', main_agent.__class__.__name__)
-    main_agent_description = getattr(main_agent, 'description', 'Main orchestrator agent')
-    main_agent_model = getattr(main_agent.model, 'model_id', 'Unknown')
-    main_agent_tools = list(main_agent.tools.keys()) if hasattr(main_agent, 'tools') else []
+    # Extract display attributes once per agent and reuse them for every section below
+    main_view = _agent_view(main_agent)
+    managed_views = [_agent_view(agent) for agent in (managed_agents or [])]
     
-    table.add_row(
-        f"🎯 {main_agent_name}",
-        "Main Agent",
-        "[green]✅ ACTIVE[/green]",
-        main_agent_model,
-        f"{len(main_agent_tools)} tools",
-        main_agent_description
-    )
+    # Currently Active Main Agent
+    table.add_row(*_fill_row(
+        _ACTIVE_AGENT_ROW,
+        icon="🎯",
+        name=main_view.name,
+        kind="Main Agent",
+        model=main_view.model,
+        tool_count=len(main_view.tools),
+        description=main_view.describe('Main orchestrator agent')
+    ))
     
     # Currently Active Managed Agents
-    if managed_agents and len(managed_agents) > 0:
-        for agent in managed_agents:
-            agent_name = getattr(agent, 'name', agent.__class__.__name__)
-            agent_description = getattr(agent, 'description', 'Specialized agent')
-            agent_model = getattr(agent.model, 'model_id', 'Unknown')
-            agent_tools = list(agent.tools.keys()) if hasattr(agent, 'tools') else []
-            
-            table.add_row(
-                f"🤖 {agent_name}",
-                "Managed Agent",
-                "[green]✅ ACTIVE[/green]",
-                agent_model,
-                f"{len(agent_tools)} tools",
-                agent_description
-            )
+    for view in managed_views:
+        table.add_row(*_fill_row(
+            _ACTIVE_AGENT_ROW,
+            icon="🤖",
+            name=view.name,
+            kind="Managed Agent",
+            model=view.model,
+            tool_count=len(view.tools),
+            description=view.describe('Specialized agent')
+        ))
     
     # All Available Agents in Config (including inactive ones)
-    available_agent_configs = [
-        ("scoping_agent", "Interactive scoping with clarification"),
-        ("planning_agent", "Strategic task coordination"),
-        ("vector_agent", "Vector database semantic search"),
-        ("deep_researcher_agent", "Comprehensive web research"),
-        ("deep_analyzer_agent", "Methodical problem analysis"),
-        ("browser_use_agent", "Interactive web browsing"),
-        ("general_agent", "General purpose task execution")
-    ]
-    
-    active_agent_names = set([main_agent_name] + [getattr(a, 'name', '') for a in (managed_agents or [])])
+    active_agent_names = frozenset(view.name for view in (main_view, *managed_views))
     
-    for agent_type, description in available_agent_configs:
+    for agent_type, description in _AVAILABLE_AGENT_CONFIGS:
         if agent_type not in active_agent_names:
             # Check if config exists
-            config_name = f"{agent_type}_config"
-            has_config = hasattr(config, config_name)
-            
-            if has_config:
-                status = "[yellow]⚠️ AVAILABLE[/yellow]"
-                status_desc = "Configured but not active"
-            else:
-                status = "[red]❌ UNAVAILABLE[/red]"
-                status_desc = "Missing dependencies"
+            status, status_desc = _AGENT_CONFIG_STATUS[hasattr(config, f"{agent_type}_config")]
             
             table.add_row(
-                f"🔧 {agent_type}",
+                _AVAILABLE_AGENT_LABELS[agent_type],
                 "Available Agent",
                 status,
                 "gpt-4.1-mini",
@@ -445,46 +630,22 @@ def create_comprehensive_system_overview(config, main_agent, managed_agents: Lis
             )
         
     # All Available Tools
-    registered_tools = [
-        ("interactive_planning_tool", "Research plan presentation & confirmation"),
-        ("user_clarification_tool", "Interactive user clarification"),
-        ("planning_tool", "Task planning & management"),
-        ("vector_search_tool", "Semantic document search"),
-        ("vector_function_calls_tool", "Advanced vector operations"),
-        ("deep_researcher_tool", "Web research & analysis"),
-        ("deep_analyzer_tool", "Systematic problem analysis"),
-        ("auto_browser_use_tool", "Automated web browsing"),
-        ("web_searcher_tool", "General web search"),
-        ("archive_searcher_tool", "Archive & historical search"),
-        ("final_answer_tool", "Result finalization")
-    ]
-    
     # Get currently active tools
-    active_tools = set(main_agent_tools)
-    if managed_agents:
-        for agent in managed_agents:
-            if hasattr(agent, 'tools'):
-                active_tools.update(agent.tools.keys())
+    active_tools = frozenset(chain.from_iterable(view.tools for view in (main_view, *managed_views)))
     
-    for tool_name, description in registered_tools:
+    # Snapshot which of the listed tools are registered instead of probing the registry per tool
+    registered_tool_names = _REGISTERED_TOOL_NAMES.intersection(getattr(TOOL, "_module_dict", {}))
+    
+    for tool_name, description in _REGISTERED_TOOLS:
         if tool_name in active_tools:
-            status = "[green]✅ ACTIVE[/green]"
-            capabilities = "Fully operational"
+            status, capabilities = _TOOL_STATUS["active"]
+        elif tool_name in registered_tool_names:
+            status, capabilities = _TOOL_STATUS["registered"]
         else:
-            # Check if tool is registered
-            try:
-                if tool_name in TOOL._module_dict:
-                    status = "[yellow]⚠️ AVAILABLE[/yellow]"
-                    capabilities = "Ready but not loaded"
-                else:
-                    status = "[red]❌ UNAVAILABLE[/red]"
-                    capabilities = "Missing dependencies"
-            except:
-                status = "[red]❌ UNAVAILABLE[/red]"
-                capabilities = "Missing dependencies"
+            status, capabilities = _TOOL_STATUS["missing"]
         
         table.add_row(
-            f"🛠️ {tool_name}",
+            _TOOL_LABELS[tool_name],
             "Tool",
             status,
             "N/A",
@@ -497,7 +658,7 @@ def create_comprehensive_system_overview(config, main_agent, managed_agents: Lis
         table.add_row(
             "🔗 MCP Integration",
             "External",
-            "[green]✅ CONNECTED[/green]",
+            _STATUS_CONNECTED,
             "FastMCP 2.0",
             f"{mcp_tools_count} external tools",
             "External system capabilities"
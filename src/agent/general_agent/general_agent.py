@@ -34,6 +34,7 @@ from src.memory import (ActionStep,
 from src.logger import (LogLevel,
                         YELLOW_HEX,
                         logger)
+from src.models.concurrency import get_llm_semaphore
 from src.models import (Model,
                         parse_json_if_needed,
                         agglomerate_stream_deltas,
@@ -152,13 +153,15 @@ class GeneralAgent(AsyncMultiStepAgent):
                 )
 
                 chat_message_stream_deltas: list[ChatMessageStreamDelta] = []
-                with Live("", console=self.logger.console, vertical_overflow="visible") as live:
-                    for event in output_stream:
-                        chat_message_stream_deltas.append(event)
-                        live.update(
-                            Markdown(agglomerate_stream_deltas(chat_message_stream_deltas).render_as_markdown())
-                        )
-                        yield event
+                # Streaming bypasses generate(), so hold an LLM slot for the length of the stream
+                async with get_llm_semaphore():
+                    with Live("", console=self.logger.console, vertical_overflow="visible") as live:
+                        for event in output_stream:
+                            chat_message_stream_deltas.append(event)
+                            live.update(
+                                Markdown(agglomerate_stream_deltas(chat_message_stream_deltas).render_as_markdown())
+                            )
+                            yield event
                 chat_message = agglomerate_stream_deltas(chat_message_stream_deltas)
             else:
                 chat_message: ChatMessage = await self.model(
@@ -298,8 +301,18 @@ class GeneralAgent(AsyncMultiStepAgent):
                 observations.append(observation)
                 yield ToolOutput(output=None, is_final_answer=False)
             else:
-                # Multiple parallel calls, use asyncio.gather for concurrent execution
-                tasks = [process_single_tool_call(call_info) for call_info in parallel_calls]
+                # Multiple parallel calls, use asyncio.gather for concurrent execution,
+                # bounded by max_tool_threads when it is set
+                if self.max_tool_threads:
+                    semaphore = asyncio.Semaphore(self.max_tool_threads)
+
+                    async def process_bounded_tool_call(call_info):
+                        async with semaphore:
+                            return await process_single_tool_call(call_info)
+
+                    tasks = [process_bounded_tool_call(call_info) for call_info in parallel_calls]
+                else:
+                    tasks = [process_single_tool_call(call_info) for call_info in parallel_calls]
                 results = await asyncio.gather(*tasks)
                 observations.extend(results)
                 for _ in results:
@@ -17,6 +17,7 @@ The agent uses the standard ReAct framework with tool calling rather than
 hardcoded phase methods.
 """
 
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional
 import asyncio
 
@@ -36,6 +37,20 @@ class ScopingAgent(GeneralAgent):
     and tool discovery to handle research scoping and planning.
     """
 
+    # State fields the next agent needs; tool observations and transcripts stay behind
+    PROJECTED_KEYS_FOR_HANDOFF = ("research_plan", "clarifications_collected", "original_task")
+    # Team member that receives the projected state when the scoping agent hands off
+    HANDOFF_AGENT = "planning_agent"
+
+    # Initial scoping state; list values are replaced with fresh lists per reset
+    _DEFAULT_STATE = MappingProxyType({
+        "scoping_phase": "initial",
+        "clarifications_collected": None,
+        "research_plan": None,
+        "plan_approved": False,
+        "ready_for_handoff": False,
+    })
+
     def __init__(
         self,
         config,
@@ -59,13 +74,35 @@ class ScopingAgent(GeneralAgent):
         )
         
         # Store scoping state in agent state for tool access
-        self.state.update({
-            "scoping_phase": "initial",
-            "clarifications_collected": [],
-            "research_plan": None,
-            "plan_approved": False,
-            "ready_for_handoff": False
-        })
+        self.reset_scoping_state()
+
+    def reset_scoping_state(self) -> None:
+        """Restore the scoping keys in the agent state to their initial values"""
+        self.state.update(self._DEFAULT_STATE)
+        self.state["clarifications_collected"] = []
+
+    def get_handoff_payload(self) -> Dict[str, Any]:
+        """Project the agent state onto the fields passed to the next agent as `additional_args`"""
+        # Unset fields (None / empty) would only add noise to the next agent's task prompt
+        return {
+            key: self.state[key]
+            for key in self.PROJECTED_KEYS_FOR_HANDOFF
+            if self.state.get(key) not in (None, "", [], {})
+        }
+
+    async def execute_tool_call(self, tool_name: str, arguments: dict[str, str] | str) -> Any:
+        """Execute a tool call, attaching the projected handoff payload to calls to the planning agent"""
+        if tool_name == self.HANDOFF_AGENT and tool_name in self.managed_agents:
+            if isinstance(arguments, str):
+                arguments = {"task": arguments}
+            if isinstance(arguments, dict):
+                model_args = arguments.get("additional_args")
+                arguments = {
+                    **arguments,
+                    # Explicit arguments from the model win over the projected state
+                    "additional_args": {**self.get_handoff_payload(), **(model_args if isinstance(model_args, dict) else {})},
+                }
+        return await super().execute_tool_call(tool_name, arguments)
 
     async def run(
         self,
@@ -85,6 +122,9 @@ class ScopingAgent(GeneralAgent):
         3. Present plan for confirmation
         4. Prepare handoff to planning agent
         """
+        if reset:
+            self.reset_scoping_state()
+        
         # Store the original task in state for tools to access
         self.state["original_task"] = task
         self.state["current_task"] = task
@@ -1,7 +1,13 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator
 import asyncio
+import io
 import json
-from pathlib import Path
+import os
+from collections import OrderedDict, deque, namedtuple
+from itertools import islice
+from functools import lru_cache
+
+import numpy as np
 
 from src.agent.general_agent import GeneralAgent
 from src.tools import VectorSearchTool, ToolResult
@@ -11,6 +17,64 @@ from src.logger import logger
 from src.registry import AGENT
 from src.utils import assemble_project_path
 
+@lru_cache(maxsize=4096)
+def _basename(path: str) -> str:
+    """Final path component, like Path(path).name without building a Path"""
+    return os.path.basename(path.rstrip(os.sep + (os.altsep or "")))
+
+_FileAggregates = namedtuple("_FileAggregates", ["file_types", "file_names", "directories", "file_sizes"])
+
+def _aggregate_files(results: List[Dict[str, Any]]) -> _FileAggregates:
+    """Collect file types, names, directories and sizes from normalized results in one pass"""
+    aggregates = _FileAggregates(set(), set(), set(), [])
+    for result in results:
+        file_info = result['file']
+        file_type = file_info.get('type')
+        if file_type:
+            aggregates.file_types.add(file_type)
+        name = file_info.get('name')
+        if name:
+            aggregates.file_names.add(name)
+        directory = file_info.get('directory')
+        if directory:
+            aggregates.directories.add(_basename(directory))
+        size_bytes = file_info.get('size_bytes')
+        if size_bytes:
+            aggregates.file_sizes.append(size_bytes)
+    return aggregates
+
+_SUMMARY_TEMPLATE = (
+    "📊 **Search Results Summary**\n"
+    "   • Query: '{}'\n"
+    "   • Found {} relevant document chunks\n"
+    "   • Across {} unique files\n"
+    "   • File types: {}\n"
+    "   • Best relevance score: {}\n"
+    "\n"
+)
+
+_DOCUMENT_TEMPLATE = (
+    "📄 **Document {}: {}**\n"
+    "   • **File**: {}\n"
+    "   • **Size**: {}\n"
+    "   • **Type**: {} ({})\n"
+    "   • **Modified**: {}\n"
+    "   • **Relevance**: {} (score: {:.3f})\n"
+    "   • **Chunk**: {}\n"
+    "   • **Content**: {}{}\n"
+    "\n"
+)
+
+_SEP = ", "
+_ADDITIONAL_HEADER = "📋 **Additional Results**: {} more document chunks found\n"
+_ADDITIONAL_LINE = "   • {} - {} (score: {:.3f})\n"
+_INSIGHTS_HEADER = "🎯 **Key Insights**\n"
+_LINE_DOCUMENT_TYPES = "   • **Document Types**: {}\n"
+_LINE_SOURCE_DIRECTORIES = "   • **Source Directories**: {}\n"
+_LINE_AVERAGE_SIZE = "   • **Average File Size**: {:.2f} MB\n"
+_LINE_AVERAGE_RELEVANCE = "   • **Average Relevance**: {:.3f}\n"
+_RECOMMENDATION = "\n💡 **Recommendation**: Use this information as context for further research or analysis."
+
 @AGENT.register_module(name="vector_agent", force=True)
 class VectorAgent(GeneralAgent):
     """
@@ -21,8 +85,18 @@ class VectorAgent(GeneralAgent):
     - Context retrieval and summarization
     - Document analysis and cross-referencing
     - Knowledge extraction from local document collections
+    
+    Successful searches are kept in an LRU cache keyed by the normalized query and result
+    count, so repeated queries (retries, follow-ups) skip the embedding and index lookup.
+    Searches issued within SEARCH_BATCH_WINDOW seconds of each other are coalesced into one
+    `forward_batch` call (one embeddings request, one index search).
     """
     
+    SEARCH_CACHE_SIZE = 512
+    MAX_PROCESSED_QUERIES = 64
+    SEARCH_BATCH_MAX = 32
+    SEARCH_BATCH_WINDOW = 0.005
+    
     def __init__(self,
                  config,
                  tools: list[Any],
@@ -57,7 +131,9 @@ class VectorAgent(GeneralAgent):
         
         # Document context management
         self.current_context = []
-        self.processed_queries = []
+        self.processed_queries = deque(maxlen=self.MAX_PROCESSED_QUERIES)
+        self._search_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._search_batch: Optional[list] = None
     
     async def _check_vector_database_status(self) -> Dict[str, Any]:
         """Check if vector database exists and is accessible"""
@@ -93,14 +169,52 @@ class VectorAgent(GeneralAgent):
                 "message": "Failed to access vector database"
             }
     
+    async def _batched_search(self, query: str, max_results: int) -> ToolResult:
+        """Queue a search; the first caller of a batch waits out the window and runs it"""
+        future = asyncio.get_running_loop().create_future()
+        batch = self._search_batch
+        is_leader = batch is None or len(batch) >= self.SEARCH_BATCH_MAX
+        if is_leader:
+            batch = self._search_batch = []
+        batch.append((query, max_results, future))
+        
+        if is_leader:
+            try:
+                await asyncio.sleep(self.SEARCH_BATCH_WINDOW)
+            finally:
+                # Run the batch even if the leader is cancelled so the other callers resolve
+                if self._search_batch is batch:
+                    self._search_batch = None
+                await self._run_search_batch(batch)
+        return await future
+    
+    async def _run_search_batch(self, batch: list) -> None:
+        queries, limits, futures = zip(*batch)
+        try:
+            results = await self.vector_search_tool.forward_batch(list(queries), list(limits))
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for future, result in zip(futures, results):
+            if not future.done():
+                future.set_result(result)
+    
     async def _perform_semantic_search(self, query: str, max_results: int = None) -> Dict[str, Any]:
         """Perform semantic search with enhanced result processing"""
         if max_results is None:
             max_results = self.max_search_results
         
+        cache_key = (" ".join(query.lower().split()), max_results)
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            self._search_cache.move_to_end(cache_key)
+            return {**cached, "query": query, "search_metadata": {**cached["search_metadata"], "original_query": query}}
+        
         try:
             # Perform vector search
-            result = await self.vector_search_tool.forward(query, max_results=max_results)
+            result = await self._batched_search(query, max_results)
             
             if result.error:
                 return {
@@ -112,26 +226,41 @@ class VectorAgent(GeneralAgent):
             search_output = result.output
             
             # Filter results by similarity threshold if needed
-            filtered_results = []
-            if "results" in search_output:
-                for doc_result in search_output["results"]:
-                    if doc_result.get("similarity_score", 0) >= self.similarity_threshold:
-                        filtered_results.append(doc_result)
+            raw_results = search_output.get("results", [])
+            scores = np.fromiter((r.get("similarity_score", 0) for r in raw_results), dtype=np.float32, count=len(raw_results))
+            keep = np.flatnonzero(scores >= self.similarity_threshold)
+            filtered_results = [raw_results[i] for i in keep.tolist()]
+            average_similarity = float(scores[keep].mean()) if keep.size else 0.0
             
             # Enhance results with additional metadata
             enhanced_results = []
             for doc_result in filtered_results:
+                _get = doc_result.get
+                # VectorSearchTool nests content under "content"; raw search results keep it flat
+                content = _get("content")
+                if not isinstance(content, dict):
+                    content = {}
+                preview = content.get("preview", _get("content_preview", ""))
+                
+                # One canonical schema, so the analysis and suggestions index keys directly
                 enhanced_result = {
-                    "content": doc_result.get("full_content", doc_result.get("content_preview", "")),
-                    "source_file": doc_result.get("source_file", "Unknown"),
-                    "file_type": doc_result.get("file_type", "Unknown"),
-                    "similarity_score": doc_result.get("similarity_score", 0),
-                    "rank": doc_result.get("rank", 0),
-                    "preview": doc_result.get("content_preview", "")
+                    "content": content.get("full_content", _get("full_content", preview)),
+                    "source_file": _get("source_file", "Unknown"),
+                    "file_type": _get("file_type", "Unknown"),
+                    "similarity_score": _get("similarity_score", 0),
+                    "relevance_level": _get("relevance_level", "Unknown"),
+                    "rank": _get("rank", 0),
+                    "preview": preview,
+                    "file": _get("file") or _get("file_info") or {},
+                    "content_info": {
+                        "preview": preview,
+                        "chunk_info": content.get("chunk_info") or f"Chunk {(_get('content_info') or {}).get('chunk_index', 0) + 1}"
+                    },
+                    "timestamps": _get("timestamps") or {}
                 }
                 enhanced_results.append(enhanced_result)
             
-            return {
+            search_results = {
                 "success": True,
                 "query": query,
                 "total_results": len(enhanced_results),
@@ -140,10 +269,17 @@ class VectorAgent(GeneralAgent):
                     "original_query": query,
                     "max_results_requested": max_results,
                     "similarity_threshold": self.similarity_threshold,
-                    "filtered_count": len(filtered_results)
+                    "filtered_count": len(filtered_results),
+                    "average_similarity": average_similarity
                 }
             }
             
+            # Failures are not cached so the query is retried once documents are indexed
+            self._search_cache[cache_key] = search_results
+            if len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+            return search_results
+            
         except Exception as e:
             logger.error(f"Vector search failed: {e}")
             return {
@@ -152,7 +288,10 @@ class VectorAgent(GeneralAgent):
                 "results": []
             }
     
-    async def _analyze_search_results(self, search_results: Dict[str, Any], original_query: str) -> str:
+    async def _analyze_search_results(self,
+                                      search_results: Dict[str, Any],
+                                      original_query: str,
+                                      aggregates: Optional[_FileAggregates] = None) -> str:
         """Analyze and synthesize search results into a comprehensive response"""
         if not search_results.get("success", False):
             return f"❌ Search failed: {search_results.get('error', 'Unknown error')}"
@@ -162,92 +301,85 @@ class VectorAgent(GeneralAgent):
             return f"🔍 No relevant documents found for query: '{original_query}'"
         
         # Create comprehensive analysis
-        analysis_parts = []
+        buf = io.StringIO()
+        w = buf.write
         
         # Summary header with search summary info
         search_summary = search_results.get("search_summary", {})
-        analysis_parts.append(f"📊 **Search Results Summary**")
-        analysis_parts.append(f"   • Query: '{original_query}'")
-        analysis_parts.append(f"   • Found {search_summary.get('total_matches', len(results))} relevant document chunks")
-        analysis_parts.append(f"   • Across {search_summary.get('files_found', 'multiple')} unique files")
-        analysis_parts.append(f"   • File types: {', '.join(search_summary.get('file_types', []))}")
-        analysis_parts.append(f"   • Best relevance score: {search_summary.get('top_similarity', 'N/A')}")
-        analysis_parts.append("")
+        w(_SUMMARY_TEMPLATE.format(
+            original_query,
+            search_summary.get('total_matches', len(results)),
+            search_summary.get('files_found', 'multiple'),
+            _SEP.join(search_summary.get('file_types', ())),
+            search_summary.get('top_similarity', 'N/A'),
+        ))
         
         # Process each result with enhanced metadata
         for i, result in enumerate(results[:5], 1):  # Limit to top 5 for detailed analysis
-            file_info = result.get('file', result.get('file_info', {}))
-            content_info = result.get('content', result.get('content_info', {}))
-            timestamps = result.get('timestamps', {})
+            file_info = result['file']
+            content_info = result['content_info']
+            timestamps = result['timestamps']
+            source_file = result['source_file']
             
-            file_name = file_info.get('name', Path(result.get('source_file', 'Unknown')).name)
-            file_path = file_info.get('path', result.get('source_file', 'Unknown'))
-            file_size = file_info.get('size', 'Unknown')
-            similarity = result.get('similarity_score', 0)
-            relevance = result.get('relevance_level', 'Unknown')
-            
-            analysis_parts.append(f"📄 **Document {i}: {file_name}**")
-            analysis_parts.append(f"   • **File**: {file_path}")
-            analysis_parts.append(f"   • **Size**: {file_size}")
-            analysis_parts.append(f"   • **Type**: {file_info.get('type', 'Unknown')} ({file_info.get('mime_type', 'Unknown')})")
-            analysis_parts.append(f"   • **Modified**: {timestamps.get('modified', 'Unknown')}")
-            analysis_parts.append(f"   • **Relevance**: {relevance} (score: {similarity:.3f})")
-            
-            # Chunk information
-            chunk_info = content_info.get('chunk_info', f"Chunk {result.get('content_info', {}).get('chunk_index', 0) + 1}")
-            analysis_parts.append(f"   • **Chunk**: {chunk_info}")
+            file_name = file_info['name'] if 'name' in file_info else _basename(source_file)
             
             # Content preview
-            content_preview = content_info.get('preview', result.get('content_preview', ''))[:400]
-            analysis_parts.append(f"   • **Content**: {content_preview}{'...' if len(content_preview) >= 400 else ''}")
-            analysis_parts.append("")
+            content_preview = content_info['preview'][:400]
+            
+            w(_DOCUMENT_TEMPLATE.format(
+                i,
+                file_name,
+                file_info.get('path', source_file),
+                file_info.get('size', 'Unknown'),
+                file_info.get('type', 'Unknown'),
+                file_info.get('mime_type', 'Unknown'),
+                timestamps.get('modified', 'Unknown'),
+                result['relevance_level'],
+                result['similarity_score'],
+                content_info['chunk_info'],
+                content_preview,
+                '...' if len(content_preview) >= 400 else '',
+            ))
         
         # Additional results summary
         if len(results) > 5:
-            analysis_parts.append(f"📋 **Additional Results**: {len(results) - 5} more document chunks found")
+            w(_ADDITIONAL_HEADER.format(len(results) - 5))
             for result in results[5:]:
-                file_info = result.get('file', result.get('file_info', {}))
-                file_name = file_info.get('name', Path(result.get('source_file', 'Unknown')).name)
-                similarity = result.get('similarity_score', 0)
-                relevance = result.get('relevance_level', 'Unknown')
-                analysis_parts.append(f"   • {file_name} - {relevance} (score: {similarity:.3f})")
-            analysis_parts.append("")
+                file_info = result['file']
+                file_name = file_info['name'] if 'name' in file_info else _basename(result['source_file'])
+                w(_ADDITIONAL_LINE.format(file_name, result['relevance_level'], result['similarity_score']))
+            w("\n")
         
         # Key insights extraction using enhanced metadata
-        analysis_parts.append("🎯 **Key Insights**")
+        w(_INSIGHTS_HEADER)
         
         # Extract file types from enhanced metadata
-        file_types = set()
-        file_sizes = []
-        directories = set()
-        
-        for result in results:
-            file_info = result.get('file', result.get('file_info', {}))
-            if file_info.get('type'):
-                file_types.add(file_info['type'])
-            if file_info.get('size_bytes'):
-                file_sizes.append(file_info['size_bytes'])
-            if file_info.get('directory'):
-                directories.add(Path(file_info['directory']).name)
-        
-        analysis_parts.append(f"   • **Document Types**: {', '.join(file_types) if file_types else 'Various'}")
-        analysis_parts.append(f"   • **Source Directories**: {', '.join(directories) if directories else 'Various'}")
+        if aggregates is None:
+            aggregates = _aggregate_files(results)
+        file_types, _, directories, file_sizes = aggregates
+        
+        # Sorted so the same results always render the same way
+        w(_LINE_DOCUMENT_TYPES.format(_SEP.join(sorted(file_types)) if file_types else 'Various'))
+        w(_LINE_SOURCE_DIRECTORIES.format(_SEP.join(sorted(directories)) if directories else 'Various'))
         
         if file_sizes:
             avg_size_bytes = sum(file_sizes) / len(file_sizes)
             avg_size_mb = avg_size_bytes / (1024 * 1024)
-            analysis_parts.append(f"   • **Average File Size**: {avg_size_mb:.2f} MB")
+            w(_LINE_AVERAGE_SIZE.format(avg_size_mb))
         
         # Average similarity
-        avg_similarity = sum(r.get("similarity_score", 0) for r in results) / len(results)
-        analysis_parts.append(f"   • **Average Relevance**: {avg_similarity:.3f}")
-        
-        analysis_parts.append("")
-        analysis_parts.append("💡 **Recommendation**: Use this information as context for further research or analysis.")
+        avg_similarity = search_results.get("search_metadata", {}).get("average_similarity")
+        if avg_similarity is None:
+            avg_similarity = float(np.fromiter((r.get("similarity_score", 0) for r in results), dtype=np.float64, count=len(results)).mean())
+        w(_LINE_AVERAGE_RELEVANCE.format(avg_similarity))
+        w(_RECOMMENDATION)
         
-        return "\n".join(analysis_parts)
+        return buf.getvalue()
     
-    async def _generate_query_suggestions(self, original_query: str, search_results: Dict[str, Any]) -> List[str]:
+    async def _generate_query_suggestions(self,
+                                          original_query: str,
+                                          search_results: Dict[str, Any],
+                                          aggregates: Optional[_FileAggregates] = None) -> List[str]:
         """Generate follow-up query suggestions based on search results"""
         suggestions = []
         
@@ -261,21 +393,10 @@ class VectorAgent(GeneralAgent):
             ]
         else:
             # Suggest refinements based on found content using enhanced metadata
-            results = search_results["results"]
-            
             # Extract key terms from enhanced metadata
-            file_types = set()
-            file_names = set()
-            directories = set()
-            
-            for result in results:
-                file_info = result.get('file', result.get('file_info', {}))
-                if file_info.get('type'):
-                    file_types.add(file_info['type'])
-                if file_info.get('name'):
-                    file_names.add(file_info['name'])
-                if file_info.get('directory'):
-                    directories.add(Path(file_info['directory']).name)
+            if aggregates is None:
+                aggregates = _aggregate_files(search_results["results"])
+            file_types, file_names, directories, _ = aggregates
             
             suggestions = []
             
@@ -307,19 +428,17 @@ class VectorAgent(GeneralAgent):
     async def _execute_vector_query(self, query: str) -> str:
         """Execute a complete vector query with analysis and suggestions"""
         
-        # Check database status first
-        db_status = await self._check_vector_database_status()
-        if not db_status["available"]:
-            return f"❌ Vector Database Error: {db_status['message']}\n\nPlease ensure documents are indexed before querying."
-        
-        # Perform semantic search
+        # Perform semantic search; a failed search doubles as the database status check
         search_results = await self._perform_semantic_search(query)
-        
-        # Analyze results
-        analysis = await self._analyze_search_results(search_results, query)
-        
-        # Generate suggestions
-        suggestions = await self._generate_query_suggestions(query, search_results)
+        if not search_results["success"]:
+            return f"❌ Vector Database Error: Vector database is not accessible ({search_results['error']})\n\nPlease ensure documents are indexed before querying."
+        
+        # Analyze results and generate suggestions; both only read search_results and share one aggregation pass
+        aggregates = _aggregate_files(search_results["results"])
+        analysis, suggestions = await asyncio.gather(
+            self._analyze_search_results(search_results, query, aggregates),
+            self._generate_query_suggestions(query, search_results, aggregates),
+        )
         
         # Combine into comprehensive response
         response_parts = [analysis]
@@ -330,43 +449,48 @@ class VectorAgent(GeneralAgent):
                 response_parts.append(f"   {i}. {suggestion}")
         
         # Store context for potential follow-ups
-        self.current_context = search_results.get("results", [])
+        self.current_context.clear()
+        self.current_context.extend(search_results.get("results", ()))
         self.processed_queries.append(query)
         
         return "\n".join(response_parts)
     
+    async def run_stream(self, task: str) -> AsyncIterator[str]:
+        """Yield the response in chunks: the header right away, then the query result, then the notes"""
+        logger.info(f"Vector Agent starting task: {task}")
+        
+        # Initialize response
+        header_parts = []
+        header_parts.append("🔍 **Vector Database Query Agent**")
+        header_parts.append("=" * 50)
+        header_parts.append("")
+        
+        # Check if this is a follow-up or related query
+        if self.processed_queries:
+            header_parts.append(f"📋 Previous queries: {', '.join(islice(self.processed_queries, max(len(self.processed_queries) - 3, 0), None))}")
+            header_parts.append("")
+        
+        yield "\n".join(header_parts) + "\n"
+        
+        # Execute the vector query
+        yield await self._execute_vector_query(task)
+        
+        # Add final notes
+        notes_parts = []
+        notes_parts.append("")
+        notes_parts.append("📚 **Notes:**")
+        notes_parts.append("   • This search was performed on your locally indexed documents")
+        notes_parts.append("   • Results are ranked by semantic similarity to your query")
+        notes_parts.append("   • Consider combining this information with web research for comprehensive coverage")
+        
+        yield "\n" + "\n".join(notes_parts)
+        
+        logger.info(f"Vector Agent completed task with {len(self.current_context)} relevant documents found")
+    
     async def run(self, task: str) -> str:
         """Main execution method for the Vector Agent"""
         try:
-            logger.info(f"Vector Agent starting task: {task}")
-            
-            # Initialize response
-            response_parts = []
-            response_parts.append("🔍 **Vector Database Query Agent**")
-            response_parts.append("=" * 50)
-            response_parts.append("")
-            
-            # Check if this is a follow-up or related query
-            if self.processed_queries:
-                response_parts.append(f"📋 Previous queries: {', '.join(self.processed_queries[-3:])}")
-                response_parts.append("")
-            
-            # Execute the vector query
-            query_result = await self._execute_vector_query(task)
-            response_parts.append(query_result)
-            
-            # Add final notes
-            response_parts.append("")
-            response_parts.append("📚 **Notes:**")
-            response_parts.append("   • This search was performed on your locally indexed documents")
-            response_parts.append("   • Results are ranked by semantic similarity to your query")
-            response_parts.append("   • Consider combining this information with web research for comprehensive coverage")
-            
-            final_response = "\n".join(response_parts)
-            
-            logger.info(f"Vector Agent completed task with {len(self.current_context)} relevant documents found")
-            
-            return final_response
+            return "".join([chunk async for chunk in self.run_stream(task)])
             
         except Exception as e:
             error_message = f"❌ Vector Agent Error: {str(e)}"
@@ -375,7 +499,8 @@ class VectorAgent(GeneralAgent):
     
     def get_current_context(self) -> List[Dict[str, Any]]:
         """Get current document context for use by other agents"""
-        return self.current_context
+        # A copy, since current_context is refilled in place by the next query
+        return list(self.current_context)
     
     def get_context_summary(self) -> str:
         """Get a summary of current context for other agents"""
@@ -386,7 +511,7 @@ class VectorAgent(GeneralAgent):
         summary_parts.append(f"📚 Vector Database Context ({len(self.current_context)} documents):")
         
         for i, doc in enumerate(self.current_context[:3], 1):
-            source = Path(doc["source_file"]).name
+            source = _basename(doc["source_file"])
             score = doc["similarity_score"]
             summary_parts.append(f"   {i}. {source} (relevance: {score:.3f})")
         
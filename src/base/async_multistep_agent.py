@@ -1,4 +1,5 @@
 
+import asyncio
 import importlib
 import inspect
 import json
@@ -40,6 +41,7 @@ from src.memory import (ActionStep,
                         SystemPromptStep,
                         UserPromptStep,
                         TaskStep)
+from src.models.concurrency import get_llm_semaphore
 from src.models import (
     ChatMessage,
     ChatMessageStreamDelta,
@@ -261,6 +263,9 @@ class AsyncMultiStepAgent(ABC):
         self.step_callbacks = step_callbacks if step_callbacks is not None else []
         self.step_callbacks.append(self.monitor.update_metrics)
         self.stream_outputs = False
+        # A managed agent is one shared instance whose run() resets memory/task/state, so calls to it
+        # are serialized even when the manager dispatches several of them in the same step
+        self._call_lock = asyncio.Lock()
 
     def _validate_name(self, name: str | None) -> str | None:
         if name is not None and not is_valid_name(name):
@@ -535,15 +540,17 @@ You have been provided with these additional arguments, that you can access usin
                 plan_message_content = ""
                 output_stream = self.model.generate_stream(input_messages, stop_sequences=["<end_plan>"])  # type: ignore
                 input_tokens, output_tokens = 0, 0
-                with Live("", console=self.logger.console, vertical_overflow="visible") as live:
-                    for event in output_stream:
-                        if event.content is not None:
-                            plan_message_content += event.content
-                            live.update(Markdown(plan_message_content))
-                            if event.token_usage:
-                                output_tokens += event.token_usage.output_tokens
-                                input_tokens = event.token_usage.input_tokens
-                        yield event
+                # Streaming bypasses generate(), so hold an LLM slot for the length of the stream
+                async with get_llm_semaphore():
+                    with Live("", console=self.logger.console, vertical_overflow="visible") as live:
+                        for event in output_stream:
+                            if event.content is not None:
+                                plan_message_content += event.content
+                                live.update(Markdown(plan_message_content))
+                                if event.token_usage:
+                                    output_tokens += event.token_usage.output_tokens
+                                    input_tokens = event.token_usage.input_tokens
+                            yield event
             else:
                 plan_message = self.model.generate(input_messages, stop_sequences=["<end_plan>"])
                 plan_message_content = plan_message.content
@@ -595,18 +602,19 @@ You have been provided with these additional arguments, that you can access usin
             if self.stream_outputs and hasattr(self.model, "generate_stream"):
                 plan_message_content = ""
                 input_tokens, output_tokens = 0, 0
-                with Live("", console=self.logger.console, vertical_overflow="visible") as live:
-                    for event in self.model.generate_stream(
-                        input_messages,
-                        stop_sequences=["<end_plan>"],
-                    ):  # type: ignore
-                        if event.content is not None:
-                            plan_message_content += event.content
-                            live.update(Markdown(plan_message_content))
-                            if event.token_usage:
-                                output_tokens += event.token_usage.output_tokens
-                                input_tokens = event.token_usage.input_tokens
-                        yield event
+                async with get_llm_semaphore():
+                    with Live("", console=self.logger.console, vertical_overflow="visible") as live:
+                        for event in self.model.generate_stream(
+                            input_messages,
+                            stop_sequences=["<end_plan>"],
+                        ):  # type: ignore
+                            if event.content is not None:
+                                plan_message_content += event.content
+                                live.update(Markdown(plan_message_content))
+                                if event.token_usage:
+                                    output_tokens += event.token_usage.output_tokens
+                                    input_tokens = event.token_usage.input_tokens
+                            yield event
             else:
                 plan_message = self.model.generate(input_messages, stop_sequences=["<end_plan>"])
                 plan_message_content = plan_message.content
@@ -771,7 +779,12 @@ You have been provided with these additional arguments, that you can access usin
     async def __call__(self, task: str, **kwargs):
         """Adds additional prompting for the managed agent, runs it, and wraps the output.
         This method is called only by a managed agent.
+        Concurrent calls to the same agent run one after another; see `_call_lock`.
         """
+        async with self._call_lock:
+            return await self._call_managed(task, **kwargs)
+
+    async def _call_managed(self, task: str, **kwargs):
         full_task = populate_template(
             self.prompt_templates["managed_agent"]["task"],
             variables=dict(name=self.name, task=task),
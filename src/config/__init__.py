@@ -1,6 +1,12 @@
-from src.config.cfg import config
-
-
 __all__ = [
     "config",
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    # Defer mmengine / dotenv loading until the config object is first used
+    if name == "config":
+        from src.config.cfg import config
+        globals()[name] = config
+        return config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
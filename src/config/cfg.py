@@ -1,4 +1,8 @@
 import os
+import copy
+import hashlib
+import pickle
+from functools import lru_cache
 from mmengine import Config as MMConfig
 from argparse import Namespace
 
@@ -30,13 +34,55 @@ def process_mcp(config: MMConfig) -> MMConfig:
             config['mcp_tools_config']['mcpServers']['LocalMCP']['args'] = args
     return config
 
+CONFIG_CACHE_DIR = assemble_project_path(os.path.join("workdir", ".config-cache"))
+
+def _config_cache_key(config_path: str) -> tuple:
+    # `_base_` files live next to the config, so any edit in that directory invalidates the cache
+    config_dir = os.path.dirname(config_path)
+    mtimes = sorted(
+        (entry.name, entry.stat().st_mtime_ns)
+        for entry in os.scandir(config_dir)
+        if entry.name.endswith(".py")
+    )
+    return (config_path, tuple(mtimes))
+
+@lru_cache(maxsize=None)
+def load_config_file(config_path: str) -> MMConfig:
+    """Parse a config file and merge its `_base_` chain, reusing a pickled result from earlier runs."""
+    key = _config_cache_key(config_path)
+    cache_file = os.path.join(CONFIG_CACHE_DIR, hashlib.sha1(config_path.encode()).hexdigest()[:16] + ".pkl")
+
+    try:
+        with open(cache_file, "rb") as f:
+            cached_key, cached_config = pickle.load(f)
+        if cached_key == key:
+            return cached_config
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable config cache {cache_file}: {e}")
+
+    mmconfig = MMConfig.fromfile(filename=config_path)
+
+    try:
+        os.makedirs(CONFIG_CACHE_DIR, exist_ok=True)
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        with open(tmp_file, "wb") as f:
+            pickle.dump((key, mmconfig), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except Exception as e:
+        logger.debug(f"Could not write config cache {cache_file}: {e}")
+
+    return mmconfig
+
 class Config(MMConfig, metaclass=Singleton):
     def __init__(self):
         super(Config, self).__init__()
 
     def init_config(self, config_path: str, args: Namespace) -> None:
         # Initialize the general configuration
-        mmconfig = MMConfig.fromfile(filename=assemble_project_path(config_path))
+        # Copy the cached parse so overrides below never leak into the cache
+        mmconfig = copy.deepcopy(load_config_file(assemble_project_path(config_path)))
         if 'cfg_options' not in args or args.cfg_options is None:
             cfg_options = dict()
         else:
@@ -0,0 +1,41 @@
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class AgentConfig:
+    """
+    Read-only view of an `*_agent_config` entry.
+
+    The config files stay plain dicts so mmengine can merge `_base_` files and apply
+    `--cfg-options`; records are built once from the merged dict when an agent is built.
+    Unknown keys raise immediately, so a misspelled field no longer fails silently.
+    """
+
+    type: str
+    name: str
+    model_id: str
+    description: str = ""
+    max_steps: int = 20
+    template_path: Optional[str] = None
+    provide_run_summary: bool = False
+    tools: Tuple[str, ...] = ()
+    mcp_tools: Tuple[str, ...] = ()
+    managed_agents: Tuple[str, ...] = ()
+    max_tool_threads: Optional[int] = None
+    research_sources: Optional[Mapping[str, Any]] = None
+
+    @classmethod
+    def from_dict(cls, agent_config: Mapping[str, Any]) -> "AgentConfig":
+        known = {field.name for field in fields(cls)}
+        unknown = set(agent_config) - known
+        if unknown:
+            raise ValueError(
+                f"Unknown keys in config for agent '{agent_config.get('name')}': {', '.join(sorted(unknown))}"
+            )
+
+        values: Dict[str, Any] = dict(agent_config)
+        for key in ("tools", "mcp_tools", "managed_agents"):
+            if key in values:
+                values[key] = tuple(values[key] or ())
+        return cls(**values)
@@ -1,8 +1,20 @@
+import os
+import re
+import sys
+import time
+import atexit
 import logging
+import logging.handlers
+import queue
 import json
 from enum import IntEnum
 from typing import List, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from rich import box
 from rich.console import Console, Group
 from rich.panel import Panel
@@ -24,17 +36,157 @@ class LogLevel(IntEnum):
     INFO = 1  # Normal output (default)
     DEBUG = 2  # Detailed output
 
+class BatchedFileStream:
+    """
+    Append-only text stream for the log file.
+
+    Logging handlers and rich consoles call flush() after every record; here that only counts
+    records, and the 64 KB buffer is flushed and fsynced every `batch_records` records or
+    `flush_interval` seconds, and once more at exit.
+    """
+
+    def __init__(self, path: str, batch_records: int = 128, flush_interval: float = 1.0, buffering: int = 64 * 1024):
+        self._file = open(path, "a", buffering=buffering, encoding="utf-8")
+        self.batch_records = batch_records
+        self.flush_interval = flush_interval
+        self._pending = 0
+        self._last_sync = time.monotonic()
+        atexit.register(self.close)
+
+    def write(self, text: str) -> int:
+        return self._file.write(text)
+
+    def flush(self) -> None:
+        self._pending += 1
+        if self._pending >= self.batch_records or time.monotonic() - self._last_sync >= self.flush_interval:
+            self.sync()
+
+    def sync(self) -> None:
+        """Push buffered records to disk now"""
+        if self._file.closed:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending = 0
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
+
+    def isatty(self) -> bool:
+        return False
+
+    def __getattr__(self, name):
+        return getattr(self._file, name)
+
+# Renderables printed through the tee console instead of formatted as log records; exact types
+# only, since a set lookup on type(msg) is cheaper than isinstance() on every plain-string call
+_RICH_TYPES = frozenset((Rule, Panel, Group, Tree, Table, Syntax))
+
+_ANSI_ESCAPE = re.compile(r"\x1b\[[0-9;?]*[ -/]*[@-~]|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)")
+
+class TeeStream:
+    """
+    Fans a rich console's output out to stdout and the log file.
+
+    The renderable is laid out once; the file copy only has its ANSI escapes stripped, which is
+    what a second, non-terminal console would have produced.
+    """
+
+    def __init__(self, file):
+        self.file = file
+
+    def write(self, text: str) -> int:
+        sys.stdout.write(text)
+        self.file.write(_ANSI_ESCAPE.sub("", text))
+        return len(text)
+
+    def flush(self) -> None:
+        sys.stdout.flush()
+        self.file.flush()
+
+    def isatty(self) -> bool:
+        return sys.stdout.isatty()
+
+    def fileno(self) -> int:
+        return sys.stdout.fileno()
+
+class SecondCachedFormatter(logging.Formatter):
+    """
+    Formatter that reuses the formatted `%(asctime)s` for records created within the same second.
+
+    Only valid for a `datefmt` without sub-second fields, which is what AgentLogger uses.
+    The console and file handlers format on different threads, so the second and its formatted
+    time are cached as one tuple and swapped with a single assignment.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cache = (None, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        second = int(record.created)
+        cached = self._cache
+        if cached[0] != second:
+            cached = self._cache = (second, super().formatTime(record, datefmt))
+        return cached[1]
+
+class QueuedTextWriter:
+    """
+    File-like sink that hands each write to a logging queue as a record carrying `record.text`.
+
+    Lets a console render on the caller's thread while the log file write happens on the
+    listener thread, in order with the other queued records.
+    """
+
+    def __init__(self, log_queue):
+        self._queue = log_queue
+
+    def write(self, text: str) -> int:
+        if text:
+            self._queue.put_nowait(
+                logging.makeLogRecord({"levelno": logging.INFO, "levelname": "INFO", "text": text})
+            )
+        return len(text)
+
+    def flush(self) -> None:
+        pass
+
+    def isatty(self) -> bool:
+        return False
+
+class TextHandler(logging.Handler):
+    """Writes the pre-rendered text carried on a queued record (`record.text`) to a stream"""
+
+    def __init__(self, stream):
+        super().__init__()
+        self.stream = stream
+
+    def emit(self, record: logging.LogRecord) -> None:
+        text = getattr(record, "text", None)
+        if text is not None:
+            self.stream.write(text)
+            self.stream.flush()
+
+def _is_plain_record(record: logging.LogRecord) -> bool:
+    return not hasattr(record, "text")
+
 class AgentLogger(logging.Logger, metaclass=Singleton):
     def __init__(self, name="logger", level=logging.INFO):
         # Initialize the parent class
         super().__init__(name, level)
 
         # Define a formatter for log messages
-        self.formatter = logging.Formatter(
+        self.formatter = SecondCachedFormatter(
             fmt="\033[92m%(asctime)s - %(name)s:%(levelname)s\033[0m: %(filename)s:%(lineno)s - %(message)s",
             datefmt="%H:%M:%S",
         )
 
+        # Rendered agent trees keyed by the hierarchy they show; see visualize_agent_tree
+        self._tree_cache: dict[tuple, str] = {}
+
     def init_logger(self, log_path: str, level=logging.INFO):
         """
         Initialize the logger with a file path and optional main process check.
@@ -45,22 +197,40 @@ class AgentLogger(logging.Logger, metaclass=Singleton):
             accelerator (Accelerator, optional): Accelerator instance to determine the main process.
         """
 
-        # Add a console handler for logging to the console
+        # Add a console handler for logging to the console; terminal output stays on the caller's
+        # thread so it is ordered with print() and input() calls
         console_handler = logging.StreamHandler()
         console_handler.setLevel(level)
         console_handler.setFormatter(self.formatter)
         self.addHandler(console_handler)
 
-        # Add a file handler for logging to the file
-        file_handler = logging.FileHandler(
-            log_path, mode="a"
-        )  # 'a' mode appends to the file
+        # Add a file handler for logging to the file; records and rich renderables share
+        # one batched append stream instead of two line-flushed file handles
+        self.log_stream = BatchedFileStream(log_path)
+        file_handler = logging.StreamHandler(self.log_stream)
         file_handler.setLevel(level)
         file_handler.setFormatter(self.formatter)
-        self.addHandler(file_handler)
+        file_handler.addFilter(_is_plain_record)
+
+        # Only the log file writes are queued and done by a listener thread, so callers never block
+        # on disk I/O; one queue keeps records and rendered text in call order
+        self._log_queue = queue.SimpleQueue()
+        self.addHandler(logging.handlers.QueueHandler(self._log_queue))
 
+        # `console` stays terminal-only for Live displays; logged renderables go through the tee,
+        # which prints to the terminal directly and queues the file copy
         self.console = Console(width=100)
-        self.file_console = Console(file=open(log_path, "a"), width=100)
+        self.tee_console = Console(file=TeeStream(QueuedTextWriter(self._log_queue)), width=100)
+
+        self._listener = logging.handlers.QueueListener(
+            self._log_queue,
+            file_handler,
+            TextHandler(self.log_stream),
+            respect_handler_level=True,
+        )
+        self._listener.start()
+        # Registered after the log stream, so the queue drains before the stream is closed
+        atexit.register(self._listener.stop)
 
         # Prevent duplicate logs from propagating to the root logger
         self.propagate = False
@@ -71,48 +241,58 @@ class AgentLogger(logging.Logger, metaclass=Singleton):
         Args:
             level (LogLevel, optional): Defaults to LogLevel.INFO.
         """
+        if self.should_log(level):
+            self.info(*args, **kwargs)
+
+    def should_log(self, level: int | str | LogLevel) -> bool:
+        """Whether a message at `level` would be emitted; check before building rich renderables"""
         if isinstance(level, str):
             level = LogLevel[level.upper()]
-        if level <= self.level:
-            self.info(*args, **kwargs)
+        return level <= self.level
 
     def info(self, msg, *args, **kwargs):
         """
         Overridden info method with stacklevel adjustment for correct log location.
         """
-        if isinstance(msg, (Rule, Panel, Group, Tree, Table, Syntax)):
-            self.console.print(msg)
-            self.file_console.print(msg)
-        else:
-            kwargs.setdefault(
-                "stacklevel", 2
-            )  # Adjust stack level to show the actual caller
-            if "style" in kwargs:
-                kwargs.pop("style")
-            if "level" in kwargs:
-                kwargs.pop("level")
-            super().info(msg, *args, **kwargs)
+        if type(msg) in _RICH_TYPES:
+            self.log_renderable(msg)
+        elif self.isEnabledFor(logging.INFO):
+            if kwargs:
+                # log() and log_error() forward rich-only options that logging.Logger does not accept
+                kwargs.pop("style", None)
+                kwargs.pop("level", None)
+            self._log_at(logging.INFO, msg, args, kwargs)
+
+    def _log_at(self, level: int, msg, args: tuple, kwargs: dict) -> None:
+        """Call Logger._log directly; stacklevel defaults to 2 (the caller of info/debug/...), plus this frame"""
+        self._log(level, msg, args, stacklevel=kwargs.pop("stacklevel", 2) + 1, **kwargs)
+
+    def log_renderable(self, renderable) -> None:
+        """Print a rich renderable to the terminal now; its log file copy is written by the listener"""
+        self.tee_console.print(renderable)
 
     def warning(self, msg, *args, **kwargs):
-        kwargs.setdefault("stacklevel", 2)
-        super().warning(msg, *args, **kwargs)
+        if self.isEnabledFor(logging.WARNING):
+            self._log_at(logging.WARNING, msg, args, kwargs)
 
     def error(self, msg, *args, **kwargs):
-        kwargs.setdefault("stacklevel", 2)
-        super().error(msg, *args, **kwargs)
+        if self.isEnabledFor(logging.ERROR):
+            self._log_at(logging.ERROR, msg, args, kwargs)
 
     def critical(self, msg, *args, **kwargs):
-        kwargs.setdefault("stacklevel", 2)
-        super().critical(msg, *args, **kwargs)
+        if self.isEnabledFor(logging.CRITICAL):
+            self._log_at(logging.CRITICAL, msg, args, kwargs)
 
     def debug(self, msg, *args, **kwargs):
-        kwargs.setdefault("stacklevel", 2)
-        super().debug(msg, *args, **kwargs)
+        if self.isEnabledFor(logging.DEBUG):
+            self._log_at(logging.DEBUG, msg, args, kwargs)
 
     def log_error(self, error_message: str) -> None:
         self.info(escape_code_brackets(error_message), style="bold red", level=LogLevel.ERROR)
 
     def log_markdown(self, content: str, title: str | None = None, level=LogLevel.INFO, style=YELLOW_HEX) -> None:
+        if not self.should_log(level):
+            return
         markdown_content = Syntax(
             content,
             lexer="markdown",
@@ -135,6 +315,8 @@ class AgentLogger(logging.Logger, metaclass=Singleton):
             self.info(markdown_content, level=level)
 
     def log_code(self, title: str, content: str, level: int = LogLevel.INFO) -> None:
+        if not self.should_log(level):
+            return
         self.info(
             Panel(
                 Syntax(
@@ -151,6 +333,8 @@ class AgentLogger(logging.Logger, metaclass=Singleton):
         )
 
     def log_rule(self, title: str, level: int = LogLevel.INFO) -> None:
+        if not self.should_log(level):
+            return
         self.info(
             Rule(
                 "[bold]" + title,
@@ -161,6 +345,8 @@ class AgentLogger(logging.Logger, metaclass=Singleton):
         )
 
     def log_task(self, content: str, subtitle: str, title: str | None = None, level: LogLevel = LogLevel.INFO) -> None:
+        if not self.should_log(level):
+            return
         self.info(
             Panel(
                 f"\n[bold]{escape_code_brackets(content)}\n",
@@ -173,7 +359,14 @@ class AgentLogger(logging.Logger, metaclass=Singleton):
         )
 
     def log_messages(self, messages: list[dict], level: LogLevel = LogLevel.DEBUG) -> None:
-        messages_as_string = "\n".join([json.dumps(dict(message), indent=4, ensure_ascii=False) for message in messages])
+        # Serializing a long history is the expensive part; skip it when the dump would be dropped
+        if not self.should_log(level):
+            return
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            messages_as_string = b"\n".join(orjson.dumps(dict(message), option=option, default=str) for message in messages).decode()
+        else:
+            messages_as_string = "\n".join([json.dumps(dict(message), indent=4, ensure_ascii=False) for message in messages])
         self.info(
             Syntax(
                 messages_as_string,
@@ -260,8 +453,21 @@ class AgentLogger(logging.Logger, metaclass=Singleton):
                     managed_agent_tree = parent_tree.add(f"🔄 [bold green]{name}[/bold green]")
                     build_agent_tree(managed_agent_tree, managed_agent, name)
 
-        # Create main tree with enhanced styling
+        def agent_tree_key(agent_obj, agent_name: str) -> tuple:
+            """The tree only shows names and managed-agent nesting, so that is all it depends on."""
+            managed_agents = getattr(agent_obj, 'managed_agents', None) or {}
+            return (agent_name, tuple((name, agent_tree_key(managed_agent, name)) for name, managed_agent in managed_agents.items()))
+
         main_agent_name = getattr(agent, 'name', agent.__class__.__name__)
+        cache_key = (self.console.width, agent_tree_key(agent, main_agent_name))
+        rendered = self._tree_cache.get(cache_key)
+        if rendered is not None:
+            # Reprint the captured output instead of rebuilding and re-laying out the tree
+            self.console.file.write(rendered)
+            self.console.file.flush()
+            return
+
+        # Create main tree with enhanced styling
         main_tree = Tree(
             f"🎯 [bold white]{main_agent_name}[/bold white]",
             guide_style="bright_blue"
@@ -269,6 +475,10 @@ class AgentLogger(logging.Logger, metaclass=Singleton):
         
         # Build and print the agent tree (tools only)
         build_agent_tree(main_tree, agent, main_agent_name)
-        self.console.print(main_tree)
+        with self.console.capture() as capture:
+            self.console.print(main_tree)
+        rendered = self._tree_cache[cache_key] = capture.get()
+        self.console.file.write(rendered)
+        self.console.file.flush()
 
 logger = AgentLogger()
\ No newline at end of file
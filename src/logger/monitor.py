@@ -1,14 +1,38 @@
 from rich.text import Text
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
-from rich.console import Console
+from rich.console import Console, Group
 from rich.live import Live
 from rich.table import Table
 from rich.columns import Columns
 from rich.align import Align
+from array import array
+from collections import deque
 from dataclasses import dataclass, field
 import time
 
+from src.utils.debug_config import is_debug_mode
+
+_STATUS_ICONS = {
+    "thinking": "🧠",
+    "planning": "📋",
+    "searching": "🔍",
+    "analyzing": "📊",
+    "executing": "⚡",
+    "completed": "✅",
+    "error": "❌"
+}
+
+_STATUS_COLORS = {
+    "thinking": "blue",
+    "planning": "cyan",
+    "searching": "yellow",
+    "analyzing": "magenta",
+    "executing": "green",
+    "completed": "green",
+    "error": "red"
+}
+
 @dataclass
 class TokenUsage:
     """
@@ -53,15 +77,27 @@ class Timing:
     def __repr__(self) -> str:
         return f"Timing(start_time={self.start_time}, end_time={self.end_time}, duration={self.duration})"
 
+# Stands in for the token usage of steps that made no model call
+_ZERO_TOKEN_USAGE = TokenUsage(input_tokens=0, output_tokens=0)
+
 class Monitor:
+    # Panels emitted by one update (step, tools used, summary) are logged as one Group
+    MAX_PENDING_PANELS = 8
+    # Recent per-step durations kept for inspection; totals are tracked separately
+    STEP_HISTORY_SIZE = 256
+
     def __init__(self, tracked_model, logger):
-        self.step_durations = []
+        self.step_durations = deque(maxlen=self.STEP_HISTORY_SIZE)
+        self._total_duration = 0.0
+        self._step_count = 0
         self.tracked_model = tracked_model
         self.logger = logger
         self.total_input_token_count = 0
         self.total_output_token_count = 0
         self.current_step = 0
         self.console = Console()
+        # Debug mode is set once at startup, before agents (and their monitors) are built
+        self._debug = is_debug_mode()
         
         # Progress tracking
         self.progress = Progress(
@@ -74,97 +110,133 @@ class Monitor:
             transient=True
         )
         
-        # Tool usage tracking
-        self.tool_usage = {}
+        # Tool usage tracking: name -> slot in the parallel call-count and total-time arrays
+        self._tool_idx = {}
+        self._tool_calls = array('Q')
+        self._tool_time = array('d')
         self.active_tools = set()
 
+        # Panels waiting to be logged together; see _emit
+        self._pending = []
+        # Counters behind the last progress summary; see show_progress_summary
+        self._summary_key = None
+
+    def refresh_debug(self) -> None:
+        """Re-read the global debug flag, for callers that toggle it after the monitor was created"""
+        self._debug = is_debug_mode()
+
+    @property
+    def tool_usage(self) -> dict:
+        """Per-tool call counts and total time, as {name: {"calls": int, "total_time": float}}"""
+        return {
+            tool_name: {"calls": calls, "total_time": total_time}
+            for tool_name, calls, total_time in zip(self._tool_idx, self._tool_calls, self._tool_time)
+        }
+
     def get_total_token_counts(self) -> TokenUsage:
         return TokenUsage(
             input_tokens=self.total_input_token_count,
             output_tokens=self.total_output_token_count,
         )
 
+    def _emit(self, panel) -> None:
+        """Buffer a panel until the caller flushes at the end of its update"""
+        self._pending.append(panel)
+        if len(self._pending) >= self.MAX_PENDING_PANELS:
+            self.flush()
+
+    def flush(self) -> None:
+        """Log all buffered panels with a single Rich print"""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        self.logger.log(pending[0] if len(pending) == 1 else Group(*pending), level=1)
+
     def reset(self):
-        self.step_durations = []
+        self.flush()
+        self.step_durations = deque(maxlen=self.STEP_HISTORY_SIZE)
+        self._total_duration = 0.0
+        self._step_count = 0
         self.total_input_token_count = 0
         self.total_output_token_count = 0
         self.current_step = 0
-        self.tool_usage = {}
+        self._tool_idx = {}
+        self._tool_calls = array('Q')
+        self._tool_time = array('d')
         self.active_tools = set()
+        self._summary_key = None
 
     def start_tool_execution(self, tool_name: str):
         """Start tracking a tool execution"""
         self.active_tools.add(tool_name)
-        if tool_name not in self.tool_usage:
-            self.tool_usage[tool_name] = {"calls": 0, "total_time": 0}
-        self.tool_usage[tool_name]["calls"] += 1
+        i = self._tool_idx.setdefault(tool_name, len(self._tool_idx))
+        if i == len(self._tool_calls):
+            self._tool_calls.append(0)
+            self._tool_time.append(0.0)
+        self._tool_calls[i] += 1
         
         # Show tool execution start (always show in non-debug mode)
-        from src.utils.debug_config import is_debug_mode
-        if not is_debug_mode():
-            self.logger.log(
+        if not self._debug:
+            self._emit(
                 Panel(
                     f"🛠️  [bold cyan]Executing Tool:[/bold cyan] [bold yellow]{tool_name}[/bold yellow]",
                     border_style="cyan",
                     padding=(0, 1)
-                ),
-                level=1
+                )
             )
+        # The tool may prompt the user right away, so the panel must be on screen first
+        self.flush()
 
     def end_tool_execution(self, tool_name: str, duration: float):
         """End tracking a tool execution"""
         self.active_tools.discard(tool_name)
-        if tool_name in self.tool_usage:
-            self.tool_usage[tool_name]["total_time"] += duration
+        i = self._tool_idx.get(tool_name)
+        if i is not None:
+            self._tool_time[i] += duration
         
         # Tool completion messages are now hidden - only execution start is shown
 
     def show_agent_status(self, agent_name: str, status: str, step_info: str = ""):
         """Show current agent status with visual indicators"""
-        status_icons = {
-            "thinking": "🧠",
-            "planning": "📋", 
-            "searching": "🔍",
-            "analyzing": "📊",
-            "executing": "⚡",
-            "completed": "✅",
-            "error": "❌"
-        }
-        
-        icon = status_icons.get(status, "🤖")
-        color = {
-            "thinking": "blue",
-            "planning": "cyan", 
-            "searching": "yellow",
-            "analyzing": "magenta",
-            "executing": "green",
-            "completed": "green",
-            "error": "red"
-        }.get(status, "white")
+        icon = _STATUS_ICONS.get(status, "🤖")
+        color = _STATUS_COLORS.get(status, "white")
         
         status_text = f"{icon} [bold {color}]{agent_name}[/bold {color}] - {status.title()}"
         if step_info:
             status_text += f" | {step_info}"
         
         # Show agent status (always show in non-debug mode)
-        from src.utils.debug_config import is_debug_mode
-        if not is_debug_mode():
-            self.logger.log(
+        if not self._debug:
+            self._emit(
                 Panel(
                     status_text,
                     border_style=color,
                     padding=(0, 1)
-                ),
-                level=1
+                )
             )
+        self.flush()
 
     def show_progress_summary(self):
         """Show a summary of current progress"""
-        if not self.step_durations:
+        # The summary is only shown in debug mode, so don't build a table nobody will see
+        if not self._debug or not self._step_count:
             return
+        
+        # Skip the rebuild and re-render when no counter moved since the last summary
+        summary_key = (
+            self._step_count,
+            self._total_duration,
+            self.total_input_token_count,
+            self.total_output_token_count,
+            self._tool_calls.tobytes(),
+            self._tool_time.tobytes(),
+        )
+        if summary_key == self._summary_key:
+            return
+        self._summary_key = summary_key
             
-        total_time = sum(self.step_durations)
-        avg_step_time = total_time / len(self.step_durations)
+        total_time = self._total_duration
+        avg_step_time = total_time / self._step_count
         
         # Create progress summary table
         table = Table(
@@ -176,22 +248,20 @@ class Monitor:
         table.add_column("Metric", style="cyan", width=40)
         table.add_column("Value", style="yellow", width=80)
         
-        table.add_row("Total Steps", str(len(self.step_durations)))
+        table.add_row("Total Steps", str(self._step_count))
         table.add_row("Total Time", f"{total_time:.2f}s")
         table.add_row("Average Step Time", f"{avg_step_time:.2f}s")
         table.add_row("Input Tokens", f"{self.total_input_token_count:,}")
         table.add_row("Output Tokens", f"{self.total_output_token_count:,}")
         table.add_row("Total Tokens", f"{self.total_input_token_count + self.total_output_token_count:,}")
         
-        if self.tool_usage:
-            table.add_row("Tools Used", str(len(self.tool_usage)))
-            for tool_name, usage in self.tool_usage.items():
-                table.add_row(f"  └─ {tool_name}", f"{usage['calls']} calls ({usage['total_time']:.2f}s)")
+        if self._tool_idx:
+            table.add_row("Tools Used", str(len(self._tool_idx)))
+            for tool_name, calls, tool_time in zip(self._tool_idx, self._tool_calls, self._tool_time):
+                table.add_row(f"  └─ {tool_name}", f"{calls} calls ({tool_time:.2f}s)")
         
-        # Show progress summary (only in debug mode)
-        from src.utils.debug_config import is_debug_mode
-        if is_debug_mode():
-            self.logger.log(table, level=1)
+        self.flush()
+        self.logger.log(table, level=1)
 
     def update_metrics(self, step_log):
         """Update the metrics of the monitor with enhanced UI.
@@ -202,29 +272,23 @@ class Monitor:
         self.current_step += 1
         step_duration = step_log.timing.duration
         self.step_durations.append(step_duration)
+        self._total_duration += step_duration
+        self._step_count += 1
         
-        # Enhanced step information display
-        step_info = f"Step {self.current_step}"
-        if step_log.token_usage is not None:
-            self.total_input_token_count += step_log.token_usage.input_tokens
-            self.total_output_token_count += step_log.token_usage.output_tokens
-            
-            step_info += f" | ⏱️ {step_duration:.2f}s | 📝 {step_log.token_usage.input_tokens:,}→{step_log.token_usage.output_tokens:,} tokens"
-        else:
-            step_info += f" | ⏱️ {step_duration:.2f}s"
+        token_usage = step_log.token_usage or _ZERO_TOKEN_USAGE
+        self.total_input_token_count += token_usage.input_tokens
+        self.total_output_token_count += token_usage.output_tokens
         
         # Show step completion with enhanced formatting (only in debug mode)
-        from src.utils.debug_config import is_debug_mode
-        if is_debug_mode():
-            self.logger.log(
+        if self._debug:
+            self._emit(
                 Panel(
                     f"🎯 [bold green]Step {self.current_step} Completed[/bold green]\n"
                     f"⏱️  Duration: [bold cyan]{step_duration:.2f}s[/bold cyan]\n"
-                    f"📊 Total Steps: [bold yellow]{len(self.step_durations)}[/bold yellow]",
+                    f"📊 Total Steps: [bold yellow]{self._step_count}[/bold yellow]",
                     border_style="green",
                     padding=(0, 1)
-                ),
-                level=1
+                )
             )
         
         # Show tool usage if any tools were called
@@ -235,17 +299,16 @@ class Monitor:
             
             if tool_info:
                 # Show tool usage (only in debug mode)
-                from src.utils.debug_config import is_debug_mode
-                if is_debug_mode():
-                    self.logger.log(
+                if self._debug:
+                    self._emit(
                         Panel(
                             f"Tools Used in Step {self.current_step}:\n" + "\n".join(tool_info),
                             border_style="blue",
                             padding=(0, 1)
-                        ),
-                        level=1
+                        )
                     )
         
         # Show progress summary every 5 steps
         if self.current_step % 5 == 0:
-            self.show_progress_summary()
\ No newline at end of file
+            self.show_progress_summary()
+        self.flush()
\ No newline at end of file
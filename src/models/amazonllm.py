@@ -1,3 +1,4 @@
+import asyncio
 import warnings
 from typing import Dict, List, Optional, Any
 from dataclasses import asdict, dataclass
@@ -11,6 +12,7 @@ from src.models.base import (ApiModel,
 from src.models.message_manager import (
     MessageManager
 )
+from src.models.concurrency import get_llm_semaphore
 
 
 class AmazonBedrockServerModel(ApiModel):
@@ -174,7 +176,8 @@ class AmazonBedrockServerModel(ApiModel):
         )
 
         # self.client is created in ApiModel class
-        response = self.client.converse(**completion_kwargs)
+        async with get_llm_semaphore():
+            response = await asyncio.to_thread(self.client.converse, **completion_kwargs)
 
         # Get first message
         response["output"]["message"]["content"] = response["output"]["message"]["content"][0]["text"]
@@ -194,5 +197,6 @@ class AmazonBedrockServerModel(ApiModel):
         """
         Call the model with the given arguments.
         This is a convenience method that calls `generate` with the same arguments.
+        Concurrent requests are bounded by the global LLM semaphore, which `generate` acquires.
         """
         return await self.generate(*args, **kwargs)
\ No newline at end of file
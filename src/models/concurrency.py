@@ -0,0 +1,20 @@
+"""
+Process-wide limit on in-flight LLM requests.
+Managed agents run concurrently, so each API model's `generate` holds this semaphore around
+its request (backends with blocking clients run it in a worker thread so requests overlap), and
+agents hold it for the length of a `generate_stream` stream.
+"""
+import asyncio
+
+DEFAULT_CONCURRENCY = 8
+
+_llm_semaphore = asyncio.Semaphore(DEFAULT_CONCURRENCY)
+
+def set_llm_concurrency(concurrency: int):
+    """Resize the global LLM semaphore (call before any request is in flight)."""
+    global _llm_semaphore
+    _llm_semaphore = asyncio.Semaphore(max(1, int(concurrency)))
+
+def get_llm_semaphore() -> asyncio.Semaphore:
+    """Get the global LLM semaphore."""
+    return _llm_semaphore
@@ -1,3 +1,4 @@
+import asyncio
 import warnings
 from typing import Dict, List, Optional, Any
 from dataclasses import asdict, dataclass
@@ -12,6 +13,7 @@ from src.models.base import (ApiModel,
 from src.models.message_manager import (
     MessageManager
 )
+from src.models.concurrency import get_llm_semaphore
 
 STRUCTURED_GENERATION_PROVIDERS = ["cerebras", "fireworks-ai"]
 
@@ -254,7 +256,8 @@ class InferenceClientModel(ApiModel):
             custom_role_conversions=self.custom_role_conversions,
             **kwargs,
         )
-        response = self.client.chat_completion(**completion_kwargs)
+        async with get_llm_semaphore():
+            response = await asyncio.to_thread(self.client.chat_completion, **completion_kwargs)
 
         self._last_input_token_count = response.usage.prompt_tokens
         self._last_output_token_count = response.usage.completion_tokens
@@ -271,6 +274,7 @@ class InferenceClientModel(ApiModel):
         """
         Call the model with the given arguments.
         This is a convenience method that calls `generate` with the same arguments.
+        Concurrent requests are bounded by the global LLM semaphore, which `generate` acquires.
         """
         return await self.generate(*args, **kwargs)
 
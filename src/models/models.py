@@ -16,6 +16,8 @@ from src.models.restful import (RestfulModel,
                                 RestfulImagenModel,
                                 RestfulVeoPridictModel,
                                 RestfulVeoFetchModel)
+from src.models.concurrency import set_llm_concurrency
+from src.models.response_cache import set_response_cache
 from src.utils import Singleton
 from src.proxy.local_proxy import HTTP_CLIENT, ASYNC_HTTP_CLIENT
 
@@ -27,7 +29,13 @@ class ModelManager(metaclass=Singleton):
     def __init__(self):
         self.registed_models: Dict[str, Any] = {}
         
-    def init_models(self, use_local_proxy: bool = False):
+    def init_models(self,
+                    use_local_proxy: bool = False,
+                    concurrency: int | None = None,
+                    response_cache_path: str | None = None):
+        if concurrency is not None:
+            set_llm_concurrency(concurrency)
+        set_response_cache(response_cache_path)
         self._register_openai_models(use_local_proxy=use_local_proxy)
         self._register_anthropic_models(use_local_proxy=use_local_proxy)
         self._register_google_models(use_local_proxy=use_local_proxy)
@@ -11,6 +11,8 @@ from src.models.base import (ApiModel,
                              ChatMessageStreamDelta,
                              ChatMessageToolCallStreamDelta)
 from src.models.message_manager import MessageManager
+from src.models.concurrency import get_llm_semaphore
+from src.models.response_cache import get_response_cache
 
 class OpenAIServerModel(ApiModel):
     """This model connects to an OpenAI-compatible API server.
@@ -222,22 +224,31 @@ class OpenAIServerModel(ApiModel):
             **kwargs,
         )
 
-        response = await self.client.chat.completions.create(**completion_kwargs)
+        cache = get_response_cache()
+        cache_key = cache.key(completion_kwargs) if cache is not None else None
+        if cache_key is not None:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        async with get_llm_semaphore():
+            response = await self.client.chat.completions.create(**completion_kwargs)
 
         self._last_input_token_count = response.usage.prompt_tokens
         self._last_output_token_count = response.usage.completion_tokens
-        return ChatMessage.from_dict(
-            response.choices[0].message.model_dump(include={"role", "content", "tool_calls"}),
-            raw=response,
-            token_usage=TokenUsage(
-                input_tokens=response.usage.prompt_tokens,
-                output_tokens=response.usage.completion_tokens,
-            ),
+        message = response.choices[0].message.model_dump(include={"role", "content", "tool_calls"})
+        token_usage = TokenUsage(
+            input_tokens=response.usage.prompt_tokens,
+            output_tokens=response.usage.completion_tokens,
         )
+        if cache_key is not None:
+            cache.put(cache_key, message, token_usage)
+        return ChatMessage.from_dict(message, raw=response, token_usage=token_usage)
 
     async def __call__(self, *args, **kwargs) -> ChatMessage:
         """
         Call the model with the given arguments.
         This is a convenience method that calls `generate` with the same arguments.
+        Concurrent requests are bounded by the global LLM semaphore, which `generate` acquires.
         """
         return await self.generate(*args, **kwargs)
\ No newline at end of file
@@ -0,0 +1,67 @@
+"""
+Content-addressed cache of chat completions.
+When enabled, identical requests (same model, messages, tools and sampling params) are answered
+from a local SQLite file instead of the API, which makes repeated development runs near-instant.
+"""
+import os
+import json
+import hashlib
+import sqlite3
+from typing import Any, Dict, Optional
+
+from src.models.base import ChatMessage, TokenUsage
+
+# Connection details do not change the answer, and the key must not depend on secrets
+_IGNORED_KEYS = ("api_key", "api_base", "http_client")
+
+
+class ResponseCache:
+    def __init__(self, cache_path: str):
+        self.cache_path = cache_path
+        os.makedirs(os.path.dirname(cache_path) or ".", exist_ok=True)
+        self.connection = sqlite3.connect(cache_path, isolation_level=None, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, response TEXT NOT NULL)")
+
+    @staticmethod
+    def key(completion_kwargs: Dict[str, Any]) -> str:
+        """Hash the request payload sent to the API."""
+        payload = {k: v for k, v in completion_kwargs.items() if k not in _IGNORED_KEYS}
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def get(self, key: str) -> Optional[ChatMessage]:
+        row = self.connection.execute("SELECT response FROM cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        data = json.loads(row[0])
+        usage = data.pop("token_usage", None)
+        return ChatMessage.from_dict(
+            data,
+            token_usage=TokenUsage(**usage) if usage else None,
+        )
+
+    def put(self, key: str, message: Dict[str, Any], token_usage: Optional[TokenUsage] = None) -> None:
+        """Store a raw message dict (role, content, tool_calls) for the request key."""
+        data = dict(message)
+        if token_usage is not None:
+            data["token_usage"] = {
+                "input_tokens": token_usage.input_tokens,
+                "output_tokens": token_usage.output_tokens,
+            }
+        self.connection.execute(
+            "INSERT OR REPLACE INTO cache (key, response) VALUES (?, ?)",
+            (key, json.dumps(data, default=str)),
+        )
+
+
+_response_cache: Optional[ResponseCache] = None
+
+def set_response_cache(cache_path: Optional[str]):
+    """Enable the response cache at the given path, or disable it with None."""
+    global _response_cache
+    _response_cache = ResponseCache(cache_path) if cache_path else None
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """Get the active response cache, if any."""
+    return _response_cache
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Dict, List, Optional, Any
 from collections.abc import Generator
 from openai.types.chat import ChatCompletion
@@ -14,6 +15,7 @@ from src.models.base import (ApiModel,
 from src.models.message_manager import MessageManager
 from src.logger import TokenUsage, logger
 from src.utils import encode_image_base64
+from src.models.concurrency import get_llm_semaphore
 
 
 class RestfulClient():
@@ -422,7 +424,8 @@ class RestfulModel(ApiModel):
         )
 
         # Async call to the LiteLLM client for completion
-        response = self.client.completion(**completion_kwargs)
+        async with get_llm_semaphore():
+            response = await asyncio.to_thread(self.client.completion, **completion_kwargs)
 
         response = ChatCompletion.model_validate(response)
 
@@ -441,6 +444,7 @@ class RestfulModel(ApiModel):
         """
         Call the model with the given arguments.
         This is a convenience method that calls `generate` with the same arguments.
+        Concurrent requests are bounded by the global LLM semaphore, which `generate` acquires.
         """
         return await self.generate(*args, **kwargs)
 
@@ -2,4 +2,13 @@ from mmengine.registry import Registry
 
 DATASET = Registry('dataset', locations=['src.dataset'])
 TOOL = Registry('tool', locations=['src.tools'])
-AGENT = Registry('agent', locations=['src.agent'])
\ No newline at end of file
+# src.agent re-exports lazily, so list the modules that register agents explicitly
+AGENT = Registry('agent', locations=[
+    'src.agent.browser_use_agent',
+    'src.agent.deep_analyzer_agent',
+    'src.agent.deep_researcher_agent',
+    'src.agent.general_agent',
+    'src.agent.planning_agent',
+    'src.agent.scoping_agent',
+    'src.agent.vector_agent',
+])
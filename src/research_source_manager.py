@@ -7,10 +7,14 @@ Users can select one, two, or all three sources for their research.
 
 import os
 import json
-from typing import Dict, List, Set, Optional, Any
+import time
+from typing import Dict, List, Set, Optional, Any, Tuple
 from dataclasses import dataclass
 from pathlib import Path
-from enum import Enum
+from enum import Enum, IntFlag
+from itertools import chain
+
+from src.utils.debug_config import is_debug_mode
 
 # Import logger with fallback
 try:
@@ -29,6 +33,25 @@ class SourceType(Enum):
     MCP = "mcp"
 
 
+class SourceFlag(IntFlag):
+    """Bitmask of selected source types, for single-operation capability checks"""
+    WEB = 1
+    VECTOR_DB = 2
+    MCP = 4
+
+    @classmethod
+    def from_ids(cls, source_ids) -> "SourceFlag":
+        mask = cls(0)
+        for source_id in source_ids:
+            if source_id in _SOURCE_FLAGS:
+                mask |= _SOURCE_FLAGS[source_id]
+        return mask
+
+
+_SOURCE_FLAGS = {source.value: SourceFlag[source.name] for source in SourceType}
+_PARALLEL_SOURCES = SourceFlag.WEB | SourceFlag.VECTOR_DB
+
+
 @dataclass
 class SourceConfig:
     """Configuration for a research source"""
@@ -58,17 +81,52 @@ class ResearchSourceManager:
     - Web Research: Internet search and information gathering
     - Vector Database: Local document search using embeddings
     - MCP Tools: Model Context Protocol integrations
+    
+    Source availability is cached for AVAILABILITY_TTL seconds, since one status render asks
+    about the same sources many times. The selected-sources and status views are built on first
+    read and reused until the selection (or, for the status, source availability) changes.
     """
     
+    AVAILABILITY_TTL = 2.0
+    # Always enabled, whatever sources are selected
+    CORE_TOOLS = ("planning_tool", "deep_analyzer_tool")
+    CORE_AGENTS = ("deep_analyzer_agent",)
+    
     def __init__(self, config_file: str = "research_sources.json"):
         self.config_file = config_file
         self.sources: Dict[str, SourceConfig] = {}
+        self._enabled_tools: Tuple[str, ...] = self.CORE_TOOLS
+        self._enabled_agents: Tuple[str, ...] = self.CORE_AGENTS
+        self._selected_mask = SourceFlag(0)
+        self._selected_view: Optional[Dict[str, SourceConfig]] = None
+        self._status_key: Optional[tuple] = None
+        self._status_view: Dict[str, Dict[str, Any]] = {}
         self.selected_sources: Set[str] = set()
         self.user_preferences = {}
+        self._availability_cache: Dict[str, tuple] = {}
+        self._last_saved: Optional[str] = None
         
         self._initialize_core_sources()
         self._load_user_preferences()
     
+    @property
+    def selected_sources(self) -> Set[str]:
+        return self._selected_sources
+    
+    @selected_sources.setter
+    def selected_sources(self, source_ids: Set[str]):
+        # Every (re)selection goes through here, so the enabled tools/agents are derived once per change
+        self._selected_sources = source_ids
+        self._selected_mask = SourceFlag.from_ids(source_ids)
+        self._selected_view = None
+        self._recompute_enabled()
+    
+    def _recompute_enabled(self):
+        """Materialize the deduplicated, order-preserving tool and agent names for the selection"""
+        selected = [self.sources[sid] for sid in self._selected_sources if sid in self.sources]
+        self._enabled_tools = tuple(dict.fromkeys(chain(self.CORE_TOOLS, *(s.tools for s in selected))))
+        self._enabled_agents = tuple(dict.fromkeys(chain(self.CORE_AGENTS, *(s.agents for s in selected))))
+    
     def _initialize_core_sources(self):
         """Initialize the 3 core research sources"""
         
@@ -119,7 +177,6 @@ class ResearchSourceManager:
                         # Validate saved sources against current sources
                         valid_sources = [s for s in saved_sources if s in self.sources]
                         self.selected_sources = set(valid_sources)
-                        from src.utils.debug_config import is_debug_mode
                         if is_debug_mode():
                             logger.info(f"Loaded {len(valid_sources)} saved research sources")
                     else:
@@ -147,7 +204,6 @@ class ResearchSourceManager:
             defaults.append("mcp")
         
         self.selected_sources = set(defaults)
-        from src.utils.debug_config import is_debug_mode
         if is_debug_mode():
             logger.info(f"Set default research sources: {', '.join(defaults)}")
     
@@ -156,21 +212,44 @@ class ResearchSourceManager:
         try:
             data = {
                 'preferences': self.user_preferences,
-                'selected_sources': list(self.selected_sources),
+                'selected_sources': sorted(self.selected_sources),
                 'last_updated': str(Path().resolve()),
                 'version': '1.0'
             }
             
-            with open(self.config_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Serialize once; an unchanged selection does not touch the file at all
+            content = json.dumps(data, indent=2)
+            if content == self._last_saved:
+                return
+            
+            # Single buffered write to a temp file, then an atomic rename over the old one
+            tmp_file = self.config_file + ".tmp"
+            with open(tmp_file, 'w', buffering=65536) as f:
+                f.write(content)
+            os.replace(tmp_file, self.config_file)
+            self._last_saved = content
                 
             logger.debug(f"Saved user preferences with {len(self.selected_sources)} sources")
             
         except Exception as e:
             logger.warning(f"Could not save user preferences: {e}")
     
+    def invalidate_availability(self):
+        """Drop cached availability, e.g. after a vector database was created or removed"""
+        self._availability_cache.clear()
+    
     def _is_source_available(self, source_id: str) -> bool:
         """Check if a research source is available and functional"""
+        now = time.monotonic()
+        cached = self._availability_cache.get(source_id)
+        if cached is not None and now - cached[0] < self.AVAILABILITY_TTL:
+            return cached[1]
+        
+        available = self._check_source_available(source_id)
+        self._availability_cache[source_id] = (now, available)
+        return available
+    
+    def _check_source_available(self, source_id: str) -> bool:
         if source_id not in self.sources:
             return False
         
@@ -202,10 +281,14 @@ class ResearchSourceManager:
     
     def get_source_status(self) -> Dict[str, Dict[str, Any]]:
         """Get detailed status of all sources"""
+        availability = tuple(self._is_source_available(source_id) for source_id in self.sources)
+        status_key = (self._selected_mask, availability)
+        if status_key == self._status_key:
+            return self._status_view
+        
         status = {}
         
-        for source_id, source in self.sources.items():
-            is_available = self._is_source_available(source_id)
+        for (source_id, source), is_available in zip(self.sources.items(), availability):
             is_selected = source_id in self.selected_sources
             
             status[source_id] = {
@@ -220,6 +303,8 @@ class ResearchSourceManager:
                 'status_emoji': "✅" if (is_available and is_selected) else "⚠️" if is_available else "❌"
             }
         
+        self._status_key = status_key
+        self._status_view = status
         return status
     
     def select_sources(self, source_ids: List[str]) -> bool:
@@ -234,7 +319,8 @@ class ResearchSourceManager:
             logger.error(f"Invalid source IDs: {invalid_sources}")
             return False
         
-        # Check availability
+        # Check availability against the current filesystem state
+        self.invalidate_availability()
         unavailable_sources = [sid for sid in source_ids if not self._is_source_available(sid)]
         if unavailable_sources:
             logger.warning(f"Unavailable sources will be skipped: {unavailable_sources}")
@@ -252,62 +338,63 @@ class ResearchSourceManager:
     
     def get_selected_sources(self) -> Dict[str, SourceConfig]:
         """Get currently selected research sources"""
-        return {sid: self.sources[sid] for sid in self.selected_sources if sid in self.sources}
+        if self._selected_view is None:
+            self._selected_view = {sid: self.sources[sid] for sid in self.selected_sources if sid in self.sources}
+        return self._selected_view
     
-    def get_enabled_tools(self) -> List[str]:
-        """Get list of tools for selected sources"""
-        tools = ["planning_tool", "deep_analyzer_tool"]  # Always include core tools
-        
-        for source_id in self.selected_sources:
-            if source_id in self.sources:
-                tools.extend(self.sources[source_id].tools)
-        
-        return list(set(tools))  # Remove duplicates
+    def get_enabled_tools(self) -> Tuple[str, ...]:
+        """Get the tools for selected sources, core tools first; recomputed only when the selection changes"""
+        return self._enabled_tools
     
-    def get_enabled_agents(self) -> List[str]:
-        """Get list of agents for selected sources"""
-        agents = ["deep_analyzer_agent"]  # Always include core analysis agent
-        
-        for source_id in self.selected_sources:
-            if source_id in self.sources:
-                agents.extend(self.sources[source_id].agents)
-        
-        return list(set(agents))  # Remove duplicates
+    def get_enabled_agents(self) -> Tuple[str, ...]:
+        """Get the agents for selected sources, core agent first; recomputed only when the selection changes"""
+        return self._enabled_agents
     
     def get_research_capabilities(self) -> Dict[str, Any]:
         """Get comprehensive research capabilities based on selected sources"""
         selected = self.get_selected_sources()
+        mask = self._selected_mask
         
         capabilities = {
             'sources_count': len(selected),
-            'total_tools': len(self.get_enabled_tools()),
-            'total_agents': len(self.get_enabled_agents()),
-            'can_search_web': 'web' in self.selected_sources,
-            'can_search_local': 'vector_db' in self.selected_sources,
-            'can_use_mcp': 'mcp' in self.selected_sources,
-            'has_parallel_processing': 'vector_db' in self.selected_sources and 'web' in self.selected_sources,
+            'total_tools': len(self._enabled_tools),
+            'total_agents': len(self._enabled_agents),
+            'enabled_tools': list(self._enabled_tools),
+            'enabled_agents': list(self._enabled_agents),
+            'can_search_web': bool(mask & SourceFlag.WEB),
+            'can_search_local': bool(mask & SourceFlag.VECTOR_DB),
+            'can_use_mcp': bool(mask & SourceFlag.MCP),
+            'has_parallel_processing': (mask & _PARALLEL_SOURCES) == _PARALLEL_SOURCES,
             'source_names': [s.name for s in selected.values()],
             'source_descriptions': [s.description for s in selected.values()]
         }
         
         return capabilities
     
-    def create_dynamic_agent_config(self, base_config: Dict[str, Any]) -> Dict[str, Any]:
+    def build_shared_overlay(self) -> Dict[str, Any]:
+        """Build the source-derived agent config fields, which are the same for every agent"""
+        capabilities = self.get_research_capabilities()
+        return {
+            'tools': capabilities['enabled_tools'],
+            'managed_agents': capabilities['enabled_agents'],
+            'research_sources': {
+                'enabled_sources': list(self.selected_sources),
+                'capabilities': capabilities
+            }
+        }
+    
+    def create_dynamic_agent_config(self, base_config: Dict[str, Any],
+                                    overlay: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Create dynamic agent configuration based on selected sources"""
-        config = base_config.copy()
+        if overlay is None:
+            overlay = self.build_shared_overlay()
         
-        # Update tools list
-        config['tools'] = self.get_enabled_tools()
+        # Update tools list and add source information
+        config = {**base_config, 'tools': overlay['tools'], 'research_sources': overlay['research_sources']}
         
         # Update managed agents list if this is a planning agent
         if 'managed_agents' in config:
-            config['managed_agents'] = self.get_enabled_agents()
-        
-        # Add source information
-        config['research_sources'] = {
-            'enabled_sources': list(self.selected_sources),
-            'capabilities': self.get_research_capabilities()
-        }
+            config['managed_agents'] = overlay['managed_agents']
         
         return config
     
@@ -352,7 +439,6 @@ def get_research_source_manager() -> ResearchSourceManager:
     
     if _source_manager is None:
         _source_manager = ResearchSourceManager()
-        from src.utils.debug_config import is_debug_mode
         if is_debug_mode():
             logger.info("Research source manager initialized")
     
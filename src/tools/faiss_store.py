@@ -0,0 +1,241 @@
+import os
+import json
+import hashlib
+import sqlite3
+from collections import OrderedDict
+from typing import List, Dict, Tuple
+
+import numpy as np
+import faiss
+from langchain_core.documents import Document
+
+
+class FaissVectorStore:
+    """
+    FAISS-backed vector store persisted as `index.faiss` plus a SQLite sidecar (`meta.sqlite`).
+
+    Vectors are appended to an HNSW index; chunk text and metadata live in SQLite keyed by the
+    vector's position in the index. Read-only stores load the index but never write it back.
+    `storage_dtype` selects how vectors are stored: "fp32", "fp16" (half the size) or "int8"
+    (scalar-quantized, a quarter of the size).
+    Scores are squared L2 distances (lower is more relevant), matching the previous Chroma backend.
+    New indexes default to `metric="ip"`: vectors are unit-normalized once on insert and searched by
+    inner product, and scores are converted back with ||a - b||^2 = 2 - 2 a.b. Indexes persisted
+    with the L2 metric keep using it.
+    Repeated searches for the same (fp16-rounded) query vector and k are served from an LRU cache
+    that is invalidated whenever vectors are added.
+    """
+
+    INDEX_FILE = "index.faiss"
+    META_FILE = "meta.sqlite"
+    FETCH_BATCH_SIZE = 900
+    STORAGE_DTYPES = ("fp32", "fp16", "int8")
+    METRICS = {"l2": faiss.METRIC_L2, "ip": faiss.METRIC_INNER_PRODUCT}
+    SEARCH_CACHE_SIZE = 1024
+
+    def __init__(self,
+                 db_path: str,
+                 embeddings,
+                 read_only: bool = False,
+                 storage_dtype: str = "fp16",
+                 hnsw_m: int = 32,
+                 ef_search: int = 64,
+                 metric: str = "ip"):
+        self.db_path = db_path
+        self.embeddings = embeddings
+        self.read_only = read_only
+        if storage_dtype not in self.STORAGE_DTYPES:
+            raise ValueError(f"Unsupported storage_dtype '{storage_dtype}', should be one of: {', '.join(self.STORAGE_DTYPES)}")
+        self.storage_dtype = storage_dtype
+        if metric not in self.METRICS:
+            raise ValueError(f"Unsupported metric '{metric}', should be one of: {', '.join(self.METRICS)}")
+        self.metric = metric
+        self.hnsw_m = hnsw_m
+        self.ef_search = ef_search
+
+        self.index_path = os.path.join(db_path, self.INDEX_FILE)
+        self.meta_path = os.path.join(db_path, self.META_FILE)
+
+        os.makedirs(db_path, exist_ok=True)
+        self.connection = sqlite3.connect(self.meta_path, check_same_thread=False)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS chunks (id INTEGER PRIMARY KEY, content TEXT NOT NULL, metadata TEXT NOT NULL)"
+        )
+        self.connection.commit()
+
+        self.index = self._load_index() if os.path.exists(self.index_path) else None
+        self._dirty = False
+        self._generation = 0
+        self._search_cache: "OrderedDict[tuple, List[Tuple[Document, float]]]" = OrderedDict()
+
+    @classmethod
+    def exists(cls, db_path: str) -> bool:
+        """Check whether a persisted index exists at the given path"""
+        return os.path.exists(os.path.join(db_path, cls.INDEX_FILE))
+
+    def _load_index(self):
+        """Load the persisted index into memory"""
+        # IO_FLAG_MMAP only maps IVF inverted lists; HNSW indexes are always read in full
+        return faiss.read_index(self.index_path)
+
+    def _create_index(self, dimension: int):
+        """Create an empty HNSW index for vectors of the given dimension"""
+        metric = self.METRICS[self.metric]
+        if self.storage_dtype == "fp16":
+            return faiss.IndexHNSWSQ(dimension, faiss.ScalarQuantizer.QT_fp16, self.hnsw_m, metric)
+        if self.storage_dtype == "int8":
+            return faiss.IndexHNSWSQ(dimension, faiss.ScalarQuantizer.QT_8bit, self.hnsw_m, metric)
+        return faiss.IndexHNSWFlat(dimension, self.hnsw_m, metric)
+
+    @property
+    def _inner_product(self) -> bool:
+        """Whether the index searches unit-normalized vectors by inner product"""
+        return self.index is not None and self.index.metric_type == faiss.METRIC_INNER_PRODUCT
+
+    @staticmethod
+    def _normalized(vectors: np.ndarray) -> np.ndarray:
+        """Return a unit-normalized float32 copy of the vectors"""
+        vectors = np.array(vectors, dtype=np.float32, order="C", copy=True)
+        faiss.normalize_L2(vectors)
+        return vectors
+
+    @property
+    def ntotal(self) -> int:
+        return self.index.ntotal if self.index is not None else 0
+
+    def add_vectors(self, vectors: np.ndarray, documents: List[Document]) -> None:
+        """Append pre-computed vectors and their documents to the store"""
+        if self.read_only:
+            raise ValueError("Cannot add documents to a read-only vector store")
+        if len(documents) == 0:
+            return
+
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        if self.index is None:
+            self.index = self._create_index(vectors.shape[1])
+        if self._inner_product:
+            vectors = self._normalized(vectors)
+        if not self.index.is_trained:
+            # int8 quantization fixes its per-dimension ranges at training time. Unit-length embeddings
+            # lie in [-1, 1] on every dimension, so train on those bounds (widened by the batch if it
+            # exceeds them) rather than on whatever range a small first batch happens to span
+            bounds = np.repeat(np.array([[-1.0], [1.0]], dtype=np.float32), vectors.shape[1], axis=1)
+            self.index.train(np.vstack([bounds, vectors]))
+
+        start_id = self.index.ntotal
+        self.index.add(vectors)
+
+        rows = [
+            (start_id + offset, document.page_content, json.dumps(document.metadata, default=str))
+            for offset, document in enumerate(documents)
+        ]
+        self.connection.executemany("INSERT OR REPLACE INTO chunks (id, content, metadata) VALUES (?, ?, ?)", rows)
+        self.connection.commit()
+        self._dirty = True
+        # Cached search results may no longer be the nearest neighbours
+        self._generation += 1
+        self._search_cache.clear()
+
+    def add_documents(self, documents: List[Document]) -> None:
+        """Embed documents and append them to the store"""
+        vectors = self.embeddings.embed_documents([document.page_content for document in documents])
+        self.add_vectors(np.asarray(vectors, dtype=np.float32), documents)
+
+    def save(self) -> None:
+        """Write the index to disk if it changed since the last save"""
+        if self.index is None or not self._dirty:
+            return
+        # Write beside the old index and rename over it, so an interrupted save never leaves a
+        # truncated index next to an already-committed SQLite sidecar
+        tmp_path = self.index_path + ".tmp"
+        faiss.write_index(self.index, tmp_path)
+        os.replace(tmp_path, self.index_path)
+        self._dirty = False
+
+    def _fetch_documents(self, ids: List[int]) -> Dict[int, Document]:
+        """Fetch documents for the given index positions from the SQLite sidecar"""
+        documents = {}
+        # Stay under SQLite's bound-parameter limit for large k
+        for start in range(0, len(ids), self.FETCH_BATCH_SIZE):
+            batch_ids = ids[start:start + self.FETCH_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch_ids))
+            rows = self.connection.execute(
+                f"SELECT id, content, metadata FROM chunks WHERE id IN ({placeholders})", batch_ids
+            ).fetchall()
+            for row_id, content, metadata in rows:
+                documents[row_id] = Document(page_content=content, metadata=json.loads(metadata))
+        return documents
+
+    def _search_cache_key(self, query: np.ndarray, k: int) -> tuple:
+        # Round to fp16 so re-embeddings of the same text that differ in the last bits share an entry
+        return (
+            hashlib.blake2b(query.astype(np.float16).tobytes(), digest_size=16).digest(),
+            k,
+            self._generation,
+        )
+
+    def similarity_search_by_vector_with_score(self, vector, k: int = 5) -> List[Tuple[Document, float]]:
+        """Return the k nearest documents to a query vector with their distances"""
+        return self.similarity_search_by_vectors_with_score([vector], k=k)[0]
+
+    def similarity_search_by_vectors_with_score(self, vectors, k: int = 5) -> List[List[Tuple[Document, float]]]:
+        """Return the k nearest documents to each query vector, searching all cache misses at once"""
+        queries = np.asarray(vectors, dtype=np.float32)
+        k = min(k, self.ntotal)
+        if k <= 0 or len(queries) == 0:
+            return [[] for _ in range(len(queries))]
+
+        cache_keys = [self._search_cache_key(query, k) for query in queries]
+        results: List[List[Tuple[Document, float]]] = [None] * len(queries)
+        misses = []
+        for position, cache_key in enumerate(cache_keys):
+            cached = self._search_cache.get(cache_key)
+            if cached is not None:
+                self._search_cache.move_to_end(cache_key)
+                results[position] = list(cached)
+            else:
+                misses.append(position)
+
+        if misses:
+            if hasattr(self.index, "hnsw"):
+                self.index.hnsw.efSearch = max(self.ef_search, k)
+
+            if self._inner_product:
+                similarities, labels = self.index.search(self._normalized(queries[misses]), k)
+                distances = 2.0 - 2.0 * similarities
+            else:
+                distances, labels = self.index.search(np.ascontiguousarray(queries[misses]), k)
+
+            ids = sorted({int(label) for label in labels.ravel() if label >= 0})
+            documents = self._fetch_documents(ids) if ids else {}
+
+            for position, row_distances, row_labels in zip(misses, distances, labels):
+                row_results = [
+                    (documents[int(label)], float(distance))
+                    for distance, label in zip(row_distances, row_labels)
+                    if int(label) in documents
+                ]
+                self._search_cache[cache_keys[position]] = row_results
+                results[position] = list(row_results)
+            while len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+
+        return results
+
+    def similarity_search_with_score(self, query: str, k: int = 5) -> List[Tuple[Document, float]]:
+        """Return the k nearest documents to a text query with their distances"""
+        if self.index is None:
+            return []
+        return self.similarity_search_by_vector_with_score(self.embeddings.embed_query(query), k=k)
+
+    def similarity_search_batch_with_score(self, queries: List[str], k: int = 5) -> List[List[Tuple[Document, float]]]:
+        """Embed several text queries with one embeddings request and search them together"""
+        if self.index is None or not queries:
+            return [[] for _ in queries]
+        return self.similarity_search_by_vectors_with_score(self.embeddings.embed_documents(list(queries)), k=k)
+
+    def close(self) -> None:
+        """Persist pending changes and close the SQLite connection"""
+        if not self.read_only:
+            self.save()
+        self.connection.close()
@@ -75,6 +75,8 @@ class PlanningTool(AsyncTool):
 
     output_type = "any"
 
+    _shareable = False  # Plans belong to one agent, so never reuse an instance across agents
+
     plans: dict = {}  # Dictionary to store plans by plan_id
     _current_plan_id: Optional[str] = None  # Track the current active plan
 
@@ -5,27 +5,31 @@ from dotenv import load_dotenv
 load_dotenv(verbose=True)
 
 from typing import List
-from firecrawl import FirecrawlApp
 import asyncio
 
 from src.tools.search.base import WebSearchEngine, SearchItem
+from src.utils.http_client import get_http_client
 
-def search(params):
+FIRECRAWL_API_URL = os.getenv("FIRECRAWL_API_URL", "https://api.firecrawl.dev").rstrip("/")
+
+async def search(params):
     """
-    Perform a Google search using the provided parameters.
+    Perform a Firecrawl search using the provided parameters.
     Returns a list of SearchItem objects.
     """
-    app = FirecrawlApp(
-        api_key=os.getenv("FIRECRAWL_API_KEY"),
-    )
-
-    response = app.search(
-        query=params["q"],
-        limit= params.get("num", 10),
-        tbs= params.get("tbs", ""),
+    client = get_http_client()
+    response = await client.post(
+        f"{FIRECRAWL_API_URL}/v1/search",
+        headers={"Authorization": f"Bearer {os.getenv('FIRECRAWL_API_KEY', '')}"},
+        json={
+            "query": params["q"],
+            "limit": params.get("num", 10),
+            "tbs": params.get("tbs", ""),
+        },
     )
+    response.raise_for_status()
 
-    data = response.data
+    data = response.json().get("data", [])
 
     results = []
     for item in data:
@@ -58,7 +62,7 @@ class FirecrawlSearchEngine(WebSearchEngine):
         if filter_year is not None:
             params["tbs"] = f"cdr:1,cd_min:01/01/{filter_year},cd_max:12/31/{filter_year}"
 
-        results = search(params)
+        results = await search(params)
 
         return results
 
@@ -1,19 +1,21 @@
 import os
+import shutil
 import asyncio
 import time
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union
-from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple, Union
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
 import hashlib
 import json
 import mimetypes
+import mmap
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
 try:
     from langchain_community.document_loaders import (
         PyMuPDFLoader, 
-        TextLoader, 
         UnstructuredCSVLoader, 
         UnstructuredExcelLoader,
         UnstructuredMarkdownLoader, 
@@ -22,8 +24,10 @@ try:
     )
     from langchain.text_splitter import RecursiveCharacterTextSplitter
     from langchain_openai import OpenAIEmbeddings
-    from langchain_chroma import Chroma
+    from langchain_core.documents import Document
     from langchain_community.vectorstores.utils import filter_complex_metadata
+    from src.tools.faiss_store import FaissVectorStore
+    from src.tools.vector_embeddings import AsyncBatchEmbedder, EmbeddingCache
     LANGCHAIN_AVAILABLE = True
 except ImportError:
     LANGCHAIN_AVAILABLE = False
@@ -137,19 +141,188 @@ class DocumentMetadata:
             is_symlink=path_obj.is_symlink()
         )
 
+
+def compute_file_hash(file_path: str) -> str:
+    """Generate MD5 hash of file for change detection"""
+    hash_md5 = hashlib.md5()
+    try:
+        with open(file_path, "rb") as f:
+            # Hash straight from the page cache instead of copying 4 KB reads into Python
+            if os.fstat(f.fileno()).st_size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    hash_md5.update(mm)
+        return hash_md5.hexdigest()
+    except Exception as e:
+        logger.warning(f"Could not hash file {file_path}: {e}")
+        return ""
+
+
+class MmapTextLoader:
+    """
+    Text loader that memory-maps the file and yields it as line-aligned segments.
+
+    The file is never read into one Python string: each segment (about `segment_size`
+    bytes, cut at a newline so multi-byte characters stay intact) becomes its own
+    Document, so peak memory per worker is bounded by the segment size.
+    """
+
+    def __init__(self, file_path: str, encoding: str = "utf-8", segment_size: int = 1 << 20):
+        self.file_path = file_path
+        self.encoding = encoding
+        self.segment_size = segment_size
+
+    def lazy_load(self):
+        with open(self.file_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                start = 0
+                size = len(mm)
+                while start < size:
+                    end = min(start + self.segment_size, size)
+                    if end < size:
+                        newline = mm.rfind(b"\n", start, end)
+                        if newline != -1:
+                            end = newline + 1
+                        else:
+                            # No newline in range: back off to a UTF-8 character boundary
+                            while end > start + 1 and (mm[end] & 0xC0) == 0x80:
+                                end -= 1
+                    yield Document(
+                        page_content=mm[start:end].decode(self.encoding),
+                        metadata={"source": self.file_path}
+                    )
+                    start = end
+
+    def load(self) -> List[Any]:
+        return list(self.lazy_load())
+
+
+def load_document(file_path: str, file_loaders: Dict[str, Any], base_directory: str = None) -> Tuple[List[Any], List[str]]:
+    """
+    Load a single document using appropriate loader with comprehensive metadata.
+
+    Module-level (and free of manager state) so it can run in a worker process. Returns the
+    documents and any warnings; warnings are returned rather than logged so the parent process
+    can log them, since a worker's log records would not reach the log file.
+    """
+    file_ext = Path(file_path).suffix.lower()
+
+    if file_ext not in file_loaders:
+        raise ValueError(f"Unsupported file type: {file_ext}")
+
+    loader_class = file_loaders[file_ext]
+
+    try:
+        # Handle different loader requirements
+        if file_ext in ['.txt', '.py', '.js', '.ts', '.html', '.css', '.json', '.xml', '.yaml', '.yml']:
+            loader = loader_class(file_path, encoding='utf-8')
+        elif file_ext in ['.xlsx', '.xls']:
+            # For Excel files, try with mode parameter to handle encrypted files
+            try:
+                loader = loader_class(file_path, mode="elements")
+            except Exception:
+                # Fallback for older versions or different configurations
+                loader = loader_class(file_path)
+        elif file_ext == '.pptx':
+            # For PowerPoint files
+            try:
+                loader = loader_class(file_path, mode="elements")
+            except Exception:
+                loader = loader_class(file_path)
+        elif file_ext == '.docx':
+            # For Word documents
+            try:
+                loader = loader_class(file_path, mode="elements")
+            except Exception:
+                loader = loader_class(file_path)
+        elif file_ext == '.csv':
+            # For CSV files
+            try:
+                loader = loader_class(file_path, mode="elements")
+            except Exception:
+                loader = loader_class(file_path)
+        else:
+            loader = loader_class(file_path)
+
+        documents = loader.load()
+
+        # Create comprehensive metadata for this file
+        file_metadata = DocumentMetadata.from_file_path(file_path, base_directory=base_directory)
+
+        # Calculate total characters across all document chunks
+        total_characters = sum(len(doc.page_content) for doc in documents)
+        file_metadata.total_characters = total_characters
+        file_metadata.chunk_count = len(documents)
+        file_metadata.file_hash = compute_file_hash(file_path)
+
+        # Add comprehensive metadata to each document chunk
+        for i, doc in enumerate(documents):
+            # Convert metadata to dict for langchain compatibility
+            metadata_dict = file_metadata.to_dict()
+
+            # Add chunk-specific information (ensure all values are simple types)
+            chunk_metadata = {
+                'chunk_index': int(i),
+                'chunk_id': str(f"{file_metadata.file_hash}_{i}"),
+                'content_length': int(len(doc.page_content)),
+                'content_preview': str(doc.page_content[:200] + '...' if len(doc.page_content) > 200 else doc.page_content),
+
+                # Legacy field names for backward compatibility
+                'source_file': str(file_path),
+                'file_type': str(file_ext),
+                'file_size': int(file_metadata.file_size)
+            }
+
+            # Ensure all metadata values are simple types
+            safe_metadata_dict = {}
+            for key, value in metadata_dict.items():
+                if isinstance(value, (str, int, float, bool, type(None))):
+                    safe_metadata_dict[key] = value
+                else:
+                    # Convert complex types to strings
+                    safe_metadata_dict[key] = str(value)
+
+            # Add chunk-specific metadata
+            safe_metadata_dict.update(chunk_metadata)
+
+            # Update document metadata with safe values
+            doc.metadata.update(safe_metadata_dict)
+
+        return documents, []
+
+    except ImportError as e:
+        return [], [
+            f"Missing dependency for {file_path}: {e}",
+            "Please install required dependencies. See requirements.txt for details.",
+        ]
+    except Exception as e:
+        warnings = [f"Failed to load {file_path}: {e}"]
+        # For encrypted files, provide specific guidance
+        if "encrypted" in str(e).lower() or "password" in str(e).lower():
+            warnings.append(f"File appears to be password-protected: {file_path}")
+            warnings.append("Please remove password protection or provide an unencrypted version.")
+        return [], warnings
+
+
 class VectorDatabaseManager:
     """Manages vector database operations with optimizations and error handling"""
     
+    EMBEDDING_CACHE_FILE = "embedding_cache.sqlite"
+    
     def __init__(self, 
                  db_path: str = "vector_db",
                  chunk_size: int = 1000,
                  chunk_overlap: int = 200,
-                 embeddings_model: str = "text-embedding-3-small"):
+                 embeddings_model: str = "text-embedding-3-small",
+                 batch_size: int = 100,
+                 max_workers: int = 4,
+                 storage_dtype: str = "fp16"):
         
         if not LANGCHAIN_AVAILABLE:
             raise ImportError(
                 "LangChain dependencies not available. Please install: "
-                "pip install langchain langchain-community langchain-openai langchain-chroma"
+                "pip install langchain langchain-community langchain-openai faiss-cpu"
             )
         
         # Check for additional dependencies
@@ -159,9 +332,20 @@ class VectorDatabaseManager:
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
         self.embeddings_model = embeddings_model
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.storage_dtype = storage_dtype
         
         # Initialize components
         self.embeddings = OpenAIEmbeddings(model=embeddings_model)
+        os.makedirs(self.db_path, exist_ok=True)
+        self.embedding_cache = EmbeddingCache(os.path.join(self.db_path, self.EMBEDDING_CACHE_FILE))
+        self.batch_embedder = AsyncBatchEmbedder(
+            model=embeddings_model,
+            batch_size=batch_size,
+            max_workers=max_workers,
+            cache=self.embedding_cache
+        )
         self.text_splitter = RecursiveCharacterTextSplitter(
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
@@ -171,22 +355,22 @@ class VectorDatabaseManager:
         # Supported file types and their loaders
         self.file_loaders = {
             '.pdf': PyMuPDFLoader,
-            '.txt': TextLoader,
+            '.txt': MmapTextLoader,
             '.md': UnstructuredMarkdownLoader,
             '.csv': UnstructuredCSVLoader,
             '.xlsx': UnstructuredExcelLoader,
             '.xls': UnstructuredExcelLoader,
             '.pptx': UnstructuredPowerPointLoader,
             '.docx': UnstructuredWordDocumentLoader,
-            '.py': TextLoader,
-            '.js': TextLoader,
-            '.ts': TextLoader,
-            '.html': TextLoader,
-            '.css': TextLoader,
-            '.json': TextLoader,
-            '.xml': TextLoader,
-            '.yaml': TextLoader,
-            '.yml': TextLoader,
+            '.py': MmapTextLoader,
+            '.js': MmapTextLoader,
+            '.ts': MmapTextLoader,
+            '.html': MmapTextLoader,
+            '.css': MmapTextLoader,
+            '.json': MmapTextLoader,
+            '.xml': MmapTextLoader,
+            '.yaml': MmapTextLoader,
+            '.yml': MmapTextLoader,
         }
         
         # Metadata storage
@@ -335,7 +519,7 @@ class VectorDatabaseManager:
         return batches
     
     def _filter_document_metadata(self, documents):
-        """Filter complex metadata from documents to ensure ChromaDB compatibility"""
+        """Filter complex metadata from documents so it stays flat and serializable"""
         if not LANGCHAIN_AVAILABLE:
             return documents
         
@@ -356,7 +540,7 @@ class VectorDatabaseManager:
                 if hasattr(doc, 'metadata') and doc.metadata:
                     filtered_metadata = {}
                     for key, value in doc.metadata.items():
-                        # Keep only simple types that ChromaDB accepts
+                        # Keep only simple types
                         if isinstance(value, (str, int, float, bool, type(None))):
                             filtered_metadata[key] = value
                         elif isinstance(value, (list, dict, tuple, set)):
@@ -374,7 +558,7 @@ class VectorDatabaseManager:
             
             return documents
 
-    def _process_chunks_in_batches(self, document_chunks) -> Dict[str, Any]:
+    async def _process_chunks_in_batches(self, document_chunks) -> Dict[str, Any]:
         """Process document chunks in batches with intelligent splitting and error recovery"""
         if not document_chunks:
             return {'success': True, 'batches_processed': 0}
@@ -393,7 +577,7 @@ class VectorDatabaseManager:
         
         try:
             # Check if vectorstore exists
-            vectorstore_exists = os.path.exists(self.db_path) and any(os.listdir(self.db_path))
+            vectorstore_exists = FaissVectorStore.exists(self.db_path)
             
             # Initialize vectorstore for first batch
             if not vectorstore_exists:
@@ -401,7 +585,7 @@ class VectorDatabaseManager:
                 first_batch = document_chunks[:batch_size]
                 
                 # Try creating vectorstore with adaptive first batch
-                success = self._process_single_batch_with_splitting(first_batch, "initial")
+                success = await self._process_single_batch_with_splitting(first_batch, "initial")
                 if not success:
                     return {
                         'success': False,
@@ -415,10 +599,7 @@ class VectorDatabaseManager:
             else:
                 logger.info("Loading existing vector database...")
                 # Load existing vectorstore
-                self.vectorstore = Chroma(
-                    persist_directory=self.db_path,
-                    embedding_function=self.embeddings
-                )
+                self.vectorstore = FaissVectorStore(self.db_path, self.embeddings, storage_dtype=self.storage_dtype)
                 remaining_chunks = document_chunks
                 start_idx = 0
             
@@ -442,7 +623,7 @@ class VectorDatabaseManager:
                 logger.info(f"Progress: {chunks_processed + len(current_batch)}/{total_chunks} chunks ({((chunks_processed + len(current_batch)) / total_chunks * 100):.1f}%)")
                 
                 # Process batch with intelligent splitting
-                success = self._process_single_batch_with_splitting(current_batch, f"batch_{batch_number}")
+                success = await self._process_single_batch_with_splitting(current_batch, f"batch_{batch_number}")
                 
                 if success:
                     batches_processed += 1
@@ -476,8 +657,12 @@ class VectorDatabaseManager:
                 'error': str(e),
                 'batches_processed': batches_processed if 'batches_processed' in locals() else 0
             }
+        finally:
+            # Persist the index once per indexing run (including partial runs)
+            if self.vectorstore is not None:
+                self.vectorstore.save()
     
-    def _process_single_batch_with_splitting(self, batch_chunks, batch_name: str) -> bool:
+    async def _process_single_batch_with_splitting(self, batch_chunks, batch_name: str) -> bool:
         """Process a single batch with intelligent splitting if needed"""
         max_attempts = 5
         attempt = 1
@@ -486,14 +671,11 @@ class VectorDatabaseManager:
             try:
                 if not hasattr(self, 'vectorstore') or self.vectorstore is None:
                     # Create new vectorstore
-                    self.vectorstore = Chroma.from_documents(
-                        documents=batch_chunks,
-                        embedding=self.embeddings,
-                        persist_directory=self.db_path
-                    )
-                else:
-                    # Add to existing vectorstore
-                    self.vectorstore.add_documents(batch_chunks)
+                    self.vectorstore = FaissVectorStore(self.db_path, self.embeddings, storage_dtype=self.storage_dtype)
+                
+                # Embed the batch with concurrent fixed-size API requests
+                vectors = await self.batch_embedder.embed_documents([chunk.page_content for chunk in batch_chunks])
+                self.vectorstore.add_vectors(vectors, batch_chunks)
                 
                 logger.debug(f"Successfully processed {batch_name} with {len(batch_chunks)} chunks")
                 return True
@@ -528,7 +710,7 @@ class VectorDatabaseManager:
                     success_count = 0
                     for i, sub_batch in enumerate(sub_batches):
                         sub_batch_name = f"{batch_name}_split_{i+1}"
-                        if self._process_single_batch_with_splitting(sub_batch, sub_batch_name):
+                        if await self._process_single_batch_with_splitting(sub_batch, sub_batch_name):
                             success_count += 1
                         else:
                             logger.error(f"Failed to process {sub_batch_name}")
@@ -541,7 +723,7 @@ class VectorDatabaseManager:
                 if attempt < max_attempts:
                     wait_time = min(2 ** attempt, 10)  # Cap at 10 seconds
                     logger.info(f"Retrying {batch_name} in {wait_time} seconds...")
-                    time.sleep(wait_time)
+                    await asyncio.sleep(wait_time)
                 
                 attempt += 1
         
@@ -550,15 +732,7 @@ class VectorDatabaseManager:
     
     def _get_file_hash(self, file_path: str) -> str:
         """Generate MD5 hash of file for change detection"""
-        hash_md5 = hashlib.md5()
-        try:
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
-            return hash_md5.hexdigest()
-        except Exception as e:
-            logger.warning(f"Could not hash file {file_path}: {e}")
-            return ""
+        return compute_file_hash(file_path)
     
     def _load_metadata(self) -> Dict[str, DocumentMetadata]:
         """Load existing metadata from disk"""
@@ -613,102 +787,10 @@ class VectorDatabaseManager:
     
     def _load_single_document(self, file_path: str) -> List[Any]:
         """Load a single document using appropriate loader with comprehensive metadata"""
-        file_ext = Path(file_path).suffix.lower()
-        
-        if file_ext not in self.file_loaders:
-            raise ValueError(f"Unsupported file type: {file_ext}")
-        
-        loader_class = self.file_loaders[file_ext]
-        
-        try:
-            # Handle different loader requirements
-            if file_ext in ['.txt', '.py', '.js', '.ts', '.html', '.css', '.json', '.xml', '.yaml', '.yml']:
-                loader = loader_class(file_path, encoding='utf-8')
-            elif file_ext in ['.xlsx', '.xls']:
-                # For Excel files, try with mode parameter to handle encrypted files
-                try:
-                    loader = loader_class(file_path, mode="elements")
-                except Exception:
-                    # Fallback for older versions or different configurations
-                    loader = loader_class(file_path)
-            elif file_ext == '.pptx':
-                # For PowerPoint files
-                try:
-                    loader = loader_class(file_path, mode="elements")
-                except Exception:
-                    loader = loader_class(file_path)
-            elif file_ext == '.docx':
-                # For Word documents
-                try:
-                    loader = loader_class(file_path, mode="elements")
-                except Exception:
-                    loader = loader_class(file_path)
-            elif file_ext == '.csv':
-                # For CSV files
-                try:
-                    loader = loader_class(file_path, mode="elements")
-                except Exception:
-                    loader = loader_class(file_path)
-            else:
-                loader = loader_class(file_path)
-            
-            documents = loader.load()
-            
-            # Create comprehensive metadata for this file
-            file_metadata = DocumentMetadata.from_file_path(file_path, base_directory=getattr(self, '_current_index_directory', None))
-            
-            # Calculate total characters across all document chunks
-            total_characters = sum(len(doc.page_content) for doc in documents)
-            file_metadata.total_characters = total_characters
-            file_metadata.chunk_count = len(documents)
-            file_metadata.file_hash = self._get_file_hash(file_path)
-            
-            # Add comprehensive metadata to each document chunk
-            for i, doc in enumerate(documents):
-                # Convert metadata to dict for langchain compatibility
-                metadata_dict = file_metadata.to_dict()
-                
-                # Add chunk-specific information (ensure all values are simple types)
-                chunk_metadata = {
-                    'chunk_index': int(i),
-                    'chunk_id': str(f"{file_metadata.file_hash}_{i}"),
-                    'content_length': int(len(doc.page_content)),
-                    'content_preview': str(doc.page_content[:200] + '...' if len(doc.page_content) > 200 else doc.page_content),
-                    
-                    # Legacy field names for backward compatibility
-                    'source_file': str(file_path),
-                    'file_type': str(file_ext),
-                    'file_size': int(file_metadata.file_size)
-                }
-                
-                # Ensure all metadata values are simple types
-                safe_metadata_dict = {}
-                for key, value in metadata_dict.items():
-                    if isinstance(value, (str, int, float, bool, type(None))):
-                        safe_metadata_dict[key] = value
-                    else:
-                        # Convert complex types to strings
-                        safe_metadata_dict[key] = str(value)
-                
-                # Add chunk-specific metadata
-                safe_metadata_dict.update(chunk_metadata)
-                
-                # Update document metadata with safe values
-                doc.metadata.update(safe_metadata_dict)
-            
-            return documents
-            
-        except ImportError as e:
-            logger.warning(f"Missing dependency for {file_path}: {e}")
-            logger.warning(f"Please install required dependencies. See requirements.txt for details.")
-            return []
-        except Exception as e:
-            logger.warning(f"Failed to load {file_path}: {e}")
-            # For encrypted files, provide specific guidance
-            if "encrypted" in str(e).lower() or "password" in str(e).lower():
-                logger.warning(f"File appears to be password-protected: {file_path}")
-                logger.warning("Please remove password protection or provide an unencrypted version.")
-            return []
+        documents, warnings = load_document(file_path, self.file_loaders, getattr(self, '_current_index_directory', None))
+        for warning in warnings:
+            logger.warning(warning)
+        return documents
     
     async def index_directory(self, directory: str, progress_callback=None) -> Dict[str, Any]:
         """Index all supported documents in a directory"""
@@ -756,17 +838,22 @@ class VectorDatabaseManager:
         all_documents = []
         processed_count = 0
         
-        with ThreadPoolExecutor(max_workers=4) as executor:
+        # Parsers (PyMuPDF, unstructured) are CPU-bound, so load files in worker processes. Workers are
+        # spawned, not forked: a fork would copy the logger's listener thread and unflushed log buffer
+        num_workers = max(1, min(self.max_workers, os.cpu_count() or 1, len(files_to_process)))
+        with ProcessPoolExecutor(max_workers=num_workers, mp_context=multiprocessing.get_context("spawn")) as executor:
             # Submit all loading tasks
             future_to_file = {
-                executor.submit(self._load_single_document, file_path): file_path 
+                asyncio.wrap_future(executor.submit(load_document, file_path, self.file_loaders, directory)): file_path 
                 for file_path in files_to_process
             }
             
             for future in future_to_file:
                 file_path = future_to_file[future]
                 try:
-                    documents = future.result()
+                    documents, warnings = await future
+                    for warning in warnings:
+                        logger.warning(warning)
                     if documents:
                         all_documents.extend(documents)
                         
@@ -796,7 +883,7 @@ class VectorDatabaseManager:
         # Initialize or update vector store with intelligent batch processing
         try:
             # Process chunks in batches with intelligent splitting and error recovery
-            batch_results = self._process_chunks_in_batches(document_chunks)
+            batch_results = await self._process_chunks_in_batches(document_chunks)
             
             if not batch_results['success']:
                 # Provide detailed error information
@@ -931,62 +1018,89 @@ class VectorDatabaseManager:
         
         return formatted
 
-    def search_documents(self, query: str, k: int = 5) -> List[Dict[str, Any]]:
-        """Search indexed documents with comprehensive metadata"""
+    def clear_index(self):
+        """Delete the persisted index and metadata, keeping the embedding cache so a re-index reuses it"""
+        if self.vectorstore is not None:
+            self.vectorstore.connection.close()
+            self.vectorstore = None
+        for entry in os.scandir(self.db_path):
+            # The cache database plus its -wal/-shm files; its connection stays open
+            if entry.name.startswith(self.EMBEDDING_CACHE_FILE):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.remove(entry.path)
+
+    def _ensure_vectorstore(self):
+        """Open the persisted vectorstore read-only if it is not loaded yet"""
         if not self.vectorstore:
             # Try to load existing vectorstore
-            if os.path.exists(self.db_path):
+            if FaissVectorStore.exists(self.db_path):
                 try:
-                    self.vectorstore = Chroma(
-                        persist_directory=self.db_path,
-                        embedding_function=self.embeddings
-                    )
+                    self.vectorstore = FaissVectorStore(self.db_path, self.embeddings, read_only=True)
                 except Exception as e:
                     raise ValueError(f"Could not load vector database: {e}")
             else:
                 raise ValueError("No vector database found. Please index documents first.")
-        
-        try:
-            results = self.vectorstore.similarity_search_with_score(query, k=k)
+
+    def _format_search_results(self, results) -> List[Dict[str, Any]]:
+        """Turn (document, score) pairs into result dicts with comprehensive metadata"""
+        formatted_results = []
+        for i, (doc, score) in enumerate(results):
+            
+            # Format comprehensive metadata for display
+            formatted_metadata = self._format_metadata_for_display(doc.metadata)
             
-            formatted_results = []
-            for i, (doc, score) in enumerate(results):
+            # Create enhanced result
+            result = {
+                'rank': i + 1,
+                'similarity_score': score,
+                'content': doc.page_content,
+                'full_content': doc.page_content,  # For backward compatibility
+                'content_preview': doc.page_content[:300] + '...' if len(doc.page_content) > 300 else doc.page_content,
                 
-                # Format comprehensive metadata for display
-                formatted_metadata = self._format_metadata_for_display(doc.metadata)
+                # Formatted metadata sections
+                'file_info': formatted_metadata['file_info'],
+                'timestamps': formatted_metadata['timestamps'], 
+                'content_info': formatted_metadata['content_info'],
+                'system_info': formatted_metadata['system_info'],
                 
-                # Create enhanced result
-                result = {
-                    'rank': i + 1,
-                    'similarity_score': score,
-                    'content': doc.page_content,
-                    'full_content': doc.page_content,  # For backward compatibility
-                    'content_preview': doc.page_content[:300] + '...' if len(doc.page_content) > 300 else doc.page_content,
-                    
-                    # Formatted metadata sections
-                    'file_info': formatted_metadata['file_info'],
-                    'timestamps': formatted_metadata['timestamps'], 
-                    'content_info': formatted_metadata['content_info'],
-                    'system_info': formatted_metadata['system_info'],
-                    
-                    # Raw metadata for programmatic access
-                    'raw_metadata': doc.metadata,
-                    
-                    # Legacy fields for backward compatibility
-                    'source_file': doc.metadata.get('source_file', 'Unknown'),
-                    'file_type': doc.metadata.get('file_type', 'Unknown'),
-                    'file_size': doc.metadata.get('file_size', 0),
-                    'metadata': doc.metadata
-                }
+                # Raw metadata for programmatic access
+                'raw_metadata': doc.metadata,
                 
-                formatted_results.append(result)
-            
-            return formatted_results
+                # Legacy fields for backward compatibility
+                'source_file': doc.metadata.get('source_file', 'Unknown'),
+                'file_type': doc.metadata.get('file_type', 'Unknown'),
+                'file_size': doc.metadata.get('file_size', 0),
+                'metadata': doc.metadata
+            }
             
+            formatted_results.append(result)
+        
+        return formatted_results
+
+    def search_documents(self, query: str, k: int = 5) -> List[Dict[str, Any]]:
+        """Search indexed documents with comprehensive metadata"""
+        self._ensure_vectorstore()
+        
+        try:
+            return self._format_search_results(self.vectorstore.similarity_search_with_score(query, k=k))
         except Exception as e:
             logger.error(f"Error searching documents: {e}")
             return []
 
+    def search_documents_batch(self, queries: List[str], k: int = 5) -> List[List[Dict[str, Any]]]:
+        """Search several queries with one embeddings request and one index search"""
+        self._ensure_vectorstore()
+        
+        try:
+            batch_results = self.vectorstore.similarity_search_batch_with_score(queries, k=k)
+            return [self._format_search_results(results) for results in batch_results]
+        except Exception as e:
+            logger.error(f"Error searching documents: {e}")
+            return [[] for _ in queries]
+
 @TOOL.register_module(name="vector_indexer_tool", force=True)
 class VectorIndexerTool(AsyncTool):
     """Tool for indexing documents into a vector database"""
@@ -1016,6 +1130,9 @@ class VectorIndexerTool(AsyncTool):
                  chunk_size: int = 1000,
                  chunk_overlap: int = 200,
                  embeddings_model: str = "text-embedding-3-small",
+                 batch_size: int = 100,
+                 max_workers: int = 4,
+                 storage_dtype: str = "fp16",
                  **kwargs):
         super().__init__()
         # Ignore any extra kwargs like 'name' from configuration
@@ -1024,7 +1141,10 @@ class VectorIndexerTool(AsyncTool):
             db_path=db_path,
             chunk_size=chunk_size, 
             chunk_overlap=chunk_overlap,
-            embeddings_model=embeddings_model
+            embeddings_model=embeddings_model,
+            batch_size=batch_size,
+            max_workers=max_workers,
+            storage_dtype=storage_dtype
         )
     
     async def forward(self, directory_path: str, force_reindex: bool = False) -> ToolResult:
@@ -1045,8 +1165,7 @@ class VectorIndexerTool(AsyncTool):
             
             # Clear existing database if force reindex
             if force_reindex and os.path.exists(self.db_manager.db_path):
-                import shutil
-                shutil.rmtree(self.db_manager.db_path)
+                self.db_manager.clear_index()
                 logger.info("Cleared existing vector database for re-indexing")
             
             # Progress callback for logging
@@ -1105,97 +1224,113 @@ class VectorSearchTool(AsyncTool):
     async def forward(self, query: str, max_results: int = 5) -> ToolResult:
         """Search for documents matching the query with comprehensive metadata"""
         try:
-            results = self.db_manager.search_documents(query, k=max_results)
-            
-            if not results:
-                return ToolResult(
-                    output={
-                        'query': query,
-                        'results': [],
-                        'results_count': 0,
-                        'message': 'No relevant documents found in the indexed collection'
-                    },
-                    error=None
-                )
-            
-            # Format results with comprehensive metadata
-            formatted_output = {
-                'query': query,
-                'results_count': len(results),
-                'search_summary': {
-                    'total_matches': len(results),
-                    'top_similarity': round(results[0]['similarity_score'], 4) if results else 0,
-                    'files_found': len(set(r['file_info']['name'] for r in results)),
-                    'file_types': list(set(r['file_info']['type'] for r in results))
-                },
-                'results': []
-            }
-            
-            for result in results:
-                # Create beautifully formatted result
-                formatted_result = {
-                    'rank': result['rank'],
-                    'similarity_score': round(result['similarity_score'], 4),
-                    'relevance_level': self._get_relevance_level(result['similarity_score']),
-                    
-                    # Content information
-                    'content': {
-                        'preview': result['content_preview'],
-                        'full_content': result['full_content'],
-                        'length': result['content_info']['chunk_length'],
-                        'chunk_info': f"Chunk {result['content_info']['chunk_index'] + 1} of {result['content_info']['total_file_chunks']}"
-                    },
-                    
-                    # File information with beautiful formatting
-                    'file': {
-                        'name': result['file_info']['name'],
-                        'path': result['file_info']['path'],
-                        'directory': result['file_info']['directory'],
-                        'type': result['file_info']['type'],
-                        'mime_type': result['file_info']['mime_type'],
-                        'size': result['file_info']['size'],
-                        'size_bytes': result['file_info']['size_bytes']
-                    },
-                    
-                    # Timestamp information
-                    'timestamps': {
-                        'created': result['timestamps']['created'],
-                        'modified': result['timestamps']['modified'],
-                        'indexed': result['timestamps']['indexed'],
-                        'last_accessed': result['timestamps']['accessed']
-                    },
-                    
-                    # System metadata
-                    'system': {
-                        'permissions': result['system_info']['permissions'],
-                        'is_hidden': result['system_info']['is_hidden'],
-                        'is_symlink': result['system_info']['is_symlink'],
-                        'file_hash': result['system_info']['file_hash'][:16] + '...'  # Shortened for display
-                    },
-                    
-                    # Legacy fields for backward compatibility
-                    'source_file': result['source_file'],
-                    'file_type': result['file_type'],
-                    'file_size': result['file_size'],
-                    'metadata': result['raw_metadata']
-                }
-                
-                formatted_output['results'].append(formatted_result)
-            
-            return ToolResult(output=formatted_output, error=None)
-            
+            return self._format_results(query, self.db_manager.search_documents(query, k=max_results))
         except Exception as e:
-            error_msg = f"Error searching documents: {str(e)}"
-            logger.error(error_msg)
+            return self._error_result(query, e)
+    
+    async def forward_batch(self, queries: List[str], max_results: List[int]) -> List[ToolResult]:
+        """Search several queries with one embeddings request and one index search"""
+        try:
+            batch_results = self.db_manager.search_documents_batch(queries, k=max(max_results, default=0))
+            # Results are ranked, so each query keeps the top of the shared-k result list
+            return [
+                self._format_results(query, results[:k])
+                for query, k, results in zip(queries, max_results, batch_results)
+            ]
+        except Exception as e:
+            return [self._error_result(query, e) for query in queries]
+    
+    def _error_result(self, query: str, error: Exception) -> ToolResult:
+        error_msg = f"Error searching documents: {str(error)}"
+        logger.error(error_msg)
+        return ToolResult(
+            output={
+                'query': query,
+                'results': [],
+                'results_count': 0,
+                'error_details': error_msg
+            }, 
+            error=error_msg
+        )
+    
+    def _format_results(self, query: str, results: List[Dict[str, Any]]) -> ToolResult:
+        """Format search results with comprehensive metadata"""
+        if not results:
             return ToolResult(
                 output={
                     'query': query,
                     'results': [],
                     'results_count': 0,
-                    'error_details': error_msg
-                }, 
-                error=error_msg
+                    'message': 'No relevant documents found in the indexed collection'
+                },
+                error=None
             )
+        
+        # Format results with comprehensive metadata
+        formatted_output = {
+            'query': query,
+            'results_count': len(results),
+            'search_summary': {
+                'total_matches': len(results),
+                'top_similarity': round(results[0]['similarity_score'], 4) if results else 0,
+                'files_found': len(set(r['file_info']['name'] for r in results)),
+                'file_types': list(set(r['file_info']['type'] for r in results))
+            },
+            'results': []
+        }
+        
+        for result in results:
+            # Create beautifully formatted result
+            formatted_result = {
+                'rank': result['rank'],
+                'similarity_score': round(result['similarity_score'], 4),
+                'relevance_level': self._get_relevance_level(result['similarity_score']),
+                
+                # Content information
+                'content': {
+                    'preview': result['content_preview'],
+                    'full_content': result['full_content'],
+                    'length': result['content_info']['chunk_length'],
+                    'chunk_info': f"Chunk {result['content_info']['chunk_index'] + 1} of {result['content_info']['total_file_chunks']}"
+                },
+                
+                # File information with beautiful formatting
+                'file': {
+                    'name': result['file_info']['name'],
+                    'path': result['file_info']['path'],
+                    'directory': result['file_info']['directory'],
+                    'type': result['file_info']['type'],
+                    'mime_type': result['file_info']['mime_type'],
+                    'size': result['file_info']['size'],
+                    'size_bytes': result['file_info']['size_bytes']
+                },
+                
+                # Timestamp information
+                'timestamps': {
+                    'created': result['timestamps']['created'],
+                    'modified': result['timestamps']['modified'],
+                    'indexed': result['timestamps']['indexed'],
+                    'last_accessed': result['timestamps']['accessed']
+                },
+                
+                # System metadata
+                'system': {
+                    'permissions': result['system_info']['permissions'],
+                    'is_hidden': result['system_info']['is_hidden'],
+                    'is_symlink': result['system_info']['is_symlink'],
+                    'file_hash': result['system_info']['file_hash'][:16] + '...'  # Shortened for display
+                },
+                
+                # Legacy fields for backward compatibility
+                'source_file': result['source_file'],
+                'file_type': result['file_type'],
+                'file_size': result['file_size'],
+                'metadata': result['raw_metadata']
+            }
+            
+            formatted_output['results'].append(formatted_result)
+        
+        return ToolResult(output=formatted_output, error=None)
     
     def _get_relevance_level(self, similarity_score: float) -> str:
         """Convert similarity score to human-readable relevance level"""
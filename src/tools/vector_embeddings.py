@@ -0,0 +1,126 @@
+import asyncio
+import hashlib
+import sqlite3
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from src.logger import logger
+
+
+class EmbeddingCache:
+    """
+    SQLite cache of embeddings keyed by a hash of the embedding model and the chunk text.
+
+    Unchanged chunks are served from the cache on re-index, so only new or edited text is
+    sent to the embeddings API.
+    """
+
+    FETCH_BATCH_SIZE = 900
+
+    def __init__(self, cache_path: str):
+        self.cache_path = cache_path
+        # Autocommit + WAL so concurrent indexers can read while one writes
+        self.connection = sqlite3.connect(cache_path, isolation_level=None, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("CREATE TABLE IF NOT EXISTS cache (hash TEXT PRIMARY KEY, vec BLOB NOT NULL)")
+
+    @staticmethod
+    def key(model: str, text: str) -> str:
+        return hashlib.blake2b(f"{model}\0{text}".encode("utf-8"), digest_size=16).hexdigest()
+
+    def get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        """Return cached vectors for the keys that are present"""
+        found = {}
+        unique_keys = list(dict.fromkeys(keys))
+        for start in range(0, len(unique_keys), self.FETCH_BATCH_SIZE):
+            batch_keys = unique_keys[start:start + self.FETCH_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch_keys))
+            rows = self.connection.execute(
+                f"SELECT hash, vec FROM cache WHERE hash IN ({placeholders})", batch_keys
+            ).fetchall()
+            for key, blob in rows:
+                found[key] = np.frombuffer(blob, dtype=np.float32)
+        return found
+
+    def put_many(self, keys: List[str], vectors: np.ndarray) -> None:
+        """Store vectors for the given keys, keeping any existing entries"""
+        rows = [(key, np.ascontiguousarray(vector, dtype=np.float32).tobytes()) for key, vector in zip(keys, vectors)]
+        # The connection is in autocommit mode, so open the transaction explicitly: one commit per batch
+        self.connection.execute("BEGIN")
+        try:
+            self.connection.executemany("INSERT OR IGNORE INTO cache (hash, vec) VALUES (?, ?)", rows)
+        except BaseException:
+            self.connection.execute("ROLLBACK")
+            raise
+        self.connection.execute("COMMIT")
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+class AsyncBatchEmbedder:
+    """
+    Embeds texts through the OpenAI embeddings API in fixed-size batches.
+
+    Each request carries up to `batch_size` inputs and at most `max_workers` requests are in
+    flight at once, so the per-request round trip is amortized across the whole batch.
+    When a `cache` is given, texts embedded before are read from it instead of the API.
+    """
+
+    def __init__(self,
+                 model: str = "text-embedding-3-small",
+                 batch_size: int = 100,
+                 max_workers: int = 4,
+                 client=None,
+                 cache: Optional[EmbeddingCache] = None):
+        self.model = model
+        self.batch_size = max(1, batch_size)
+        self.max_workers = max(1, max_workers)
+        self._client = client
+        self.cache = cache
+
+    @property
+    def client(self):
+        if self._client is None:
+            from openai import AsyncOpenAI
+            self._client = AsyncOpenAI()
+        return self._client
+
+    async def embed_batch(self, texts: List[str], semaphore: Optional[asyncio.Semaphore] = None) -> np.ndarray:
+        """Embed a single batch of texts with one API request"""
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_workers)
+        async with semaphore:
+            response = await self.client.embeddings.create(model=self.model, input=texts)
+        # The API may return items out of order; sort by their input index
+        ordered = sorted(response.data, key=lambda item: item.index)
+        return np.asarray([item.embedding for item in ordered], dtype=np.float32)
+
+    async def embed_documents(self, texts: List[str]) -> np.ndarray:
+        """Embed texts in batches of `batch_size` with up to `max_workers` concurrent requests"""
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        if self.cache is None:
+            return await self._embed_uncached(texts)
+
+        keys = [EmbeddingCache.key(self.model, text) for text in texts]
+        cached = self.cache.get_many(keys)
+        missing = {key: text for key, text in zip(keys, texts) if key not in cached}
+        logger.debug(f"Embedding cache: {len(texts) - len(missing)}/{len(texts)} hits")
+
+        if missing:
+            missing_keys = list(missing)
+            vectors = await self._embed_uncached(list(missing.values()))
+            self.cache.put_many(missing_keys, vectors)
+            cached.update(zip(missing_keys, vectors))
+
+        return np.vstack([cached[key] for key in keys]).astype(np.float32, copy=False)
+
+    async def _embed_uncached(self, texts: List[str]) -> np.ndarray:
+        semaphore = asyncio.Semaphore(self.max_workers)
+        batches = [texts[start:start + self.batch_size] for start in range(0, len(texts), self.batch_size)]
+        logger.debug(f"Embedding {len(texts)} texts in {len(batches)} requests ({self.max_workers} concurrent)")
+
+        vectors = await asyncio.gather(*(self.embed_batch(batch, semaphore) for batch in batches))
+        return np.vstack(vectors)
@@ -1,7 +1,9 @@
 from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, ConfigDict, Field, model_validator
-from tenacity import retry, stop_after_attempt, wait_exponential
-import time
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_random_exponential
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+import random
 import asyncio
 
 from src.tools.web_fetcher import WebFetcherTool
@@ -19,6 +21,32 @@ _WEB_SEARCHER_DESCRIPTION = """Search the web for real-time information about an
 This tool returns comprehensive search results with relevant information, URLs, titles, and descriptions.
 If the primary search engine fails, it automatically falls back to alternative engines."""
 
+RETRY_ON_STATUS = (429, 500, 502, 503, 504)
+RETRY_BASE_DELAY = 0.5
+
+
+def _response_status(exception: BaseException) -> Optional[int]:
+    """HTTP status carried by an httpx/requests error, if any"""
+    response = getattr(exception, "response", None)
+    return getattr(response, "status_code", None)
+
+
+def _retry_after_seconds(exception: BaseException) -> Optional[float]:
+    """Parse a `Retry-After` header (delta-seconds or HTTP date) from the failed response"""
+    response = getattr(exception, "response", None)
+    headers = getattr(response, "headers", None)
+    value = headers.get("Retry-After") if headers is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
 class SearchResult(BaseModel):
     """Represents a single search result returned by a search engine."""
 
@@ -126,6 +154,7 @@ class WebSearcherTool(AsyncTool):
                  max_length: int = 4096,
                  retry_delay: int = 10,
                  max_retries: int = 3,
+                 retry_on_status=RETRY_ON_STATUS,
                  lang: str = "en",
                  country: str = "us",
                  num_results: int = 5,
@@ -142,6 +171,8 @@ class WebSearcherTool(AsyncTool):
         self.max_length = max_length
         self.retry_delay = retry_delay
         self.max_retries = max_retries
+        self.retry_on_status = frozenset(retry_on_status)
+        self._backoff = wait_random_exponential(multiplier=RETRY_BASE_DELAY, max=retry_delay)
         self.lang = lang
         self.country = country
         self.num_results = num_results
@@ -176,6 +207,7 @@ class WebSearcherTool(AsyncTool):
             search_params["filter_year"] = filter_year
 
         # Try searching with retries when all engines fail
+        delay = RETRY_BASE_DELAY
         for retry_count in range(self.max_retries + 1):
             results = await self._try_all_engines(query, self.num_results, search_params)
             if results:
@@ -195,10 +227,11 @@ class WebSearcherTool(AsyncTool):
                 )
 
             if retry_count < self.max_retries:
-                # All engines failed, wait and retry
-                res = f"All search engines failed. Waiting {self.retry_delay} seconds before retry {retry_count + 1}/{self.max_retries}..."
+                # All engines failed, wait (decorrelated jitter capped at retry_delay) and retry
+                delay = min(self.retry_delay, random.uniform(RETRY_BASE_DELAY, delay * 3))
+                res = f"All search engines failed. Waiting {delay:.1f} seconds before retry {retry_count + 1}/{self.max_retries}..."
                 logger.warning(res)
-                time.sleep(self.retry_delay)
+                await asyncio.sleep(delay)
             else:
                 res = f"All search engines failed after {self.max_retries} retries. Giving up."
                 logger.error(res)
@@ -219,9 +252,14 @@ class WebSearcherTool(AsyncTool):
         for engine_name in engine_order:
             engine = self._search_engine[engine_name]
             logger.info(f"🔎 Attempting search with {engine_name.capitalize()}...")
-            search_items = await self._perform_search_with_engine(
-                engine, query, num_results, search_params
-            )
+            try:
+                search_items = await self._perform_search_with_engine(
+                    engine, query, num_results, search_params
+                )
+            except Exception as e:
+                logger.warning(f"{engine_name.capitalize()} search failed: {e}")
+                failed_engines.append(engine_name)
+                continue
 
             if not search_items:
                 continue
@@ -302,9 +340,19 @@ class WebSearcherTool(AsyncTool):
 
         return engine_order
 
-    @retry(
-        stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=1, max=10)
-    )
+    def _is_retryable(self, exception: BaseException) -> bool:
+        """Retry transient failures; HTTP errors only when their status is in `retry_on_status`"""
+        status = _response_status(exception)
+        return status is None or status in self.retry_on_status
+
+    def _retry_wait(self, retry_state) -> float:
+        """Honor `Retry-After` (capped at `retry_delay`) when the server sent one, otherwise back off with full jitter"""
+        retry_after = _retry_after_seconds(retry_state.outcome.exception())
+        if retry_after is not None:
+            # A long Retry-After would stall the whole step; past the cap, falling back to the next engine is better
+            return min(retry_after, self.retry_delay)
+        return self._backoff(retry_state)
+
     async def _perform_search_with_engine(
         self,
         engine: WebSearchEngine,
@@ -314,13 +362,20 @@ class WebSearcherTool(AsyncTool):
     ) -> List[SearchItem]:
         """Execute search with the given engine and parameters."""
 
-        results = [result
-            for result in await engine.perform_search(
-                query,
-                num_results=num_results,
-                lang=search_params.get("lang"),
-                country=search_params.get("country"),
-                filter_year=search_params.get("filter_year"),
-            )
-        ]
+        async for attempt in AsyncRetrying(
+            stop=stop_after_attempt(max(1, self.max_retries)),
+            wait=self._retry_wait,
+            retry=retry_if_exception(self._is_retryable),
+            reraise=True,
+        ):
+            with attempt:
+                results = [result
+                    for result in await engine.perform_search(
+                        query,
+                        num_results=num_results,
+                        lang=search_params.get("lang"),
+                        country=search_params.get("country"),
+                        filter_year=search_params.get("filter_year"),
+                    )
+                ]
         return results
@@ -5,16 +5,27 @@ This package contains UI components for user interaction, including
 research source selection and configuration interfaces.
 """
 
-from .source_selector import (
-    get_user_research_sources,
-    select_research_sources, 
-    show_current_configuration,
-    show_detailed_help
-)
-
-__all__ = [
-    "get_user_research_sources",
-    "select_research_sources",
-    "show_current_configuration", 
-    "show_detailed_help"
-] 
\ No newline at end of file
+import importlib
+
+# Imported on first access (PEP 562) so that `src.ui._ansi` can be used without loading the
+# source selector and, through it, the research source manager and logger.
+_LAZY_IMPORTS = {
+    "get_user_research_sources": ".source_selector",
+    "select_research_sources": ".source_selector",
+    "show_current_configuration": ".source_selector",
+    "show_detailed_help": ".source_selector",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
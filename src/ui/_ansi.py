@@ -0,0 +1,29 @@
+"""
+ANSI color codes shared by the terminal UI.
+
+Color is only emitted when stdout is a terminal and NO_COLOR is unset; when output is piped or
+captured the codes are empty strings, so logs and redirected output stay free of escape bytes.
+"""
+
+import os
+import sys
+
+COLOR_ENABLED = sys.stdout.isatty() and "NO_COLOR" not in os.environ
+
+
+def _code(sequence: str) -> str:
+    return sequence if COLOR_ENABLED else ""
+
+
+class Colors:
+    """ANSI color codes for beautiful terminal output"""
+    HEADER = _code('\033[95m')
+    BLUE = _code('\033[94m')
+    CYAN = _code('\033[96m')
+    GREEN = _code('\033[92m')
+    YELLOW = _code('\033[93m')
+    RED = _code('\033[91m')
+    MAGENTA = _code('\033[95m')
+    ENDC = _code('\033[0m')
+    BOLD = _code('\033[1m')
+    UNDERLINE = _code('\033[4m')
@@ -9,20 +9,7 @@ import os
 import sys
 from typing import List, Dict, Set
 from src.research_source_manager import get_research_source_manager, SourceConfig
-
-
-class Colors:
-    """ANSI color codes for beautiful terminal output"""
-    HEADER = '\033[95m'
-    BLUE = '\033[94m'
-    CYAN = '\033[96m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    MAGENTA = '\033[95m'
-    ENDC = '\033[0m'
-    BOLD = '\033[1m'
-    UNDERLINE = '\033[4m'
+from src.ui._ansi import Colors
 
 
 def print_section_header(title: str, subtitle: str = ""):
@@ -0,0 +1,54 @@
+"""Shared async HTTP client so repeated fetches reuse pooled (keep-alive) connections."""
+
+import asyncio
+import importlib.util
+from typing import Optional
+
+import httpx
+
+HTTP_TIMEOUT = 30
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the process-wide AsyncClient, creating it on first use.
+
+    Pooled connections are bound to the event loop that opened them, so a new client
+    is created if called from a different loop; the old one is closed on its own loop.
+    HTTP/2 is enabled when `h2` is installed.
+    """
+    global _client, _client_loop
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        if _client is not None and not _client.is_closed:
+            _discard_client(_client, _client_loop)
+        _client = httpx.AsyncClient(
+            http2=importlib.util.find_spec("h2") is not None,
+            timeout=HTTP_TIMEOUT,
+            limits=HTTP_LIMITS,
+            follow_redirects=True,
+        )
+        _client_loop = loop
+    return _client
+
+
+def _discard_client(client: httpx.AsyncClient, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+    """Close a client that belongs to another event loop, if that loop can still run it"""
+    if loop is not None and not loop.is_closed() and loop.is_running():
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+    # Otherwise its loop is gone and the connections died with it; dropping the client is all that's left
+
+
+async def close_http_client() -> None:
+    """Close the shared client and release its pooled connections"""
+    global _client, _client_loop
+
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
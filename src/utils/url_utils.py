@@ -5,17 +5,24 @@ load_dotenv(verbose=True)
 
 from markitdown._base_converter import DocumentConverterResult
 from crawl4ai import AsyncWebCrawler
-from firecrawl import FirecrawlApp
+
+from src.utils.http_client import get_http_client
+
+FIRECRAWL_API_URL = os.getenv("FIRECRAWL_API_URL", "https://api.firecrawl.dev").rstrip("/")
 
 async def firecrawl_fetch_url(url: str):
     try:
-        app = FirecrawlApp(api_key=os.getenv("FIRECRAWL_API_KEY", None))
-
-        response = app.scrape_url(
-            url,
+        # Call the REST API on the shared pooled client instead of the blocking SDK,
+        # so concurrent fetches overlap and reuse connections
+        client = get_http_client()
+        response = await client.post(
+            f"{FIRECRAWL_API_URL}/v1/scrape",
+            headers={"Authorization": f"Bearer {os.getenv('FIRECRAWL_API_KEY', '')}"},
+            json={"url": url, "formats": ["markdown"]},
         )
+        response.raise_for_status()
 
-        result = response.markdown
+        result = response.json().get("data", {}).get("markdown")
 
         return result
     except Exception as e: